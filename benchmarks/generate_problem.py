@@ -0,0 +1,112 @@
+'''
+Generator of synthetic ROR problem files.
+Preference and intensity relations are derived from a hidden weighted sum
+of criteria values, so relations are consistent with each other.
+
+Usage:
+    python -m benchmarks.generate_problem output.txt --alternatives 100 --criteria 5
+'''
+import argparse
+from typing import List
+import numpy as np
+
+DEFAULT_AGGREGATOR = 'DefaultResultAggregator'
+DEFAULT_TIE_RESOLVER = 'NoResolver'
+
+
+def generate_problem(
+    filename: str,
+    number_of_alternatives: int,
+    number_of_criteria: int,
+    number_of_preferences: int = 0,
+    number_of_intensity_relations: int = 0,
+    number_of_alpha_values: int = 3,
+    results_aggregator: str = DEFAULT_AGGREGATOR,
+    tie_resolver: str = DEFAULT_TIE_RESOLVER,
+    seed: int = 0
+) -> str:
+    '''
+    Writes problem in the ROR text format to filename and returns filename.
+    '''
+    assert number_of_alternatives >= 4, 'Problem must have at least 4 alternatives'
+    assert number_of_criteria >= 1, 'Problem must have at least 1 criterion'
+    assert number_of_preferences <= number_of_alternatives * (number_of_alternatives - 1) // 2,\
+        'Number of preferences is greater than the number of pairs of alternatives'
+    generator = np.random.default_rng(seed)
+    matrix = np.round(generator.uniform(0.0, 100.0, size=(number_of_alternatives, number_of_criteria)), 2)
+    # every third criterion is a cost type criterion
+    cost_criteria = np.arange(number_of_criteria) % 3 == 2
+    weights = generator.uniform(0.5, 1.5, size=number_of_criteria)
+    utilities = np.where(cost_criteria, -matrix, matrix) @ weights
+    alternatives = [f'a{index+1:0{len(str(number_of_alternatives))}d}' for index in range(number_of_alternatives)]
+
+    lines: List[str] = ['#Data']
+    criteria = [f'c{index+1}[{"c" if is_cost else "g"}]' for index, is_cost in enumerate(cost_criteria)]
+    lines.append(', '.join(['id', *criteria]))
+    for alternative, row in zip(alternatives, matrix):
+        lines.append(', '.join([alternative, *[str(value) for value in row]]))
+
+    lines.append('#Preferences')
+    pairs = set()
+    while len(pairs) < number_of_preferences:
+        first, second = generator.choice(number_of_alternatives, size=2, replace=False)
+        if utilities[first] < utilities[second]:
+            first, second = second, first
+        pairs.add((first, second))
+    for first, second in sorted(pairs):
+        lines.append(f'{alternatives[first]}, {alternatives[second]}, preference')
+    quadruples = set()
+    while len(quadruples) < number_of_intensity_relations:
+        indices = generator.choice(number_of_alternatives, size=4, replace=False)
+        # first and second pair are ordered by utility, first pair has greater difference
+        pair_1 = sorted(indices[:2], key=lambda index: -utilities[index])
+        pair_2 = sorted(indices[2:], key=lambda index: -utilities[index])
+        if utilities[pair_1[0]] - utilities[pair_1[1]] < utilities[pair_2[0]] - utilities[pair_2[1]]:
+            pair_1, pair_2 = pair_2, pair_1
+        quadruples.add((*pair_1, *pair_2))
+    for quadruple in sorted(quadruples):
+        lines.append(f'{", ".join(alternatives[index] for index in quadruple)}, preference')
+
+    alpha_values = [round(float(value), 4) for value in np.linspace(start=0.0, stop=1.0, num=number_of_alpha_values)]
+    lines.extend([
+        '#Parameters',
+        'eps=1e-6',
+        'initial_alpha=0.0',
+        f'alpha_values={alpha_values}',
+        'precision=4',
+        f'results_aggregator={results_aggregator}',
+        f'alpha_values_number={number_of_alpha_values}',
+        f'tie_resolver={tie_resolver}'
+    ])
+    with open(filename, 'w') as file:
+        file.write('\n'.join(lines))
+    return filename
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generates synthetic ROR problem file')
+    parser.add_argument('filename')
+    parser.add_argument('--alternatives', type=int, default=100)
+    parser.add_argument('--criteria', type=int, default=5)
+    parser.add_argument('--preferences', type=int, default=5)
+    parser.add_argument('--intensity-relations', type=int, default=2)
+    parser.add_argument('--alpha-values', type=int, default=3)
+    parser.add_argument('--aggregator', default=DEFAULT_AGGREGATOR)
+    parser.add_argument('--tie-resolver', default=DEFAULT_TIE_RESOLVER)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    generate_problem(
+        args.filename,
+        args.alternatives,
+        args.criteria,
+        args.preferences,
+        args.intensity_relations,
+        args.alpha_values,
+        args.aggregator,
+        args.tie_resolver,
+        args.seed
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,183 @@
+'''
+Measures time of loading (parsing and from the binary cache), solving (with each aggregator), displaying and exporting
+synthetic problems of increasing size. Writes JSON report with all measurements.
+
+Usage:
+    python -m benchmarks.run_benchmarks --sizes 10 50 100 --output bench_output.json
+'''
+import argparse
+import json
+import os
+import platform
+import tempfile
+import time
+from typing import Any, Callable, Dict, List
+from ror.loader_utils import RORParameter
+from ror.ror_solver import AVAILABLE_AGGREGATORS
+
+from benchmarks.generate_problem import generate_problem
+from utils.file_handler import open_file
+from utils.parameter_sweep import SweepConfiguration, get_sweep_parameters
+from utils.solver_helpers import solve_problem
+
+DEFAULT_SIZES = [10, 25, 50, 100, 200]
+DEFAULT_REPEATS = 3
+
+
+def measure(function: Callable[[], Any], repeats: int) -> Dict[str, Any]:
+    '''
+    Calls function repeats times and returns the best and mean time in seconds,
+    together with the value returned by the last call.
+    '''
+    times: List[float] = []
+    value = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        value = function()
+        times.append(time.perf_counter() - start)
+    return {
+        'best': min(times),
+        'mean': sum(times) / len(times),
+        'value': value
+    }
+
+
+def create_table() -> Any:
+    '''
+    Returns Table widget used to measure displaying data
+    or None if there is no display available.
+    '''
+    import tkinter as tk
+    from utils.Table import Table
+    try:
+        root = tk.Tk()
+    except tk.TclError:
+        return None
+    root.withdraw()
+    return Table(root)
+
+
+class BenchmarkReport:
+    def __init__(self) -> None:
+        self.measurements: List[Dict[str, Any]] = []
+
+    def add(self, step: str, problem: Dict[str, Any], measurement: Dict[str, Any] = None, **kwargs):
+        entry = {'step': step, **problem, **kwargs}
+        if measurement is None:
+            entry['status'] = 'skipped'
+        else:
+            entry['status'] = 'ok'
+            entry['best'] = measurement['best']
+            entry['mean'] = measurement['mean']
+        self.measurements.append(entry)
+        if measurement is not None:
+            print(f'{step:<12} {problem["alternatives"]:>8} alternatives {kwargs.get("aggregator", ""):<28} {measurement["best"]:.4f}s')
+
+    def save(self, filename: str, arguments: Dict[str, Any]):
+        with open(filename, 'w') as file:
+            json.dump({
+                'python': platform.python_version(),
+                'machine': platform.machine(),
+                'cpu_count': os.cpu_count(),
+                'arguments': arguments,
+                'measurements': self.measurements
+            }, file, indent=2)
+
+
+def run_benchmarks(
+    sizes: List[int],
+    number_of_criteria: int,
+    number_of_preferences: int,
+    number_of_intensity_relations: int,
+    number_of_alpha_values: int,
+    aggregators: List[str],
+    repeats: int,
+    directory: str
+) -> BenchmarkReport:
+    report = BenchmarkReport()
+    table = create_table()
+    for number_of_alternatives in sizes:
+        problem = {
+            'alternatives': number_of_alternatives,
+            'criteria': number_of_criteria,
+            'preferences': min(number_of_preferences, number_of_alternatives),
+            'intensity_relations': number_of_intensity_relations,
+            'alpha_values': number_of_alpha_values
+        }
+        filename = generate_problem(
+            os.path.join(directory, f'problem_{number_of_alternatives}.txt'),
+            number_of_alternatives,
+            number_of_criteria,
+            problem['preferences'],
+            number_of_intensity_relations,
+            number_of_alpha_values
+        )
+        loading = measure(lambda: open_file(filename, use_cache=False), repeats)
+        report.add('open_file', problem, loading)
+        # first call creates the binary copy of the file
+        open_file(filename)
+        report.add('open_cached', problem, measure(lambda: open_file(filename), repeats))
+        dataset = loading['value'].dataset
+        parameters = loading['value'].parameters
+        precision = parameters.get_parameter(RORParameter.PRECISION)
+
+        if table is not None:
+            report.add('set_data', problem, measure(lambda: table.set_data(dataset, precision), repeats))
+        else:
+            report.add('set_data', problem)
+
+        for aggregator in aggregators:
+            configuration = SweepConfiguration(
+                parameters.get_parameter(RORParameter.EPS),
+                number_of_alpha_values,
+                aggregator,
+                'NoResolver'
+            )
+            aggregator_parameters = get_sweep_parameters(parameters, configuration)
+            solving = measure(
+                lambda: solve_problem(dataset, aggregator_parameters, lambda *_: None, lambda _: None, aggregator),
+                repeats
+            )
+            result = solving['value']
+            if result is None:
+                report.add('solve', problem, aggregator=aggregator, error='Solver did not return a result')
+                continue
+            report.add('solve', problem, solving, aggregator=aggregator)
+            export_filename = os.path.join(directory, f'result_{number_of_alternatives}_{aggregator}.csv')
+            report.add(
+                'export',
+                problem,
+                measure(lambda: result.save_result_to_csv(export_filename), repeats),
+                aggregator=aggregator
+            )
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Runs benchmarks on synthetic ROR problems')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help='numbers of alternatives')
+    parser.add_argument('--criteria', type=int, default=5)
+    parser.add_argument('--preferences', type=int, default=5)
+    parser.add_argument('--intensity-relations', type=int, default=2)
+    parser.add_argument('--alpha-values', type=int, default=3)
+    parser.add_argument('--aggregators', nargs='+', default=list(AVAILABLE_AGGREGATORS.keys()))
+    parser.add_argument('--repeats', type=int, default=DEFAULT_REPEATS)
+    parser.add_argument('--output', default='bench_output.json', help='file with JSON report')
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as directory:
+        report = run_benchmarks(
+            args.sizes,
+            args.criteria,
+            args.preferences,
+            args.intensity_relations,
+            args.alpha_values,
+            args.aggregators,
+            args.repeats,
+            directory
+        )
+    report.save(args.output, vars(args))
+    print(f'Saved report to {args.output}')
+
+
+if __name__ == '__main__':
+    main()
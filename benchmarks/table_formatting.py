@@ -0,0 +1,51 @@
+'''
+Compares formatting of table cells one by one (as Table.set_data did before)
+with formatting whole rows by utils.Table.format_rows.
+
+Usage:
+    python -m benchmarks.table_formatting --rows 1000 10000 50000 --criteria 20
+'''
+import argparse
+from typing import List
+import numpy as np
+from ror.number_utils import format_number
+
+from benchmarks.run_benchmarks import measure
+from utils.Table import format_rows
+
+DEFAULT_ROWS = [1000, 10000, 50000]
+DEFAULT_CRITERIA = 20
+DEFAULT_PRECISION = 2
+
+
+def format_cells(alternatives: List[str], matrix: np.ndarray, cost_criteria: np.ndarray, precision: int) -> List[List[str]]:
+    rows = []
+    for alternative, row in zip(alternatives, matrix):
+        new_row = [alternative]
+        for is_cost, value in zip(cost_criteria, row):
+            new_row.append(format_number(-value if is_cost else value, precision))
+        rows.append(new_row)
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmarks formatting of table cells')
+    parser.add_argument('--rows', type=int, nargs='+', default=DEFAULT_ROWS)
+    parser.add_argument('--criteria', type=int, default=DEFAULT_CRITERIA)
+    parser.add_argument('--precision', type=int, default=DEFAULT_PRECISION)
+    parser.add_argument('--repeats', type=int, default=3)
+    args = parser.parse_args()
+    generator = np.random.default_rng(0)
+    cost_criteria = np.arange(args.criteria) % 3 == 2
+    signs = np.where(cost_criteria, -1.0, 1.0)
+    print(f'{"rows":>8} {"cells [s]":>12} {"rows [s]":>12} {"speedup":>8}')
+    for number_of_rows in args.rows:
+        matrix = generator.uniform(-100.0, 100.0, size=(number_of_rows, args.criteria))
+        alternatives = [f'a{index}' for index in range(number_of_rows)]
+        cells = measure(lambda: format_cells(alternatives, matrix, cost_criteria, args.precision), args.repeats)
+        rows = measure(lambda: format_rows(alternatives, matrix, args.precision, signs), args.repeats)
+        print(f'{number_of_rows:>8} {cells["best"]:>12.4f} {rows["best"]:>12.4f} {cells["best"] / rows["best"]:>7.1f}x')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+
+@pytest.fixture
+def create_dataset():
+    '''
+    Returns function that creates a dataset with 4 alternatives, a gain and a cost criterion
+    and the given preference relations (first alternative, second alternative, relation name).
+    '''
+    pytest.importorskip('ror')
+    import ror.Relation as relation
+    from ror.Dataset import RORDataset
+    from ror.PreferenceRelations import PreferenceRelation
+
+    def create(matrix: np.ndarray = None, preferences=()) -> RORDataset:
+        matrix = np.array([[1.0, -2.0], [3.0, -4.0], [5.0, -6.0], [7.0, -8.0]]) if matrix is None else matrix
+        dataset = RORDataset(['a1', 'a2', 'a3', 'a4'], matrix, [('c1', 'g'), ('c2', 'c')])
+        for first, second, name in preferences:
+            dataset.add_preference_relation(PreferenceRelation(first, second, relation.PREFERENCE_NAME_TO_RELATION[name]))
+        return dataset
+    return create
+
+
+@pytest.fixture
+def create_parameters():
+    '''
+    Returns function that creates parameters with the given eps and alpha values.
+    '''
+    pytest.importorskip('ror')
+    from ror.RORParameters import RORParameters
+    from ror.loader_utils import RORParameter
+
+    def create(eps: float = 1e-6, alpha_values=(0.0, 0.5, 1.0)) -> RORParameters:
+        parameters = RORParameters()
+        parameters.add_parameter(RORParameter.EPS, eps)
+        parameters.add_parameter(RORParameter.ALPHA_VALUES, list(alpha_values))
+        return parameters
+    return create
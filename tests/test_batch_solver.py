@@ -0,0 +1,33 @@
+import os
+import pytest
+
+pytest.importorskip('ror')
+
+from utils.batch_solver import find_problem_files, get_result_names
+
+
+def test_result_names_of_files_in_one_directory(tmp_path):
+    files = [str(tmp_path / 'a.txt'), str(tmp_path / 'b.txt')]
+    assert get_result_names(files) == {files[0]: 'a', files[1]: 'b'}
+
+
+def test_result_names_of_files_with_the_same_name(tmp_path):
+    files = [str(tmp_path / 'first' / 'problem.txt'), str(tmp_path / 'second' / 'problem.txt')]
+    assert get_result_names(files) == {files[0]: 'first_problem', files[1]: 'second_problem'}
+
+
+def test_result_names_are_unique_after_replacing_separators(tmp_path):
+    files = [
+        str(tmp_path / 'a' / 'b_c.txt'),
+        str(tmp_path / 'a_b' / 'c.txt'),
+        str(tmp_path / 'a_b' / 'C.txt')
+    ]
+    names = get_result_names(files)
+    assert len(set(name.lower() for name in names.values())) == len(files)
+
+
+def test_find_problem_files(tmp_path):
+    for name in ['a.txt', 'b.txt', 'c.csv']:
+        (tmp_path / name).write_text('')
+    expected = [os.path.abspath(tmp_path / 'a.txt'), os.path.abspath(tmp_path / 'b.txt')]
+    assert find_problem_files([str(tmp_path), str(tmp_path / 'a.txt')]) == expected
@@ -0,0 +1,30 @@
+import numpy as np
+import pytest
+
+pytest.importorskip('ror')
+
+from utils.cache_helpers import get_result_key, hash_dataset
+
+
+def test_result_key_is_the_same_for_equal_data(create_dataset, create_parameters):
+    assert get_result_key(create_dataset(), create_parameters()) == get_result_key(create_dataset(), create_parameters())
+
+
+def test_result_key_depends_on_matrix(create_dataset, create_parameters):
+    matrix = np.array([[1.0, -2.0], [3.0, -4.0], [5.0, -6.0], [7.0, -8.5]])
+    assert get_result_key(create_dataset(), create_parameters()) != get_result_key(create_dataset(matrix), create_parameters())
+
+
+def test_result_key_depends_on_relations(create_dataset, create_parameters):
+    dataset = create_dataset(preferences=[('a1', 'a2', 'preference')])
+    other_dataset = create_dataset(preferences=[('a2', 'a1', 'preference')])
+    assert get_result_key(dataset, create_parameters()) != get_result_key(other_dataset, create_parameters())
+
+
+def test_result_key_depends_on_parameters(create_dataset, create_parameters):
+    assert get_result_key(create_dataset(), create_parameters()) != get_result_key(create_dataset(), create_parameters(1e-5))
+
+
+def test_dataset_hash_doesnt_depend_on_matrix_layout(create_dataset):
+    matrix = np.asfortranarray(create_dataset().matrix)
+    assert hash_dataset(create_dataset(matrix)) == hash_dataset(create_dataset())
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+from utils.DatasetSnapshots import DatasetSnapshots, copy_snapshot
+
+
+@pytest.fixture
+def preference_relation():
+    pytest.importorskip('ror')
+    import ror.Relation as relation
+    from ror.PreferenceRelations import PreferenceRelation
+
+    return PreferenceRelation('a3', 'a4', relation.PREFERENCE_NAME_TO_RELATION['weak'])
+
+
+def test_snapshot_is_reused_until_dataset_changes(create_dataset):
+    snapshots = DatasetSnapshots()
+    dataset = create_dataset()
+    snapshot = snapshots.get_dataset(dataset)
+    assert snapshots.get_dataset(dataset) is snapshot
+    dataset.matrix = np.zeros((4, 2))
+    assert snapshots.get_dataset(dataset) is not snapshot
+
+
+def test_copy_shares_read_only_matrix(create_dataset):
+    snapshot = DatasetSnapshots().get_dataset(create_dataset())
+    solve_copy = copy_snapshot(snapshot)
+    assert solve_copy.matrix is snapshot.matrix
+    with pytest.raises(ValueError):
+        solve_copy.matrix[0, 0] = 10.0
+
+
+def test_changes_of_copy_dont_change_snapshot(create_dataset, preference_relation):
+    snapshot = DatasetSnapshots().get_dataset(create_dataset(preferences=[('a1', 'a2', 'preference')]))
+    solve_copy = copy_snapshot(snapshot)
+    other_copy = copy_snapshot(snapshot)
+    solve_copy.add_preference_relation(preference_relation)
+    solve_copy.criteria = [('c1', 'g')]
+    assert len(solve_copy.preferenceRelations) == 2
+    for dataset in [snapshot, other_copy]:
+        assert len(dataset.preferenceRelations) == 1
+        assert list(dataset.criteria) == [('c1', 'g'), ('c2', 'c')]
+    assert isinstance(snapshot.preferenceRelations, tuple)
@@ -0,0 +1,144 @@
+import os
+from types import SimpleNamespace
+import numpy as np
+import pytest
+
+pytest.importorskip('ror')
+
+import utils.ProblemFileCache as problem_file_cache
+from utils.ProblemFileCache import ProblemFileCache
+
+
+def create_loader_result(matrix: np.ndarray):
+    # cache pickles any loader result, only the matrix of its dataset is saved separately
+    return SimpleNamespace(dataset=SimpleNamespace(matrix=matrix), parameters={'eps': 1e-6})
+
+
+@pytest.fixture
+def cache_directory(tmp_path) -> str:
+    directory = tmp_path / 'cache'
+    directory.mkdir()
+    return str(directory)
+
+
+@pytest.fixture
+def problem_file(tmp_path) -> str:
+    filename = tmp_path / 'problem.txt'
+    filename.write_text('first version')
+    return str(filename)
+
+
+@pytest.fixture
+def hashed_files(monkeypatch):
+    hashed = []
+    hash_file = problem_file_cache.hash_file
+
+    def counting_hash_file(filename: str) -> str:
+        hashed.append(filename)
+        return hash_file(filename)
+
+    monkeypatch.setattr(problem_file_cache, 'hash_file', counting_hash_file)
+    return hashed
+
+
+def touch(filename: str):
+    stat = os.stat(filename)
+    os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+
+def test_get_returns_cached_result(cache_directory, problem_file):
+    cache = ProblemFileCache(cache_directory)
+    cache.put(problem_file, create_loader_result(np.arange(6.0).reshape(3, 2)))
+    loader_result = cache.get(problem_file)
+    np.testing.assert_array_equal(loader_result.dataset.matrix, np.arange(6.0).reshape(3, 2))
+    assert loader_result.parameters == {'eps': 1e-6}
+
+
+def test_get_maps_matrix(cache_directory, problem_file):
+    cache = ProblemFileCache(cache_directory)
+    cache.put(problem_file, create_loader_result(np.ones((2, 2))))
+    assert isinstance(cache.get(problem_file, memory_map=True).dataset.matrix, np.memmap)
+
+
+def test_changed_file_is_not_returned(cache_directory, problem_file):
+    cache = ProblemFileCache(cache_directory)
+    cache.put(problem_file, create_loader_result(np.ones((2, 2))))
+    # the same size, only contents differ
+    with open(problem_file, 'w') as file:
+        file.write('other version')
+    touch(problem_file)
+    assert cache.get(problem_file) is None
+    with open(problem_file, 'w') as file:
+        file.write('longer version')
+    assert cache.get(problem_file) is None
+
+
+def test_touched_file_is_hashed_only_once(cache_directory, problem_file, hashed_files):
+    cache = ProblemFileCache(cache_directory)
+    cache.put(problem_file, create_loader_result(np.ones((2, 2))))
+    assert len(hashed_files) == 1
+    touch(problem_file)
+    assert cache.get(problem_file) is not None
+    assert len(hashed_files) == 2
+    # stored modification time was updated, a new cache doesn't hash the file again
+    assert ProblemFileCache(cache_directory).get(problem_file) is not None
+    assert len(hashed_files) == 2
+
+
+def test_file_is_hashed_once_when_it_is_opened(cache_directory, problem_file, hashed_files):
+    cache = ProblemFileCache(cache_directory)
+    assert cache.get(problem_file) is None
+    cache.get_matrix_filename(problem_file)
+    cache.put(problem_file, create_loader_result(np.ones((2, 2))))
+    assert len(hashed_files) == 1
+
+
+def test_old_matrices_are_removed_on_the_next_start(cache_directory, problem_file):
+    directory = cache_directory
+    cache = ProblemFileCache(directory)
+    cache.put(problem_file, create_loader_result(np.ones((2, 2))))
+    mapped_result = cache.get(problem_file, memory_map=True)
+    with open(problem_file, 'w') as file:
+        file.write('second version, longer')
+    cache.put(problem_file, create_loader_result(np.zeros((2, 2))))
+    # matrix of the first version can still be mapped by an open dataset
+    assert len([filename for filename in os.listdir(directory) if filename.endswith('.npy')]) == 2
+    np.testing.assert_array_equal(mapped_result.dataset.matrix, np.ones((2, 2)))
+    del mapped_result
+    ProblemFileCache(directory, stale_file_age=0)
+    assert len([filename for filename in os.listdir(directory) if filename.endswith('.npy')]) == 1
+    np.testing.assert_array_equal(ProblemFileCache(directory).get(problem_file).dataset.matrix, np.zeros((2, 2)))
+
+
+def test_old_temporary_files_are_removed_on_start(cache_directory):
+    filename = os.path.join(cache_directory, 'matrix.npy.tmp')
+    with open(filename, 'wb') as file:
+        file.write(b'partial matrix')
+    # can be written by another instance of the application
+    ProblemFileCache(cache_directory, stale_file_age=60)
+    assert os.listdir(cache_directory) == ['matrix.npy.tmp']
+    os.utime(filename, (os.path.getatime(filename), os.path.getmtime(filename) - 120))
+    ProblemFileCache(cache_directory, stale_file_age=60)
+    assert os.listdir(cache_directory) == []
+
+
+def test_least_recently_used_files_are_evicted(cache_directory, tmp_path):
+    problem_files = []
+    for index in range(3):
+        filename = tmp_path / f'problem_{index}.txt'
+        filename.write_text(f'problem {index}')
+        problem_files.append(str(filename))
+    # a single sidecar takes about 1 KB
+    cache = ProblemFileCache(cache_directory, max_disk_size=2500)
+    cache.put(problem_files[0], create_loader_result(np.ones((8, 8))))
+    cache.put(problem_files[1], create_loader_result(np.ones((8, 8))))
+    # the first file was used recently, so the second one is evicted
+    for filename in os.listdir(cache_directory):
+        path = os.path.join(cache_directory, filename)
+        os.utime(path, (os.path.getatime(path), os.path.getmtime(path) - 60))
+    assert cache.get(problem_files[0]) is not None
+    cache.put(problem_files[2], create_loader_result(np.ones((8, 8))))
+    assert cache.get(problem_files[0]) is not None
+    assert cache.get(problem_files[1]) is None
+    assert cache.get(problem_files[2]) is not None
+    assert sum(os.path.getsize(os.path.join(cache_directory, filename)) for filename in os.listdir(cache_directory)) <= 2500
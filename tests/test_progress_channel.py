@@ -0,0 +1,65 @@
+from collections import namedtuple
+
+from utils.ProgressChannel import ProgressChannel
+
+Progress = namedtuple('Progress', ['progress', 'status'])
+
+
+class Window:
+    '''
+    Runs callbacks scheduled with after only when run_frame is called.
+    '''
+
+    def __init__(self) -> None:
+        self.callbacks = []
+
+    def after(self, _interval, callback):
+        self.callbacks.append(callback)
+
+    def run_frame(self):
+        callbacks, self.callbacks = self.callbacks, []
+        for callback in callbacks:
+            callback()
+
+
+def create_channel():
+    window = Window()
+    handled = []
+    channel = ProgressChannel(window, lambda data, eta: handled.append((data, eta))).start()
+    return window, channel, handled
+
+
+def test_only_the_latest_progress_is_handled_in_a_frame():
+    window, channel, handled = create_channel()
+    for value in range(10):
+        channel.report(Progress(value / 10, f'step {value}'))
+    window.run_frame()
+    assert [data.status for data, _ in handled] == ['step 9']
+
+
+def test_errors_are_never_skipped():
+    window, channel, handled = create_channel()
+    channel.report(Progress(-1, 'first error'))
+    channel.report(Progress(0.5, 'progress'))
+    channel.report(Progress(-1, 'second error'))
+    window.run_frame()
+    assert [data.status for data, _ in handled] == ['progress', 'first error', 'second error']
+
+
+def test_nothing_is_handled_without_new_progress():
+    window, channel, handled = create_channel()
+    channel.report(Progress(0.5, 'progress'))
+    window.run_frame()
+    window.run_frame()
+    assert len(handled) == 1
+
+
+def test_flush_handles_pending_progress_and_stops_the_channel():
+    window, channel, handled = create_channel()
+    channel.report(Progress(1.0, 'done'))
+    channel.flush()
+    assert handled == [(Progress(1.0, 'done'), None)]
+    channel.report(Progress(1.0, 'after flush'))
+    window.run_frame()
+    assert len(handled) == 1
+    assert window.callbacks == []
@@ -0,0 +1,39 @@
+import os
+from types import SimpleNamespace
+import pytest
+
+from utils.rank_helpers import get_rank_groups, get_rank_positions
+
+EXAMPLE_PROBLEM = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'example_problems', 'buses_small.txt')
+
+
+def test_rank_positions_with_ties():
+    rank = SimpleNamespace(rank=['b', ['a', 'c'], 'd'])
+    assert get_rank_positions(rank) == {'b': 1, 'a': 2, 'c': 2, 'd': 3}
+
+
+def test_rank_groups_use_names_of_alternatives_from_rank_items():
+    rank = SimpleNamespace(rank=[
+        [SimpleNamespace(alternative='b', value=0.5)],
+        [SimpleNamespace(alternative='a', value=0.2), SimpleNamespace(alternative='c', value=0.2)]
+    ])
+    assert get_rank_groups(rank) == [['b'], ['a', 'c']]
+
+
+def test_rank_positions_of_solver_rank():
+    pytest.importorskip('ror')
+    from ror.data_loader import read_dataset_from_txt
+    from ror.ror_solver import solve_model
+
+    loader_result = read_dataset_from_txt(EXAMPLE_PROBLEM)
+    result = solve_model(
+        loader_result.dataset,
+        loader_result.parameters,
+        result_aggregator_name='DefaultResultAggregator'
+    )
+    for rank in [result.final_rank] + list(result.intermediate_ranks):
+        positions = get_rank_positions(rank)
+        assert set(positions) == set(loader_result.dataset.alternatives)
+        assert all(isinstance(alternative, str) for alternative in positions)
+        # positions are consecutive, starting from 1
+        assert sorted(set(positions.values())) == list(range(1, max(positions.values()) + 1))
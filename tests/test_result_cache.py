@@ -0,0 +1,18 @@
+from types import SimpleNamespace
+
+from utils.ResultCache import ResultCache
+
+
+def create_result(image_filename: str):
+    # cache pickles any result, ranks point to images created by the solver
+    rank = SimpleNamespace(rank=['a1', 'a2'], image_filename=image_filename)
+    return SimpleNamespace(intermediate_ranks=[rank], final_rank=rank)
+
+
+def test_result_without_rank_images_is_returned(tmp_path):
+    cache = ResultCache(directory=str(tmp_path))
+    cache.put('key', create_result(str(tmp_path / 'removed_rank.png')))
+    # ranks are drawn from their data, images are not needed
+    assert ResultCache(directory=str(tmp_path)).get('key').final_rank.rank == ['a1', 'a2']
+    assert cache.get('key') is not None
+
@@ -0,0 +1,83 @@
+import os
+import pytest
+
+pytest.importorskip('ror')
+pytest.importorskip('pandas')
+
+from ror.data_loader import read_dataset_from_txt
+from ror.loader_utils import RORParameter
+from ror.ror_solver import solve_model
+
+from utils.rank_helpers import get_rank_positions
+from utils.solver_helpers import _set_result_attribute, _solve_for_alpha_value, merge_alpha_value_results
+
+EXAMPLE_PROBLEM = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'example_problems', 'buses_small.txt')
+ALPHA_VALUES = [0.0, 0.5, 1.0]
+
+
+@pytest.fixture
+def problem():
+    loader_result = read_dataset_from_txt(EXAMPLE_PROBLEM)
+    loader_result.parameters.add_parameter(RORParameter.ALPHA_VALUES, ALPHA_VALUES)
+    loader_result.parameters.add_parameter(RORParameter.NUMBER_OF_ALPHA_VALUES, len(ALPHA_VALUES))
+    loader_result.parameters.add_parameter(RORParameter.ALPHA_WEIGHTS, [1.0] * len(ALPHA_VALUES))
+    return loader_result
+
+
+@pytest.fixture
+def partial_results(problem):
+    return [
+        _solve_for_alpha_value(problem.dataset, problem.parameters, alpha_value)[0]
+        for alpha_value in ALPHA_VALUES
+    ]
+
+
+def test_merge_keeps_ranks_in_order_of_alpha_values(problem, partial_results):
+    merged = merge_alpha_value_results(partial_results, problem.parameters)
+    expected_ranks = [rank for partial_result in partial_results for rank in partial_result.intermediate_ranks]
+    assert [get_rank_positions(rank) for rank in merged.intermediate_ranks] == [get_rank_positions(rank) for rank in expected_ranks]
+
+
+def test_merge_joins_values_of_all_alpha_values(problem, partial_results):
+    merged_table = merge_alpha_value_results(partial_results, problem.parameters).get_result_table()
+    for partial_result in partial_results:
+        partial_table = partial_result.get_result_table()
+        for column in partial_table.columns:
+            assert list(merged_table[column]) == list(partial_table[column])
+
+
+def test_merged_table_has_columns_of_the_whole_problem(problem, partial_results):
+    # solving the whole problem in one go fills the table for all alpha values
+    expected = solve_model(problem.dataset, problem.parameters, result_aggregator_name='DefaultResultAggregator')
+    merged_table = merge_alpha_value_results(partial_results, problem.parameters).get_result_table()
+    assert set(expected.get_result_table().columns) <= set(merged_table.columns)
+
+
+def test_merge_uses_parameters_of_the_whole_problem(problem, partial_results):
+    merged = merge_alpha_value_results(partial_results, problem.parameters)
+    assert merged.parameters.get_parameter(RORParameter.ALPHA_VALUES) == ALPHA_VALUES
+    # later changes of the parameters don't change the result
+    assert merged.parameters is not problem.parameters
+    # model was built for the first alpha value only
+    assert merged.model is None
+
+
+def test_merge_doesnt_change_partial_results(problem, partial_results):
+    first = partial_results[0]
+    columns = list(first.get_result_table().columns)
+    merge_alpha_value_results(partial_results, problem.parameters)
+    assert len(first.intermediate_ranks) == 1
+    assert list(first.get_result_table().columns) == columns
+    assert first.parameters.get_parameter(RORParameter.ALPHA_VALUES) == [ALPHA_VALUES[0]]
+    assert first.model is not None
+
+
+def test_set_result_attribute_doesnt_create_attributes(partial_results):
+    result = partial_results[0]
+    attributes = set(vars(result))
+    _set_result_attribute(result, 'model', None)
+    assert result.model is None
+    assert set(vars(result)) == attributes
+    with pytest.raises(AttributeError):
+        _set_result_attribute(result, 'missing_attribute', None)
+
@@ -0,0 +1,16 @@
+from utils.startup_profiler import parse_import_times
+
+IMPORT_TIME_OUTPUT = '''import time: self [us] | cumulative | imported package
+import time:       100 |        100 |     _tkinter
+import time:       200 |        300 |   tkinter
+import time:        50 |         50 |     ror.Relation
+import time:       100 |        150 |   ror
+import time:        10 |        460 | utils.RORWindow
+import time:        40 |         40 |   numpy.core
+import time:        60 |        100 | numpy
+'''
+
+
+def test_imports_made_by_modules_of_the_program_are_counted():
+    # GUI packages are imported by utils.RORWindow, not by the script itself
+    assert parse_import_times(IMPORT_TIME_OUTPUT) == [('tkinter', 0.0003), ('ror', 0.00015), ('numpy', 0.0001)]
@@ -0,0 +1,154 @@
+import os
+import weakref
+import numpy as np
+import pytest
+
+from benchmarks.generate_problem import generate_problem
+from utils.CancellationToken import CancellationToken, SolveCancelledException
+from utils.streaming_loader import _parse_parameter_value, count_data_rows
+
+EXAMPLE_PROBLEMS_DIRECTORY = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'example_problems')
+
+
+@pytest.fixture
+def ror():
+    return pytest.importorskip('ror')
+
+
+@pytest.fixture(params=['buses_small.txt', 'buses.txt', 'generated'])
+def problem_file(request, tmp_path) -> str:
+    if request.param == 'generated':
+        # more alternatives than REPORT_INTERVAL_ROWS, both types of criteria and relations
+        return generate_problem(
+            str(tmp_path / 'generated.txt'),
+            number_of_alternatives=2500,
+            number_of_criteria=6,
+            number_of_preferences=10,
+            number_of_intensity_relations=5,
+            results_aggregator='WeightedResultAggregator',
+            tie_resolver='CopelandTieResolver'
+        )
+    return os.path.join(EXAMPLE_PROBLEMS_DIRECTORY, request.param)
+
+
+def test_count_data_rows(tmp_path):
+    filename = generate_problem(str(tmp_path / 'problem.txt'), number_of_alternatives=1234, number_of_criteria=2)
+    assert count_data_rows(filename) == 1234
+
+
+def test_count_data_rows_of_example_problem():
+    assert count_data_rows(os.path.join(EXAMPLE_PROBLEMS_DIRECTORY, 'buses_small.txt')) == 8
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('1e-6', 1e-6),
+    ('0.5', 0.5),
+    ('4', 4),
+    ('[0.0, 0.5, 1.0]', [0.0, 0.5, 1.0]),
+    ('CopelandTieResolver', 'CopelandTieResolver'),
+])
+def test_parse_parameter_value(value, expected):
+    assert _parse_parameter_value(value) == expected
+
+
+@pytest.mark.parametrize('use_matrix_file', [False, True])
+def test_read_problem_file_is_the_same_as_ror_loader(ror, problem_file, use_matrix_file, tmp_path):
+    from ror.data_loader import read_dataset_from_txt
+    from ror.loader_utils import RORParameter
+    from utils.cache_helpers import get_intensity_relations, get_preference_relations
+    from utils.streaming_loader import read_problem_file
+
+    expected = read_dataset_from_txt(problem_file)
+    result = read_problem_file(
+        problem_file,
+        matrix_filename=str(tmp_path / 'matrix.npy') if use_matrix_file else None
+    )
+
+    assert list(result.dataset.alternatives) == list(expected.dataset.alternatives)
+    assert list(result.dataset.criteria) == list(expected.dataset.criteria)
+    # values of cost criteria are negated by both loaders
+    np.testing.assert_array_equal(np.asarray(result.dataset.matrix), np.asarray(expected.dataset.matrix, dtype=np.float64))
+    assert get_preference_relations(result.dataset) == get_preference_relations(expected.dataset)
+    assert get_intensity_relations(result.dataset) == get_intensity_relations(expected.dataset)
+    for parameter in RORParameter:
+        assert result.parameters.get_parameter(parameter) == expected.parameters.get_parameter(parameter), parameter
+
+
+def test_cancelled_read_removes_temporary_matrix(ror, tmp_path):
+    from utils.streaming_loader import read_problem_file
+
+    filename = generate_problem(str(tmp_path / 'problem.txt'), number_of_alternatives=2500, number_of_criteria=3)
+    matrix_filename = str(tmp_path / 'matrix.npy')
+    cancellation_token = CancellationToken()
+    cancellation_token.cancel()
+    with pytest.raises(SolveCancelledException):
+        read_problem_file(filename, cancellation_token=cancellation_token, matrix_filename=matrix_filename)
+    assert not os.path.exists(f'{matrix_filename}.tmp')
+    assert not os.path.exists(matrix_filename)
+
+
+def test_read_problem_file_with_invalid_criterion_type(ror, tmp_path):
+    from utils.streaming_loader import read_problem_file
+
+    filename = tmp_path / 'problem.txt'
+    filename.write_text('#Data\nid, c1[x]\na1, 1\n')
+    with pytest.raises(ValueError):
+        read_problem_file(str(filename))
+
+
+@pytest.fixture
+def writable_mappings(monkeypatch):
+    '''
+    Checks that no writable mapping of a temporary matrix is open
+    when the temporary file is renamed or removed, it fails on Windows.
+    '''
+    mappings = []
+    open_memmap = np.lib.format.open_memmap
+    replace = os.replace
+    remove = os.remove
+
+    def tracking_open_memmap(filename, mode='r+', *args, **kwargs):
+        matrix = open_memmap(filename, mode, *args, **kwargs)
+        if mode == 'w+':
+            mappings.append(weakref.ref(matrix))
+        return matrix
+
+    def assert_mappings_closed(filename):
+        if str(filename).endswith('.tmp'):
+            assert all(mapping() is None for mapping in mappings), f'{filename} is still mapped'
+
+    def checking_replace(source, destination):
+        assert_mappings_closed(source)
+        replace(source, destination)
+
+    def checking_remove(filename):
+        assert_mappings_closed(filename)
+        remove(filename)
+
+    monkeypatch.setattr(np.lib.format, 'open_memmap', tracking_open_memmap)
+    monkeypatch.setattr(os, 'replace', checking_replace)
+    monkeypatch.setattr(os, 'remove', checking_remove)
+    return mappings
+
+
+def test_matrix_file_is_not_mapped_for_writing_after_read(ror, tmp_path, writable_mappings):
+    from utils.streaming_loader import read_problem_file
+
+    filename = generate_problem(str(tmp_path / 'problem.txt'), number_of_alternatives=100, number_of_criteria=3)
+    result = read_problem_file(filename, matrix_filename=str(tmp_path / 'matrix.npy'))
+    assert len(writable_mappings) == 1
+    assert writable_mappings[0]() is None
+    assert isinstance(result.dataset.matrix, np.memmap)
+    assert result.dataset.matrix.mode == 'c'
+
+
+def test_matrix_file_is_not_mapped_for_writing_after_failed_read(ror, tmp_path, writable_mappings):
+    from utils.streaming_loader import read_problem_file
+
+    filename = tmp_path / 'problem.txt'
+    filename.write_text('#Data\nid, c1[g]\na1, 1\na2, x\n')
+    with pytest.raises(ValueError):
+        read_problem_file(str(filename), matrix_filename=str(tmp_path / 'matrix.npy'))
+    assert len(writable_mappings) == 1
+    assert writable_mappings[0]() is None
+    assert not os.path.exists(str(tmp_path / 'matrix.npy.tmp'))
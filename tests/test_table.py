@@ -0,0 +1,28 @@
+import numpy as np
+import pytest
+
+pytest.importorskip('ror')
+
+from utils.Table import FORMATTING_CHUNK_SIZE, format_rows
+
+
+def test_format_rows():
+    rows = format_rows(['a1', 'a2'], np.array([[1.0, 2.345], [-3.5, 4.0]]), 2)
+    assert rows == [['a1', '1.00', '2.35'], ['a2', '-3.50', '4.00']]
+
+
+def test_format_rows_with_signs():
+    # values of cost criteria are stored negated
+    rows = format_rows(['a1'], np.array([[1.0, -2.0]]), 1, np.array([1.0, -1.0]))
+    assert rows == [['a1', '1.0', '2.0']]
+
+
+def test_format_rows_is_the_same_as_formatting_each_value():
+    values = np.random.default_rng(0).uniform(-100, 100, size=(FORMATTING_CHUNK_SIZE + 5, 3))
+    labels = [f'a{index}' for index in range(len(values))]
+    expected = [[label, *[f'{value:.3f}' for value in row]] for label, row in zip(labels, values)]
+    assert format_rows(labels, values, 3) == expected
+
+
+def test_format_rows_without_values():
+    assert format_rows(['a1', 'a2'], np.empty((2, 0)), 2) == [['a1'], ['a2']]
@@ -0,0 +1,91 @@
+import os
+import PIL.Image
+import pytest
+
+from utils.ThumbnailCache import MAX_PYRAMID_LEVEL_BUDGET_FRACTION, MAX_PYRAMID_ZOOM, ThumbnailCache, get_image_size, get_pyramid_widths
+
+
+def create_image(tmp_path, name: str, size) -> str:
+    filename = str(tmp_path / name)
+    PIL.Image.new('RGB', size, 'white').save(filename)
+    return filename
+
+
+@pytest.mark.parametrize('width, min_width, max_width, expected', [
+    (1000, 250, None, [1000, 500, 250]),
+    (1100, 250, None, [1100, 550, 275, 250]),
+    (4000, 250, 1000, [1000, 500, 250]),
+    (200, 250, None, [250]),
+])
+def test_pyramid_widths(width, min_width, max_width, expected):
+    assert get_pyramid_widths(width, min_width, max_width) == expected
+
+
+def test_load_rescales_to_width(tmp_path):
+    filename = create_image(tmp_path, 'image.png', (500, 1000))
+    thumbnail = ThumbnailCache().load(filename, 250)
+    assert thumbnail.size == (250, 500)
+
+
+def test_loaded_thumbnail_is_cached(tmp_path):
+    filename = create_image(tmp_path, 'image.png', (500, 1000))
+    cache = ThumbnailCache()
+    thumbnail = cache.load(filename, 250)
+    assert cache.get(filename, 250) is thumbnail
+    assert cache.get(filename, 100) is None
+
+
+def test_changed_file_is_not_taken_from_cache(tmp_path):
+    filename = create_image(tmp_path, 'image.png', (500, 1000))
+    cache = ThumbnailCache()
+    cache.load(filename, 250)
+    stat = os.stat(filename)
+    os.utime(filename, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+    assert cache.get(filename, 250) is None
+
+
+def test_least_recently_used_thumbnails_are_removed(tmp_path):
+    filenames = [create_image(tmp_path, f'image{index}.png', (100, 100)) for index in range(3)]
+    thumbnail_size = 100 * 100 * 3
+    cache = ThumbnailCache(max_size=2 * thumbnail_size)
+    cache.load(filenames[0], 100)
+    cache.load(filenames[1], 100)
+    cache.get(filenames[0], 100)
+    cache.load(filenames[2], 100)
+    assert cache.size == 2 * thumbnail_size
+    assert cache.get(filenames[0], 100) is not None
+    assert cache.get(filenames[1], 100) is None
+
+
+def test_thumbnail_larger_than_budget_is_not_cached(tmp_path):
+    filename = create_image(tmp_path, 'image.png', (100, 100))
+    cache = ThumbnailCache(max_size=100)
+    cache.load(filename, 100)
+    assert cache.size == 0
+
+
+def test_pyramid_is_limited_by_zoom(tmp_path):
+    filename = create_image(tmp_path, 'image.png', (2000, 1000))
+    levels = ThumbnailCache().load_pyramid(filename, 100)
+    assert [level.width for level in levels] == [MAX_PYRAMID_ZOOM * 100, 200, 100]
+
+
+def test_pyramid_of_tall_image_is_limited_by_budget(tmp_path):
+    filename = create_image(tmp_path, 'image.png', (1000, 10000))
+    cache = ThumbnailCache(max_size=4 * 1024 * 1024)
+    levels = cache.load_pyramid(filename, 100)
+    # full resolution image is never kept
+    assert levels[0].width < MAX_PYRAMID_ZOOM * 100
+    assert get_image_size(levels[0]) <= MAX_PYRAMID_LEVEL_BUDGET_FRACTION * 4 * 1024 * 1024
+    assert levels[-1].width == 100
+    assert all(level.height == level.width * 10 for level in levels)
+
+
+def test_pyramid_is_taken_from_cache(tmp_path):
+    filename = create_image(tmp_path, 'image.png', (1000, 1000))
+    cache = ThumbnailCache()
+    assert cache.get_pyramid(filename, 250) is None
+    levels = cache.load_pyramid(filename, 250)
+    cached_levels = cache.get_pyramid(filename, 250)
+    assert len(cached_levels) == len(levels)
+    assert all(cached is level for cached, level in zip(cached_levels, levels))
@@ -0,0 +1,48 @@
+import tkinter as tk
+from tkinter import StringVar, ttk
+from typing import Callable
+from ror.ror_solver import AVAILABLE_AGGREGATORS, TIE_RESOLVERS
+
+from utils.tk.TieResolverPicker import TieResolverPicker
+
+
+class AggregateResultFrame(ttk.Frame):
+    '''
+    Lets user pick another aggregation method and tie resolver
+    that will be applied to the intermediate ranks of an existing result.
+    '''
+
+    def __init__(
+        self,
+        root: tk.Tk,
+        initial_aggregator_name: str,
+        on_aggregate: Callable[[str, str], None]
+    ) -> None:
+        ttk.Frame.__init__(self, master=root)
+        self.__on_aggregate = on_aggregate
+        self.__aggregator_name: StringVar = StringVar(value=initial_aggregator_name)
+        self.__tie_resolver: TieResolverPicker = None
+        self.__aggregate_button: ttk.Button = None
+        self.__init_gui()
+
+    def __init_gui(self):
+        ttk.Label(self, text='Aggregate intermediate ranks again', font=('Arial', 17))\
+            .pack(anchor=tk.NW, fill=tk.X)
+        ttk.Label(
+            self,
+            text='Intermediate ranks are reused, models are not solved again. Each aggregation is added as a new final rank.',
+            foreground='grey40'
+        ).pack(anchor=tk.NW, fill=tk.X)
+        ttk.Label(self, text='Aggregation method', font=('Arial', 15))\
+            .pack(anchor=tk.NW, fill=tk.X)
+        picker = ttk.Combobox(self, textvariable=self.__aggregator_name, state='readonly')
+        picker['values'] = list(AVAILABLE_AGGREGATORS.keys())
+        picker.pack(anchor=tk.NW, fill=tk.X)
+        self.__tie_resolver = TieResolverPicker(self, TIE_RESOLVERS, 'NoResolver')
+        self.__tie_resolver.pack(anchor=tk.NW, fill=tk.X)
+        self.__aggregate_button = ttk.Button(self, text='Aggregate', command=self.__aggregate)
+        self.__aggregate_button.pack(anchor=tk.NW)
+
+    def __aggregate(self):
+        if self.__on_aggregate is not None:
+            self.__on_aggregate(self.__aggregator_name.get(), self.__tie_resolver.tie_resolver_name)
@@ -0,0 +1,82 @@
+import logging
+import queue
+import threading
+import tkinter as tk
+from typing import Any, Callable
+
+
+class BackgroundTask:
+    '''
+    Runs a function on a worker thread so the Tk mainloop is never blocked.
+    Tk widgets can't be touched from the worker thread, therefore the worker
+    posts handlers with their arguments to a queue that is drained
+    on the Tk thread with `after`.
+    '''
+    POLL_INTERVAL_MS = 50
+
+    def __init__(
+        self,
+        window_object: tk.Tk,
+        task: Callable[['BackgroundTask'], Any],
+        on_done: Callable[[Any], None] = None,
+        on_error: Callable[[Exception], None] = None
+    ) -> None:
+        self.__window_object: tk.Tk = window_object
+        self.__task = task
+        self.__on_done = on_done
+        self.__on_error = on_error
+        self.__queue: queue.Queue = queue.Queue()
+        self.__thread: threading.Thread = threading.Thread(target=self.__run, daemon=True)
+        self.__finished: bool = False
+
+    @property
+    def is_running(self) -> bool:
+        return self.__thread.is_alive()
+
+    @property
+    def finished(self) -> bool:
+        '''
+        True when the task has ended and all messages posted by it were handled.
+        '''
+        return self.__finished
+
+    def start(self) -> 'BackgroundTask':
+        self.__thread.start()
+        self.__window_object.after(BackgroundTask.POLL_INTERVAL_MS, self.__drain)
+        return self
+
+    def post(self, handler: Callable[..., None], *args):
+        '''
+        Schedules handler to be called with args on the Tk thread.
+        Can be called from any thread.
+        '''
+        self.__queue.put((handler, args))
+
+    def __run(self):
+        try:
+            result = self.__task(self)
+            if self.__on_done is not None:
+                self.post(self.__on_done, result)
+        except Exception as e:
+            if self.__on_error is not None:
+                self.post(self.__on_error, e)
+            else:
+                logging.exception('Background task failed')
+        finally:
+            self.post(None)
+
+    def __drain(self):
+        while True:
+            try:
+                handler, args = self.__queue.get_nowait()
+            except queue.Empty:
+                break
+            if handler is None:
+                # worker has finished and there will be no more messages
+                self.__finished = True
+                return
+            try:
+                handler(*args)
+            except Exception:
+                logging.exception('Failed to handle message from background task')
+        self.__window_object.after(BackgroundTask.POLL_INTERVAL_MS, self.__drain)
@@ -0,0 +1,29 @@
+import threading
+
+
+class SolveCancelledException(Exception):
+    pass
+
+
+class CancellationToken:
+    '''
+    Thread safe flag used to stop calculations that run in the background.
+    The owner of the calculations calls cancel, the calculations check the token
+    between phases with raise_if_cancelled.
+    Token created with an event from a multiprocessing context can be passed
+    to worker processes when they are started.
+    '''
+
+    def __init__(self, event: threading.Event = None) -> None:
+        self.__cancelled: threading.Event = event if event is not None else threading.Event()
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self.__cancelled.is_set()
+
+    def cancel(self):
+        self.__cancelled.set()
+
+    def raise_if_cancelled(self):
+        if self.is_cancelled:
+            raise SolveCancelledException('Calculations were cancelled')
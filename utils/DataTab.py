@@ -1,30 +1,62 @@
+from __future__ import annotations
 import tkinter as tk
 from tkinter import ttk
-from ror.Dataset import Dataset
-from utils.Table import Table
+from typing import TYPE_CHECKING
+
+from utils.ProgressBar import ProgressBar
+
+if TYPE_CHECKING:
+    from ror.Dataset import Dataset
+    from utils.VirtualTable import VirtualTable
+    from utils.streaming_loader import LoadingProgress
 
 
 class DataTab(ttk.Frame):
     def __init__(self, root: tk.Tk):
         ttk.Frame.__init__(self, root)
-        self.table: Table = None
+        self.table: VirtualTable = None
+        self.__progress_bar: ProgressBar = None
         self.init_gui()
 
     def init_gui(self):
         ttk.Label(self, text="Dataset").pack(anchor=tk.NW)
-        # data frame
-        self.__init_table()
+        # table is created when data is set, so tksheet is not imported before it is needed
 
     def __init_table(self):
-        self.table = Table(self)
+        from utils.VirtualTable import VirtualTable
+        self.table = VirtualTable(self)
         self.table.pack(anchor=tk.NW, fill=tk.BOTH, expand=1)
 
+    def start_loading(self):
+        self.finish_loading()
+        self.__progress_bar = ProgressBar(self)
+        if self.table is not None and self.table.winfo_manager() == 'pack':
+            # progress is displayed above data of the currently opened file
+            self.__progress_bar.pack(anchor=tk.N, pady=10, before=self.table)
+        else:
+            self.__progress_bar.pack(anchor=tk.N, pady=50)
+        self.__progress_bar.report_progress(0, 'Reading file')
+
+    def report_loading_progress(self, data: LoadingProgress, eta: float = None):
+        if self.__progress_bar is not None:
+            self.__progress_bar.report_progress(round(data.progress*100), data.status, eta)
+
+    def finish_loading(self):
+        if self.__progress_bar is not None:
+            self.__progress_bar.destroy()
+            self.__progress_bar = None
+
     def set_data(self, data: Dataset, display_precision: int = 2):
+        self.finish_loading()
         if self.table is None:
             self.__init_table()
+        elif self.table.winfo_manager() != 'pack':
+            self.table.pack(anchor=tk.NW, fill=tk.BOTH, expand=1)
+        # the same sheet is reused, only changed headers and cells are updated
         self.table.set_data(data, display_precision)
 
     def clean_data(self):
+        # table is hidden instead of destroyed, so it can be reused by the next file
         if self.table is not None:
-            self.table.remove_data()
-            self.table = None
+            self.table.clear_source()
+            self.table.pack_forget()
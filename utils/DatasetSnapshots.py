@@ -0,0 +1,88 @@
+from __future__ import annotations
+import copy
+from typing import TYPE_CHECKING, Any, Tuple
+
+from utils.cache_helpers import get_intensity_relations, get_preference_relations, hash_parameters
+
+if TYPE_CHECKING:
+    from ror.Dataset import RORDataset
+    from ror.RORParameters import RORParameters
+
+
+def freeze_dataset(dataset: RORDataset) -> RORDataset:
+    '''
+    Returns copy of the dataset that shares the performance matrix with the original one
+    as a read-only view, relations are stored in tuples. Writing to the matrix
+    of the snapshot raises ValueError.
+    '''
+    matrix = dataset.matrix.view()
+    matrix.flags.writeable = False
+    # objects in memo are used by deepcopy instead of copying them
+    memo = {
+        id(dataset.matrix): matrix,
+        id(dataset.preferenceRelations): tuple(dataset.preferenceRelations),
+        id(dataset.intensityRelations): tuple(dataset.intensityRelations)
+    }
+    return copy.deepcopy(dataset, memo)
+
+
+def copy_snapshot(snapshot: RORDataset) -> RORDataset:
+    '''
+    Returns copy of the snapshot for a single solve. Solver can set attributes
+    of the copy and add relations to it without changing the snapshot shared
+    by other solves. Performance matrix is not copied, the copy uses the same read-only view.
+    '''
+    memo = {
+        id(snapshot.matrix): snapshot.matrix,
+        id(snapshot.preferenceRelations): [copy.deepcopy(relation) for relation in snapshot.preferenceRelations],
+        id(snapshot.intensityRelations): [copy.deepcopy(relation) for relation in snapshot.intensityRelations]
+    }
+    return copy.deepcopy(snapshot, memo)
+
+
+class DatasetSnapshots:
+    '''
+    Creates snapshots of the edited dataset and parameters that are passed to solvers
+    and result windows. Snapshots are shared by all solves started before the dataset
+    or parameters change, so they must not be modified. Solves running on a thread
+    of this process get their own copy of the dataset from copy_snapshot.
+    Code that needs different parameters has to make its own copy.
+    Matrix of the edited dataset must not be modified in place, it can be only replaced.
+    '''
+
+    def __init__(self) -> None:
+        self.__dataset: RORDataset = None
+        self.__dataset_version: Tuple[Any, ...] = None
+        self.__dataset_snapshot: RORDataset = None
+        self.__parameters_version: str = None
+        self.__parameters_snapshot: RORParameters = None
+
+    def __get_dataset_version(self, dataset: RORDataset) -> Tuple[Any, ...]:
+        return (
+            id(dataset.matrix),
+            tuple(get_preference_relations(dataset)),
+            tuple(get_intensity_relations(dataset))
+        )
+
+    def get_dataset(self, dataset: RORDataset) -> RORDataset:
+        version = self.__get_dataset_version(dataset)
+        # reference to the edited dataset is kept, so ids in the version can't be reused
+        if dataset is not self.__dataset or version != self.__dataset_version:
+            self.__dataset = dataset
+            self.__dataset_version = version
+            self.__dataset_snapshot = freeze_dataset(dataset)
+        return self.__dataset_snapshot
+
+    def get_parameters(self, parameters: RORParameters) -> RORParameters:
+        version = hash_parameters(parameters)
+        if version != self.__parameters_version:
+            self.__parameters_version = version
+            self.__parameters_snapshot = parameters.deep_copy()
+        return self.__parameters_snapshot
+
+    def clear(self):
+        self.__dataset = None
+        self.__dataset_version = None
+        self.__dataset_snapshot = None
+        self.__parameters_version = None
+        self.__parameters_snapshot = None
@@ -0,0 +1,62 @@
+from collections import namedtuple
+from contextlib import contextmanager
+import json
+import time
+from typing import Callable, Iterator, List
+
+# start is a timestamp (seconds since epoch), duration is in seconds
+TimingSpan = namedtuple('TimingSpan', ['name', 'start', 'duration'])
+
+
+class PhaseTimer:
+    '''
+    Collects timing spans of calculation phases. Spans can be measured
+    explicitly with `measure` or as consecutive phases with `start_phase`,
+    where starting a phase ends the previous one.
+    Each finished span is passed to on_span callback.
+    '''
+
+    def __init__(self, on_span: Callable[[TimingSpan], None] = None) -> None:
+        self.__on_span = on_span
+        self.__spans: List[TimingSpan] = []
+        self.__phase_name: str = None
+        self.__phase_start: float = None
+        self.__phase_timestamp: float = None
+
+    @property
+    def spans(self) -> List[TimingSpan]:
+        return list(self.__spans)
+
+    def add_span(self, name: str, timestamp: float, duration: float):
+        span = TimingSpan(name, timestamp, duration)
+        self.__spans.append(span)
+        if self.__on_span is not None:
+            self.__on_span(span)
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        timestamp = time.time()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_span(name, timestamp, time.perf_counter() - start)
+
+    def start_phase(self, name: str):
+        if name == self.__phase_name:
+            return
+        self.finish_phase()
+        self.__phase_name = name
+        self.__phase_timestamp = time.time()
+        self.__phase_start = time.perf_counter()
+
+    def finish_phase(self):
+        if self.__phase_name is not None:
+            self.add_span(self.__phase_name, self.__phase_timestamp, time.perf_counter() - self.__phase_start)
+        self.__phase_name = None
+        self.__phase_start = None
+        self.__phase_timestamp = None
+
+
+def spans_to_json(spans: List[TimingSpan]) -> str:
+    return json.dumps([span._asdict() for span in spans], indent=2)
@@ -0,0 +1,297 @@
+from __future__ import annotations
+import hashlib
+import logging
+import os
+import pickle
+import time
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+import numpy as np
+
+from utils.cache_helpers import get_cache_directory
+
+if TYPE_CHECKING:
+    from ror.data_loader import LoaderResult
+
+# increase when the layout of cache files changes
+CACHE_FORMAT_VERSION = 1
+MATRIX_PERSISTENT_ID = 'matrix'
+HASH_CHUNK_SIZE = 1024 * 1024
+DEFAULT_DISK_BUDGET_BYTES = 2 * 1024 * 1024 * 1024
+# temporary and unreferenced files younger than this (in seconds) can still be
+# written or mapped by another instance of the application, so they are kept
+STALE_FILE_AGE = 24 * 60 * 60
+
+
+def hash_file(filename: str) -> str:
+    hash_object = hashlib.sha256()
+    with open(filename, 'rb') as file:
+        for chunk in iter(lambda: file.read(HASH_CHUNK_SIZE), b''):
+            hash_object.update(chunk)
+    return hash_object.hexdigest()
+
+
+class _LoaderResultPickler(pickle.Pickler):
+    '''
+    Pickles the loader result without the performance matrix,
+    the matrix is saved to a separate .npy file.
+    '''
+
+    def __init__(self, file, matrix: np.ndarray) -> None:
+        super().__init__(file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.__matrix = matrix
+
+    def persistent_id(self, obj: Any) -> Optional[str]:
+        if obj is self.__matrix:
+            return MATRIX_PERSISTENT_ID
+        return None
+
+
+class _LoaderResultUnpickler(pickle.Unpickler):
+    def __init__(self, file, matrix: np.ndarray) -> None:
+        super().__init__(file)
+        self.__matrix = matrix
+
+    def persistent_load(self, pid: str) -> Any:
+        if pid != MATRIX_PERSISTENT_ID:
+            raise pickle.UnpicklingError(f'Unknown persistent id {pid}')
+        return self.__matrix
+
+
+class ProblemFileCache:
+    '''
+    Binary copies of parsed problem files. Each problem file has a sidecar
+    in the cache directory: performance matrix in a .npy file and the rest
+    of the loader result (with relations and parameters) in a pickle.
+    Sidecar is valid if size and modification time of the problem file are the same
+    as when it was parsed, if only the modification time differs then
+    the hash of the file contents is compared (and the stored time is updated if they match).
+    Matrix files can be memory mapped instead of being read to memory, so matrices
+    of old versions of problem files are not removed when a new version is cached
+    (an open dataset may still map them), they are removed when the cache is created
+    if they are older than stale_file_age seconds.
+    When the directory exceeds its size budget, sidecars of the least recently used
+    problem files are removed.
+    '''
+
+    def __init__(
+        self,
+        directory: str = None,
+        max_disk_size: int = DEFAULT_DISK_BUDGET_BYTES,
+        stale_file_age: float = STALE_FILE_AGE
+    ) -> None:
+        self.__directory: str = directory if directory is not None else get_cache_directory('problems')
+        self.__max_disk_size: int = max_disk_size
+        self.__stale_file_age: float = stale_file_age
+        # absolute path -> size, modification time and hash of the last hashed version of the file
+        self.__file_hashes: Dict[str, Tuple[int, int, str]] = dict()
+        os.makedirs(self.__directory, exist_ok=True)
+        self.__remove_stale_files()
+
+    def __get_key(self, filename: str) -> str:
+        return hashlib.sha256(os.path.abspath(filename).encode()).hexdigest()
+
+    def __get_metadata_filename(self, key: str) -> str:
+        return os.path.join(self.__directory, f'{key}.pickle')
+
+    def __get_matrix_filename(self, key: str, file_hash: str) -> str:
+        # each version of the problem file has its own matrix file,
+        # so metadata never points to a matrix of a different version
+        return os.path.join(self.__directory, f'{key}-{file_hash}.npy')
+
+    def __get_file_info(self, filename: str) -> Dict[str, Any]:
+        stat = os.stat(filename)
+        return {
+            'version': CACHE_FORMAT_VERSION,
+            'size': stat.st_size,
+            'mtime': stat.st_mtime_ns
+        }
+
+    def __get_file_hash(self, filename: str, file_info: Dict[str, Any]) -> str:
+        # get, get_matrix_filename and put are called when a file is opened,
+        # the file is hashed only once for each version of it
+        path = os.path.abspath(filename)
+        size, mtime, file_hash = self.__file_hashes.get(path, (None, None, None))
+        if size == file_info['size'] and mtime == file_info['mtime']:
+            return file_hash
+        file_hash = hash_file(filename)
+        self.__file_hashes[path] = (file_info['size'], file_info['mtime'], file_hash)
+        return file_hash
+
+    def __update_metadata(self, metadata_filename: str, metadata: Dict[str, Any]):
+        # loader result is copied as it is, only metadata before it is replaced
+        try:
+            with open(metadata_filename, 'rb') as file:
+                pickle.load(file)
+                loader_result_data = file.read()
+            with open(f'{metadata_filename}.tmp', 'wb') as file:
+                pickle.dump(metadata, file, protocol=pickle.HIGHEST_PROTOCOL)
+                file.write(loader_result_data)
+            os.replace(f'{metadata_filename}.tmp', metadata_filename)
+        except Exception as e:
+            logging.warning(f'Failed to update cached problem file metadata {metadata_filename}: {e}')
+            if os.path.exists(f'{metadata_filename}.tmp'):
+                os.remove(f'{metadata_filename}.tmp')
+
+    def get_matrix_filename(self, filename: str) -> str:
+        '''
+        Returns name of the matrix file for the current version of the problem file,
+        a loader can write the matrix there directly.
+        '''
+        file_hash = self.__get_file_hash(filename, self.__get_file_info(filename))
+        return self.__get_matrix_filename(self.__get_key(filename), file_hash)
+
+    def get(self, filename: str, memory_map: bool = False) -> Optional[LoaderResult]:
+        '''
+        Returns cached loader result or None if there is no valid sidecar for the file.
+        If memory_map is True then the matrix is mapped copy-on-write,
+        changes of the matrix are not written to the cache file.
+        '''
+        key = self.__get_key(filename)
+        metadata_filename = self.__get_metadata_filename(key)
+        if not os.path.exists(metadata_filename):
+            return None
+        try:
+            with open(metadata_filename, 'rb') as file:
+                metadata: Dict[str, Any] = pickle.load(file)
+                file_info = self.__get_file_info(filename)
+                if metadata['version'] != file_info['version'] or metadata['size'] != file_info['size']:
+                    return None
+                is_touched = metadata['mtime'] != file_info['mtime']
+                if is_touched and metadata['hash'] != self.__get_file_hash(filename, file_info):
+                    return None
+                matrix = np.load(
+                    self.__get_matrix_filename(key, metadata['hash']),
+                    mmap_mode='c' if memory_map else None
+                )
+                loader_result = _LoaderResultUnpickler(file, matrix).load()
+        except Exception as e:
+            logging.warning(f'Failed to load cached problem file {filename}: {e}')
+            return None
+        if is_touched:
+            # contents are the same, so the file is not hashed again the next time it is opened
+            self.__update_metadata(metadata_filename, {**metadata, **file_info})
+        else:
+            # update access time used for eviction
+            os.utime(metadata_filename)
+        return loader_result
+
+    def put(self, filename: str, loader_result: LoaderResult):
+        key = self.__get_key(filename)
+        file_info = self.__get_file_info(filename)
+        metadata = {
+            **file_info,
+            'hash': self.__get_file_hash(filename, file_info)
+        }
+        metadata_filename = self.__get_metadata_filename(key)
+        matrix_filename = self.__get_matrix_filename(key, metadata['hash'])
+        # asanyarray keeps the memmap, so a matrix mapped from the sidecar is not written again
+        matrix = np.asanyarray(loader_result.dataset.matrix)
+        try:
+            # matrix is saved before metadata that points to it
+            if not isinstance(matrix, np.memmap) or os.path.abspath(matrix.filename) != os.path.abspath(matrix_filename):
+                with open(f'{matrix_filename}.tmp', 'wb') as file:
+                    np.save(file, matrix)
+                os.replace(f'{matrix_filename}.tmp', matrix_filename)
+            with open(f'{metadata_filename}.tmp', 'wb') as file:
+                pickle.dump(metadata, file, protocol=pickle.HIGHEST_PROTOCOL)
+                _LoaderResultPickler(file, loader_result.dataset.matrix).dump(loader_result)
+            os.replace(f'{metadata_filename}.tmp', metadata_filename)
+        except Exception as e:
+            logging.warning(f'Failed to save cached problem file {filename}: {e}')
+            for temporary_filename in [f'{matrix_filename}.tmp', f'{metadata_filename}.tmp']:
+                if os.path.exists(temporary_filename):
+                    os.remove(temporary_filename)
+            return
+        self.__evict(key)
+
+    def __remove_file(self, filename: str) -> bool:
+        try:
+            os.remove(os.path.join(self.__directory, filename))
+            return True
+        except OSError as e:
+            # file can be mapped by an open dataset or another instance of the application
+            logging.debug(f'Failed to remove cache file {filename}: {e}')
+            return False
+
+    def __get_entries(self) -> Dict[str, List[Tuple[str, os.stat_result]]]:
+        '''
+        Returns cache files grouped by the key of the problem file.
+        '''
+        entries: Dict[str, List[Tuple[str, os.stat_result]]] = dict()
+        for filename in os.listdir(self.__directory):
+            if filename.endswith('.pickle'):
+                key = filename[:-len('.pickle')]
+            elif filename.endswith('.npy'):
+                key = filename.split('-', 1)[0]
+            else:
+                continue
+            try:
+                entries.setdefault(key, []).append((filename, os.stat(os.path.join(self.__directory, filename))))
+            except OSError:
+                # removed by another instance of the application
+                continue
+        return entries
+
+    def __evict(self, kept_key: str):
+        '''
+        Removes sidecars of the least recently used problem files until
+        the directory fits in the size budget, the sidecar of kept_key is never removed.
+        '''
+        entries = self.__get_entries()
+        total_size = sum(stat.st_size for files in entries.values() for _, stat in files)
+
+        def get_last_use(key: str) -> float:
+            # metadata is updated each time the problem file is opened,
+            # matrices without metadata are as old as their newest file
+            files = entries[key]
+            metadata_times = [stat.st_mtime for filename, stat in files if filename.endswith('.pickle')]
+            return metadata_times[0] if len(metadata_times) > 0 else max(stat.st_mtime for _, stat in files)
+
+        # least recently used first
+        for key in sorted(entries, key=get_last_use):
+            if total_size <= self.__max_disk_size:
+                break
+            if key == kept_key:
+                continue
+            # metadata is removed first, so it never points to a removed matrix
+            for filename, stat in sorted(entries[key], key=lambda entry: not entry[0].endswith('.pickle')):
+                if self.__remove_file(filename):
+                    total_size -= stat.st_size
+
+    def __get_referenced_matrix(self, metadata_filename: str) -> Optional[str]:
+        try:
+            with open(metadata_filename, 'rb') as file:
+                metadata: Dict[str, Any] = pickle.load(file)
+            key = os.path.basename(metadata_filename)[:-len('.pickle')]
+            return os.path.basename(self.__get_matrix_filename(key, metadata['hash']))
+        except Exception:
+            return None
+
+    def __is_stale(self, filename: str) -> bool:
+        try:
+            modification_time = os.path.getmtime(os.path.join(self.__directory, filename))
+        except OSError:
+            return False
+        return time.time() - modification_time >= self.__stale_file_age
+
+    def __remove_stale_files(self):
+        '''
+        Removes old matrices that are not referenced by any metadata file
+        (old versions of problem files) and old temporary files of interrupted writes.
+        Recent files are kept, they can be used by another instance of the application.
+        '''
+        filenames = os.listdir(self.__directory)
+        referenced_matrices = set(
+            self.__get_referenced_matrix(os.path.join(self.__directory, filename))
+            for filename in filenames
+            if filename.endswith('.pickle')
+        )
+        for filename in filenames:
+            is_unused = filename.endswith('.tmp') or (filename.endswith('.npy') and filename not in referenced_matrices)
+            if is_unused and self.__is_stale(filename):
+                self.__remove_file(filename)
+
+    def clear(self):
+        for filename in os.listdir(self.__directory):
+            if filename.endswith('.pickle') or filename.endswith('.npy'):
+                os.remove(os.path.join(self.__directory, filename))
@@ -1,11 +1,15 @@
 import tkinter as tk
 from tkinter import ttk
+from typing import Callable, Optional
+
+from utils.time import format_duration
 
 class ProgressBar(tk.Frame):
-    def __init__(self, root: tk.Tk):
+    def __init__(self, root: tk.Tk, on_stop: Callable[[], None] = None):
         tk.Frame.__init__(self, master=root)
         self.rowconfigure(0, weight=1)
         self.rowconfigure(1, weight=1)
+        self.rowconfigure(2, weight=1)
         self.columnconfigure(0, weight=1)
         self.__progress_bar: ttk.Progressbar = ttk.Progressbar(
             self,
@@ -17,7 +21,17 @@ class ProgressBar(tk.Frame):
         self.__status_text = tk.StringVar()
         self.__progress_status = ttk.Label(self, textvariable=self.__status_text)
         self.__progress_status.grid(column=0, row=1)
+        self.__stop_button: ttk.Button = None
+        if on_stop is not None:
+            self.__stop_button = ttk.Button(self, text='Stop', command=on_stop)
+            self.__stop_button.grid(column=0, row=2)
 
-    def report_progress(self, progress: int, status: str):
+    def report_progress(self, progress: int, status: str, eta: Optional[float] = None):
         self.__progress_bar['value'] = min(100, max(0, progress))
+        if eta is not None:
+            status = f'{status}, about {format_duration(eta)} left'
         self.__status_text.set(status)
+
+    def disable_stop(self):
+        if self.__stop_button is not None:
+            self.__stop_button.configure(state=tk.DISABLED)
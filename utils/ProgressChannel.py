@@ -0,0 +1,75 @@
+from __future__ import annotations
+import threading
+import time
+import tkinter as tk
+from typing import TYPE_CHECKING, Callable, List, Optional
+
+if TYPE_CHECKING:
+    from ror.ror_solver import ProcessingCallbackData
+
+ProgressHandler = Callable[['ProcessingCallbackData', Optional[float]], None]
+
+
+class ProgressChannel:
+    '''
+    Passes progress of calculations from a worker thread to the Tk thread.
+    Only the latest progress is kept, it is handled at most once per frame,
+    so the solver can report progress as often as it wants without redrawing
+    widgets each time. Errors (negative progress) are never skipped.
+    Progress is handled together with estimated time (in seconds) left
+    to finish calculations, or None if it can't be estimated yet.
+    '''
+    FRAME_INTERVAL_MS = 100
+
+    def __init__(self, window_object: tk.Tk, on_progress: ProgressHandler) -> None:
+        self.__window_object: tk.Tk = window_object
+        self.__on_progress: ProgressHandler = on_progress
+        self.__lock: threading.Lock = threading.Lock()
+        self.__latest: ProcessingCallbackData = None
+        self.__errors: List[ProcessingCallbackData] = []
+        self.__start_time: float = None
+        self.__eta: Optional[float] = None
+        self.__closed: bool = False
+
+    def start(self) -> 'ProgressChannel':
+        self.__start_time = time.perf_counter()
+        self.__window_object.after(ProgressChannel.FRAME_INTERVAL_MS, self.__repaint)
+        return self
+
+    def report(self, data: ProcessingCallbackData):
+        '''
+        Stores progress to be handled in the next frame. Can be called from any thread.
+        '''
+        with self.__lock:
+            if data.progress < 0:
+                self.__errors.append(data)
+                return
+            self.__latest = data
+            if self.__start_time is not None and 0 < data.progress < 1:
+                elapsed = time.perf_counter() - self.__start_time
+                # assume that the remaining work takes as long as the work done so far
+                self.__eta = elapsed * (1 - data.progress) / data.progress
+
+    def flush(self):
+        '''
+        Handles pending progress immediately and stops the channel.
+        Must be called on the Tk thread.
+        '''
+        self.__closed = True
+        self.__handle_pending()
+
+    def __handle_pending(self):
+        with self.__lock:
+            latest, errors, eta = self.__latest, self.__errors, self.__eta
+            self.__latest = None
+            self.__errors = []
+        if latest is not None:
+            self.__on_progress(latest, eta if latest.progress < 1 else None)
+        for error in errors:
+            self.__on_progress(error, None)
+
+    def __repaint(self):
+        if self.__closed:
+            return
+        self.__handle_pending()
+        self.__window_object.after(ProgressChannel.FRAME_INTERVAL_MS, self.__repaint)
@@ -0,0 +1,855 @@
+from __future__ import annotations
+import tkinter as tk
+from tkinter import StringVar, ttk
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+import os.path as path
+import os
+
+from ror.dataset_constants import CRITERION_TYPES
+from ror.CalculationsException import CalculationsException
+from ror.loader_utils import RORParameter
+from utils.BackgroundTask import BackgroundTask
+from utils.CancellationToken import CancellationToken, SolveCancelledException
+from utils.DataTab import DataTab
+from utils.ScrollableFrame import ScrollableFrame
+from utils.ProgressChannel import ProgressChannel
+from utils.Severity import Severity
+from utils.SolveScheduler import SolveJob, SolveJobState, SolveScheduler
+from utils.tk.ScrolledText import ScrolledText
+from utils.time import get_log_time
+from utils.file_handler import get_file, open_file
+from datetime import datetime
+from ttkthemes import ThemedStyle
+import logging
+
+# modules that are not needed to display the first frame (solver, aggregators,
+# dialogs, result windows, plots and images) are imported on first use
+if TYPE_CHECKING:
+    from ror.Dataset import RORDataset
+    from ror.data_loader import LoaderResult
+    from ror.RORParameters import RORParameters
+    from ror.RORResult import RORResult
+    from ror.ror_solver import ProcessingCallbackData
+    from utils.AggregationWidget import AggregationWidget
+    from utils.AlphaValuesFrame import AlphaValuesFrame
+    from utils.DatasetSnapshots import DatasetSnapshots
+    from utils.PhaseTimer import TimingSpan
+    from utils.ResultCache import ResultCache
+    from utils.ResultWindow import ResultWindow
+    from utils.tk.BordaAggregatorOptionsDialog import BordaCopelandAggregatorOptionsDialogResult
+    from utils.tk.DefaultAggregatorOptionsDialog import DefaultAggregatorOptionsDialogResult
+    from utils.tk.ParameterSweepDialog import ParameterSweepDialogResult
+    from utils.tk.WeightedAggregatorOptionsDialog import WeightedAggregatorOptionsDialogResult
+
+# number of solves that can run at the same time, next solves are queued
+DEFAULT_MAX_RUNNING_SOLVES = 2
+
+
+class RORWindow:
+    def __init__(self) -> None:
+        self.root: tk.Tk = tk.Tk()
+        # set style as early as possible
+        style = ThemedStyle(self.root)
+        style.set_theme('radiance') #clearlooks, equilux, arc
+
+        self.simulation_text = tk.StringVar()
+        self.log_console: ScrolledText = None
+        self.table: DataTab = None
+        self.root_frames: Dict[str, ttk.Frame] = dict()
+        self.open_default_file_button: ttk.Button = None
+        self.debug: bool = True
+        self.current_filename: str = None
+        self.dataset: RORDataset = None
+        self.parameters: RORParameters = None
+        self.__snapshots: Optional[DatasetSnapshots] = None
+        self.loading_task: BackgroundTask = None
+        self.memory_map_matrix: tk.BooleanVar = tk.BooleanVar(value=False)
+        self.result_windows: dict[tk.Frame, ResultWindow] = dict()
+        self.alpha_values_list: AlphaValuesFrame = None
+        self.epsilion_value: tk.StringVar = StringVar()
+        self.aggregation_method: AggregationWidget = None
+        self.information_box: tk.Frame = None
+        self.main_tab: ttk.Notebook = None
+        self.example_files_list: ttk.Frame = None
+        self.solve_in_parallel: tk.BooleanVar = tk.BooleanVar(value=False)
+        self.use_result_cache: tk.BooleanVar = tk.BooleanVar(value=True)
+        self.display_rank_images: tk.BooleanVar = tk.BooleanVar(value=False)
+        self.__result_cache: Optional[ResultCache] = None
+        self.solve_scheduler: SolveScheduler = SolveScheduler(DEFAULT_MAX_RUNNING_SOLVES)
+        self.max_running_solves: tk.IntVar = tk.IntVar(value=DEFAULT_MAX_RUNNING_SOLVES)
+        self.init_gui()
+
+    @property
+    def snapshots(self) -> DatasetSnapshots:
+        # caches are created on first use, they are not needed to display the first frame
+        if self.__snapshots is None:
+            from utils.DatasetSnapshots import DatasetSnapshots
+            self.__snapshots = DatasetSnapshots()
+        return self.__snapshots
+
+    @property
+    def result_cache(self) -> ResultCache:
+        if self.__result_cache is None:
+            from utils.ResultCache import ResultCache
+            self.__result_cache = ResultCache()
+        return self.__result_cache
+
+    def open_file(self, filename: str, on_opened: Callable[[], None] = None):
+        '''
+        Reads file on a worker thread, progress of reading is displayed in the data tab.
+        '''
+        if self.loading_task is not None and not self.loading_task.finished:
+            self.log('Another file is being opened, wait until it is loaded', Severity.WARNING)
+            return
+
+        def on_loaded(loading_result: LoaderResult):
+            progress_channel.flush()
+            # close old file
+            self.close_file()
+            # open new file
+            self.dataset = loading_result.dataset
+            self.parameters = loading_result.parameters
+            self.table.set_data(
+                self.dataset,
+                self.parameters.get_parameter(RORParameter.PRECISION)
+            )
+            self.current_filename = filename
+            self.log(f'Opened file {filename}', Severity.SUCCESS)
+            self.show_information_tab()
+            if on_opened is not None:
+                on_opened()
+
+        def on_error(e: Exception):
+            progress_channel.flush()
+            self.table.finish_loading()
+            self.log(f"Failed to read file. Exception {e}", Severity.ERROR)
+
+        self.log(f'Opening file {filename}')
+        # Tk variables can't be read on the worker thread
+        memory_map = self.memory_map_matrix.get()
+        self.table.start_loading()
+        progress_channel = ProgressChannel(self.root, self.table.report_loading_progress).start()
+        self.loading_task = BackgroundTask(
+            self.root,
+            lambda _: open_file(
+                filename,
+                progress_callback=progress_channel.report,
+                memory_map=memory_map
+            ),
+            on_loaded,
+            on_error
+        ).start()
+
+    def open_file_dialog(self):
+        try:
+            filename = get_file()
+        except Exception as e:
+            self.current_filename = None
+            self.log(f"Failed to get file. Exception {e}", Severity.ERROR)
+        if filename == '':
+            self.current_filename = None
+            self.log('No file selected', Severity.WARNING)
+        else:
+            self.open_file(filename)
+
+    def save_file(self):
+        if self.dataset is None:
+            self.log('Dataset is empty', Severity.ERROR)
+            return
+
+        if not self.validate_model():
+            self.log('Failed to save model, model is not valid', Severity.ERROR)
+            return
+        
+        from utils.tk.io_helper import save_model
+        save_model(self.root, self.dataset, self.parameters, self.current_filename, self.log)
+
+    def close_file(self):
+        self.table.clean_data()
+        self.dataset = None
+        if self.__snapshots is not None:
+            self.__snapshots.clear()
+        if self.current_filename is not None and self.current_filename != '':
+            self.log(f'Closed file {self.current_filename}')
+        self.current_filename = None
+        self.parameters = None
+        self.alpha_values_list = None
+        self.hide_information_tab()
+
+    def cancel_changes(self):
+        if self.current_filename is not None:
+            self.open_file(
+                self.current_filename,
+                lambda: self.log(f'Canceled changes - reopened file {self.current_filename}', Severity.SUCCESS)
+            )
+        else:
+            self.log('No file is currently opened', Severity.WARNING)
+
+    def validate_model(self) -> bool:
+        if self.parameters is None:
+            self.log('parameters object is None', Severity.ERROR)
+            return False
+
+        parameters_are_valid = True
+        is_epsilion_valid, new_epsilion = self.try_to_validate_epsilion_value()
+        if is_epsilion_valid:
+            self.parameters.add_parameter(RORParameter.EPS, new_epsilion)
+        parameters_are_valid = is_epsilion_valid
+
+        try:
+            aggregation_method_name = self.aggregation_method.get_aggregation_method_name()
+            self.parameters.add_parameter(RORParameter.RESULTS_AGGREGATOR, aggregation_method_name)
+        except:
+            self.log('Failed to get aggregation method', Severity.ERROR)
+            parameters_are_valid = False
+        return parameters_are_valid
+
+    def init_menu(self):
+        menu = tk.Menu(self.root)
+        self.root.config(menu=menu)
+        filemenu = tk.Menu(menu)
+        filemenu.add_command(
+            label="Open file...", command=self.open_file_dialog, accelerator="Control+O")
+        save_file_menu = tk.Menu(filemenu)
+        save_file_menu.add_command(
+            label="Save to ror file (data with preferences)", command=lambda: self.save_file())
+        filemenu.add_cascade(label="Save...", menu=save_file_menu)
+        filemenu.add_checkbutton(
+            label="Memory map performance matrix of opened files", variable=self.memory_map_matrix)
+        menu.add_cascade(label="File", menu=filemenu)
+
+        solver = tk.Menu(menu)
+        menu.add_cascade(label="Solver", menu=solver)
+        solver.add_checkbutton(
+            label='Solve alpha values in parallel', variable=self.solve_in_parallel)
+        solver.add_checkbutton(
+            label='Use cached results', variable=self.use_result_cache)
+        solver.add_command(
+            label='Clear result cache', command=self.clear_result_cache)
+        solver.add_checkbutton(
+            label='Display rank images created by the solver', variable=self.display_rank_images)
+        solver.add_command(
+            label='Parameter sweep...', command=self.sweep_parameters)
+        max_running_solves_menu = tk.Menu(solver)
+        for number_of_solves in range(1, (os.cpu_count() or 1) + 1):
+            max_running_solves_menu.add_radiobutton(
+                label=str(number_of_solves),
+                value=number_of_solves,
+                variable=self.max_running_solves,
+                command=self.set_max_running_solves
+            )
+        solver.add_cascade(label='Maximum number of running solves', menu=max_running_solves_menu)
+
+        log = tk.Menu(menu)
+        menu.add_cascade(label="Log", menu=log)
+        log.add_command(
+            label='Clear log', command=lambda: self.log_console.clear(), accelerator="F1")
+
+    def init_gui(self):
+        self.root.columnconfigure(0, weight=70)
+        self.root.columnconfigure(1, weight=30, minsize=350)
+        self.root.rowconfigure(0, weight=5)
+        self.root.rowconfigure(1, weight=1)
+        screen_width = int(self.root.winfo_screenwidth()*.8)
+        screen_height = int(self.root.winfo_screenheight()*.8)
+        logging.info(f"Setting scrren to (w x h): {screen_width}x{screen_height}")
+        self.root.minsize(screen_width, screen_height)
+        self.root.geometry(f"{screen_width}x{screen_height}")
+        self.root.title('ROR-distance solver')
+
+        self.main_tab = ttk.Notebook(self.root)
+        self.main_tab.grid(row=0, column=0, sticky=tk.NSEW)
+        self.table = DataTab(self.main_tab)
+        self.main_tab.add(self.table, text='Data')
+
+        # log_console
+        log_console_frame = ttk.Frame(self.root, padding=2)
+        log_console_columnspan = 1 if self.debug else 2
+        log_console_frame.grid(
+            column=0, row=1, columnspan=log_console_columnspan, sticky=tk.NSEW)
+        log_console_frame.rowconfigure(0, weight=1)
+        log_console_frame.rowconfigure(1, weight=8)
+        log_console_frame.columnconfigure(0, weight=1)
+        self.root_frames['log_console'] = log_console_frame
+        ttk.Label(log_console_frame, text='Log window')\
+            .grid(row=0, column=0, sticky=tk.NSEW)
+        self.log_console = ScrolledText(self.root,
+            log_console_frame, height=10, state=tk.DISABLED)
+        # update grid for log console
+        self.log_console.grid(row=1, column=0, sticky=tk.NSEW)
+
+        # by default set information box with no file opened
+        self.hide_information_tab()
+
+        # prepare menu
+        self.init_menu()
+
+        self.display_list_with_example_files()
+        # uncomment to read example file at program startup and solve it
+        # self.open_file(self.get_example_files()[0][1])
+        # self.solve()
+
+    def get_example_files(self) -> List[str]:
+        # example problems are in the root directory of the repository
+        root_dir = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+        example_files_root_dir = 'example_problems'
+        directory = os.path.join(root_dir, example_files_root_dir)
+        problem_file_extension = 'txt'
+        example_files: List[str] = []
+        if not os.path.exists(directory):
+            self.log(f'Failed to list example files. Directory with example files {directory} doesn\'t exist', Severity.WARNING)
+            return []
+        else:
+            files = os.listdir(directory)
+            for file in files:
+                if file.endswith(f'.{problem_file_extension}'):
+                    example_files.append((file, os.path.join(directory, file)))
+        if len(example_files) < 1:
+            self.log(f'Found no files with example problem in dir {directory}', Severity.WARNING)
+        else:
+            self.log(f'Found {len(example_files)} file(s) with example problem in dir {directory}')
+        return example_files
+
+    def display_list_with_example_files(self):
+        self.example_files_list = ttk.Frame(self.root)
+        self.example_files_list.grid(column=1, row=1, sticky=tk.NSEW)
+        ttk.Label(self.example_files_list, text='Example files with problems')\
+            .pack(anchor=tk.NW, fill=tk.X)
+        example_files: List[str] = self.get_example_files()
+        if len(example_files) < 1:
+            ttk.Label(self.example_files_list, text='No files found', font=('Arial', 10), foreground='red3')\
+                .pack(anchor=tk.NW, fill=tk.X)
+        else:
+            weights_frame = ttk.Frame(self.example_files_list)
+            weights_frame.pack(anchor=tk.NW, fill=tk.BOTH, expand=1)
+            scroll = ScrollableFrame(weights_frame)
+            scroll.pack(anchor=tk.NW, fill=tk.BOTH, expand=1)
+            # create all items
+            for idx, (file, file_path) in enumerate(example_files):
+                fr = ttk.Frame(scroll.frame, padding=5)
+                fr.rowconfigure(0, weight=2)
+                fr.rowconfigure(1, weight=1)
+                fr.columnconfigure(0, weight=7)
+                fr.columnconfigure(1, weight=3)
+                fr.pack(anchor=tk.NW, fill=tk.X, expand=1)
+                ttk.Label(fr, text=f'{idx+1}. Name: {file}').\
+                    grid(row=0, column=0, sticky=tk.W)
+                ttk.Label(fr, text=f'Path: {file_path}', font=('Arial', 10), wraplength=200).\
+                    grid(row=1, column=0, sticky=tk.W)
+                from functools import partial
+                ttk.Button(fr, text='Open', command=partial(self.open_file, file_path)).\
+                    grid(row=0, column=1, rowspan=2, sticky=tk.E)
+
+    def clear_log(self):
+        self.log_console.clear()
+
+    def set_max_running_solves(self):
+        self.solve_scheduler.max_running_jobs = self.max_running_solves.get()
+        self.log(f'Maximum number of running solves set to {self.solve_scheduler.max_running_jobs}')
+
+    def clear_result_cache(self):
+        try:
+            self.result_cache.clear()
+            self.log('Cleared result cache', Severity.SUCCESS)
+        except Exception as e:
+            self.log(f'Failed to clear result cache: {e}', Severity.ERROR)
+
+    def __run_solver(self, dataset: RORDataset, parameters: RORParameters):
+        tab = ttk.Frame(self.main_tab)
+        tab.rowconfigure(0, weight=1)
+        tab.columnconfigure(0, weight=1)
+        now = datetime.now()
+        now_str = now.strftime("%H:%M:%S")
+        tab_title = f'Result {now_str}, {self.current_filename.split(path.sep)[-1]}'
+        self.main_tab.add(tab, text=tab_title)
+        last_tab_id = len(self.main_tab.tabs())-1
+        # focus on the last tab
+        self.main_tab.select(last_tab_id)
+        cancellation_token = CancellationToken()
+        from utils.ResultWindow import ResultWindow
+        result_window = ResultWindow(
+            self.log,
+            self.root,
+            dataset,
+            parameters,
+            tab,
+            self.on_result_close,
+            cancellation_token,
+            self.display_rank_images.get()
+        )
+        self.result_windows[tab] = result_window
+
+        def on_state_changed(state: SolveJobState):
+            if tab not in self.result_windows:
+                return
+            result_window.set_job_state(state)
+            self.main_tab.tab(tab, text=f'{tab_title} ({state.value})')
+
+        # run is queued, it starts when the scheduler has a free slot
+        job = self.solve_scheduler.submit(
+            lambda job: self.__start_solver(job, tab, result_window, dataset, parameters, cancellation_token),
+            on_state_changed
+        )
+        result_window.set_job(job)
+
+    def __start_solver(
+        self,
+        job: SolveJob,
+        tab: ttk.Frame,
+        result_window: ResultWindow,
+        dataset: RORDataset,
+        parameters: RORParameters,
+        cancellation_token: CancellationToken
+    ):
+        from utils.cache_helpers import get_result_key
+        # Tk variables can't be read on the worker thread
+        use_result_cache = self.use_result_cache.get()
+        # cache is created on the Tk thread
+        result_cache = self.result_cache
+
+        def find_cached_result(_: BackgroundTask) -> Tuple[str, RORResult]:
+            # hashing the matrix and loading a pickled result take a while for large problems
+            result_key = get_result_key(dataset, parameters)
+            return result_key, result_cache.get(result_key) if use_result_cache else None
+
+        def on_cache_checked(data: Tuple[str, RORResult]):
+            result_key, cached_result = data
+            if cancellation_token.is_cancelled:
+                job.finish(SolveJobState.CANCELLED)
+                if tab in self.result_windows:
+                    result_window.set_cancelled()
+            elif cached_result is not None:
+                from ror.ror_solver import ProcessingCallbackData
+                self.log('Loaded result from cache', Severity.SUCCESS)
+                job.finish(SolveJobState.DONE)
+                if tab in self.result_windows:
+                    result_window.report_progress(ProcessingCallbackData(1.0, 'Loaded result from cache'))
+                    result_window.set_result(cached_result, dataset.alternatives, parameters)
+            else:
+                self.__solve(job, tab, result_window, dataset, parameters, cancellation_token, result_key)
+
+        def on_cache_error(e: Exception):
+            self.log(f'Failed to check result cache: {e}', Severity.WARNING)
+            self.__solve(job, tab, result_window, dataset, parameters, cancellation_token, None)
+
+        BackgroundTask(self.root, find_cached_result, on_cache_checked, on_cache_error).start()
+
+    def __solve(
+        self,
+        job: SolveJob,
+        tab: ttk.Frame,
+        result_window: ResultWindow,
+        dataset: RORDataset,
+        parameters: RORParameters,
+        cancellation_token: CancellationToken,
+        result_key: Optional[str]
+    ):
+        from ror.ror_solver import ProcessingCallbackData
+        from utils.DatasetSnapshots import copy_snapshot
+        from utils.solver_helpers import solve_problem_in_background
+
+        def on_result(result: RORResult):
+            if result is not None and result_key is not None:
+                # only the memory tier is updated on the Tk thread, pickling runs in the background
+                self.result_cache.remember(result_key, result)
+                BackgroundTask(self.root, lambda _: self.result_cache.save(result_key, result)).start()
+            job.finish(SolveJobState.DONE if result is not None else SolveJobState.FAILED)
+            if tab not in self.result_windows:
+                # result window was closed before calculations finished
+                return
+            result_window.set_result(result, dataset.alternatives, parameters)
+
+        def on_progress(data: ProcessingCallbackData, eta: float):
+            if tab in self.result_windows:
+                result_window.report_progress(data, eta)
+
+        def on_timing_span(span: TimingSpan):
+            if tab in self.result_windows:
+                result_window.add_timing_span(span)
+
+        def on_error(e: Exception):
+            if isinstance(e, SolveCancelledException):
+                job.finish(SolveJobState.CANCELLED)
+                if tab in self.result_windows:
+                    result_window.set_cancelled()
+                return
+            job.finish(SolveJobState.FAILED)
+            if isinstance(e, CalculationsException):
+                self.log(f'Failed to finish calculations: {e}', Severity.ERROR)
+            else:
+                self.log(f'Failed to solve problem: {e}', Severity.ERROR)
+
+        # solve on a worker thread so the GUI stays responsive during calculations,
+        # solver gets its own copy of the shared snapshot, so it can modify the dataset
+        solve_problem_in_background(
+            self.root,
+            copy_snapshot(dataset),
+            parameters,
+            self.log,
+            on_progress,
+            parameters.get_parameter(RORParameter.RESULTS_AGGREGATOR),
+            on_result,
+            on_error,
+            parallel=self.solve_in_parallel.get(),
+            cancellation_token=cancellation_token,
+            timing_callback=on_timing_span
+        )
+
+    def sweep_parameters(self):
+        if self.dataset is None:
+            self.log('Dataset is empty', Severity.ERROR)
+            return
+        if not self.validate_model():
+            self.log('Failed to run parameter sweep, model is not valid', Severity.ERROR)
+            return
+        try:
+            from utils.tk.ParameterSweepDialog import ParameterSweepDialog
+            ParameterSweepDialog(
+                self.root,
+                'Parameter sweep',
+                self.parameters.get_parameter(RORParameter.EPS),
+                self.parameters.get_parameter(RORParameter.RESULTS_AGGREGATOR),
+                on_submit_callback=self.__run_sweep
+            )
+        except Exception as e:
+            self.log(f'Failed to run parameter sweep, error: {e}', Severity.ERROR)
+            if self.debug:
+                raise e
+
+    def __run_sweep(self, data: ParameterSweepDialogResult):
+        from utils.parameter_sweep import expand_sweep_grid, run_sweep
+        from utils.SweepResultWindow import SweepResultWindow
+        configurations = expand_sweep_grid(*data)
+        self.log(f'Running parameter sweep with {len(configurations)} configurations')
+        # use snapshots of dataset and parameters so next runs are not affected by changes in those
+        # variables
+        dataset = self.snapshots.get_dataset(self.dataset)
+        parameters = self.snapshots.get_parameters(self.parameters)
+        tab = ttk.Frame(self.main_tab)
+        tab.rowconfigure(0, weight=1)
+        tab.columnconfigure(0, weight=1)
+        now_str = datetime.now().strftime("%H:%M:%S")
+        tab_title = f'Sweep {now_str}, {self.current_filename.split(path.sep)[-1]}'
+        self.main_tab.add(tab, text=tab_title)
+        self.main_tab.select(len(self.main_tab.tabs())-1)
+        cancellation_token = CancellationToken()
+        sweep_window = SweepResultWindow(
+            self.log,
+            dataset.alternatives,
+            tab,
+            self.on_result_close,
+            cancellation_token
+        )
+        self.result_windows[tab] = sweep_window
+
+        def on_state_changed(state: SolveJobState):
+            if tab not in self.result_windows:
+                return
+            if state == SolveJobState.QUEUED:
+                sweep_window.set_status('Waiting in the queue for a free solver')
+            self.main_tab.tab(tab, text=f'{tab_title} ({state.value})')
+
+        def start(job: SolveJob):
+            def on_progress(progress: ProcessingCallbackData, eta: float):
+                if tab in self.result_windows:
+                    sweep_window.report_progress(progress, eta)
+
+            progress_channel = ProgressChannel(self.root, on_progress).start()
+
+            def task(background_task: BackgroundTask):
+                return run_sweep(
+                    dataset,
+                    parameters,
+                    configurations,
+                    progress_channel.report,
+                    cancellation_token
+                )
+
+            def on_result(results: List[Dict[str, Any]]):
+                progress_channel.flush()
+                job.finish(SolveJobState.DONE)
+                self.log(f'Finished parameter sweep with {len(configurations)} configurations', Severity.SUCCESS)
+                if tab in self.result_windows:
+                    sweep_window.set_results(results)
+
+            def on_error(e: Exception):
+                progress_channel.flush()
+                if isinstance(e, SolveCancelledException):
+                    job.finish(SolveJobState.CANCELLED)
+                    self.log('Parameter sweep was cancelled', Severity.WARNING)
+                    if tab in self.result_windows:
+                        sweep_window.set_cancelled()
+                    return
+                job.finish(SolveJobState.FAILED)
+                self.log(f'Failed to run parameter sweep: {e}', Severity.ERROR)
+
+            BackgroundTask(self.root, task, on_result, on_error).start()
+
+        job = self.solve_scheduler.submit(start, on_state_changed)
+        sweep_window.set_job(job)
+
+    def solve(self):
+        if not self.validate_model():
+            self.log('Failed to solve model, model is not valid', Severity.ERROR)
+            return
+
+        def on_weighted_window_parameters_set(parameters: WeightedAggregatorOptionsDialogResult):
+            try:
+                alpha_with_weights, resolver = parameters
+                weights: List[float] = [item.weight for item in alpha_with_weights]
+                alpha_values: List[float] = [item.alpha_value for item in alpha_with_weights]
+                new_parameters = self.parameters.deep_copy()
+                
+                new_parameters.add_parameter(RORParameter.ALPHA_WEIGHTS, weights)
+                new_parameters.add_parameter(RORParameter.NUMBER_OF_ALPHA_VALUES, len(alpha_values))
+                new_parameters.add_parameter(RORParameter.ALPHA_VALUES, alpha_values)
+                new_parameters.add_parameter(RORParameter.TIE_RESOLVER, resolver)
+                alpha_with_weights = ', '.join(
+                    [f'<alpha: {i.alpha_value}, weight: {i.weight}>' for i in alpha_with_weights]
+                )
+                self.log(f'Setting alpha values with weights {alpha_with_weights}')
+                # use a snapshot of dataset so next runs are not affected by changes in it
+                self.__run_solver(self.snapshots.get_dataset(self.dataset), new_parameters)
+            except Exception as e:
+                self.log(f'Failed to run solver with weighted aggregator: {e}', Severity.ERROR)
+                if self.debug:
+                    raise e
+
+        def on_borda_copeland_window_parameters_set(parameters: BordaCopelandAggregatorOptionsDialogResult):
+            try:
+                alpha_values_count, voting_method_name = parameters
+                new_parameters = self.parameters.deep_copy()
+                new_parameters.add_parameter(RORParameter.NUMBER_OF_ALPHA_VALUES, alpha_values_count)
+                self.log(f'Running {voting_method_name} aggregator with {alpha_values_count} alpha values.')
+                # use a snapshot of dataset so next runs are not affected by changes in it
+                self.__run_solver(self.snapshots.get_dataset(self.dataset), new_parameters)
+            except Exception as e:
+                self.log(f'Failed to run solver with {voting_method_name} aggregator: {e}', Severity.ERROR)
+                if self.debug:
+                    raise e
+        
+        def on_default_window_parameters_set(parameters: DefaultAggregatorOptionsDialogResult):
+            try:
+                resolver = parameters
+                new_parameters = self.parameters.deep_copy()
+                new_parameters.add_parameter(RORParameter.TIE_RESOLVER, resolver)
+                self.log(f'Running Default aggregator with {resolver} resolver.')
+                self.__run_solver(self.snapshots.get_dataset(self.dataset), new_parameters)
+            except Exception as e:
+                self.log(f'Failed to run solver with default aggregator: {e}', Severity.ERROR)
+                if self.debug:
+                    raise e
+
+        method_name = self.parameters.get_parameter(RORParameter.RESULTS_AGGREGATOR)
+        if method_name == 'WeightedResultAggregator':
+            try:
+                from utils.tk.WeightedAggregatorOptionsDialog import WeightedAggregatorOptionsDialog
+                weights = self.parameters.get_parameter(RORParameter.ALPHA_WEIGHTS)
+                alpha_values = self.parameters.get_parameter(RORParameter.ALPHA_VALUES)
+                WeightedAggregatorOptionsDialog(
+                    self.root,
+                    'Add parameters for weighted aggregator',
+                    on_submit_callback=on_weighted_window_parameters_set,
+                    submit_button_text='Solve',
+                    weights=weights,
+                    alpha_values=alpha_values
+                )
+            except Exception as e:
+                self.log(f'Failed to use weighted aggregator, error: {e}', Severity.ERROR)
+                if self.debug:
+                    raise e
+        elif method_name in ['BordaResultAggregator', 'CopelandResultAggregator']:
+            voting_method_name = 'Borda' if method_name == 'BordaResultAggregator' else 'Copeland'
+            try:
+                from utils.tk.BordaAggregatorOptionsDialog import BordaCopelandAggregatorOptionsDialog
+                BordaCopelandAggregatorOptionsDialog(
+                    self.root,
+                    f'Add parameters for {voting_method_name} aggregator',
+                    voting_method_name,
+                    on_submit_callback=on_borda_copeland_window_parameters_set
+                )
+            except Exception as e:
+                self.log(f'Failed to use {voting_method_name} aggregator, error: {e}', Severity.ERROR)
+                if self.debug:
+                    raise e
+        elif method_name == 'DefaultResultAggregator':
+            try:
+                from utils.tk.DefaultAggregatorOptionsDialog import DefaultAggregatorOptionsDialog
+                DefaultAggregatorOptionsDialog(
+                    self.root,
+                    'Add parameters for Default aggregator',
+                    on_submit_callback=on_default_window_parameters_set
+                )
+            except Exception as e:
+                self.log(f'Failed to use default aggregator, error: {e}', Severity.ERROR)
+                if self.debug:
+                    raise e
+        else:
+            # use snapshots of dataset and parameters so next runs are not affected by changes in those
+            # variables
+            self.__run_solver(self.snapshots.get_dataset(self.dataset), self.snapshots.get_parameters(self.parameters))
+
+    def on_result_close(self, tab_frame: ttk.Frame):
+        self.result_windows[tab_frame].master.destroy()
+        del self.result_windows[tab_frame]
+    '''
+    Returns information box that consumes 80% of the height of the information tab
+    and information bottom box that takes 10% of the height of the information tab
+    '''
+
+    def create_information_tab(self) -> Tuple[ttk.Frame, ttk.Frame]:
+        if 'information' in self.root_frames:
+            self.root_frames['information'].destroy()
+        information_frame = ttk.Frame(self.root, padding=2)
+        information_frame.rowconfigure(0, weight=8)
+        information_frame.rowconfigure(1, weight=1)
+        information_frame.columnconfigure(0, weight=1)
+        information_frame.grid(
+            column=1, row=0, sticky=(tk.N, tk.E, tk.S, tk.W))
+        self.root_frames['information'] = information_frame
+        information_box = ScrollableFrame(information_frame)
+        information_box.grid(row=0, column=0, sticky=tk.NSEW)
+        information_box_bottom = ttk.Frame(information_frame, padding=2)
+        information_box_bottom.grid(row=1, column=0, sticky=tk.NSEW)
+        return information_box.frame, information_box_bottom
+
+    def try_to_validate_epsilion_value(self) -> Tuple[bool, float]:
+        new_value = self.epsilion_value.get()
+        float_value: float = 0.0
+        try:
+            float_value = float(new_value)
+            if float_value < 0.0:
+                self.log('Epsilion value cannot be lower than 0', Severity.ERROR)
+                return (False, None)
+            return (True, float_value)
+        except:
+            self.log(f'Failed set epsilion value. Failed to parse float value from {new_value}', Severity.ERROR)
+            return (False, None)
+
+    def show_information_tab(self):
+        if self.dataset is None:
+            self.log('No dataset available', Severity.ERROR)
+        if self.current_filename is None or self.current_filename == '':
+            self.log('Filename is invalid', Severity.ERROR)
+        from utils.AggregationWidget import AggregationWidget
+        from utils.PreferenceIntensityRelationsFrame import PreferenceIntensityRelationsFrame
+        from utils.PreferenceRelationsFrame import PreferenceRelationsFrame
+        filename = self.current_filename
+        # information frame
+        information_box, information_box_bottom = self.create_information_tab()
+        self.information_box = information_box
+        ttk.Label(information_box, text='Information about opened file').pack(
+            anchor=tk.N, fill=tk.X)
+        ttk.Separator(information_box, orient='horizontal').pack(fill='x')
+        ttk.Label(information_box, text='Filename: ').pack(
+            anchor=tk.N, fill=tk.X)
+        ttk.Label(information_box, text=filename).pack(anchor=tk.N, fill=tk.X)
+        ttk.Separator(information_box, orient='horizontal').pack(fill='x')
+        self.epsilion_value.set(self.parameters.get_parameter(RORParameter.EPS))
+        ttk.Label(information_box, text=f'Epsilon value:').pack(anchor=tk.N, fill=tk.X)
+        name_entry = ttk.Entry(information_box, textvariable=self.epsilion_value,width=10)
+        name_entry.pack(anchor=tk.NW)
+        ttk.Separator(information_box, orient='horizontal').pack(fill='x')
+        precision = self.parameters.get_parameter(RORParameter.PRECISION)
+        ttk.Label(information_box, text=f'Display precision: {precision}').pack(anchor=tk.N, fill=tk.X)
+        ttk.Separator(information_box, orient='horizontal').pack(fill='x')
+        ttk.Label(information_box, text=f'Number of alternatives: {len(self.dataset.alternatives)}').pack(
+            anchor=tk.N, fill=tk.X)
+        ttk.Separator(information_box, orient='horizontal').pack(fill='x')
+        ttk.Label(information_box, text=f'Number of criteria: {len(self.dataset.criteria)}').pack(
+            anchor=tk.N, fill=tk.X)
+        ttk.Separator(information_box, orient='horizontal').pack(fill='x')
+        ttk.Label(information_box, text=f'Criteria:').pack(
+            anchor=tk.N, fill=tk.X)
+        for index, (criterion_name, criterion_type) in enumerate(self.dataset.criteria):
+            type_name = 'cost' if criterion_type == CRITERION_TYPES['cost'] else 'gain'
+            ttk.Label(
+                information_box, text=f'{index+1}. {criterion_name}, type: {type_name}').pack(anchor=tk.N, fill=tk.X)
+        ttk.Separator(information_box, orient='horizontal').pack(fill='x')
+        ttk.Label(information_box, text=f'Alpha values:').pack(
+            anchor=tk.N, fill=tk.X)
+        alpha_values_box = tk.Frame(information_box)
+        alpha_values_box.pack(anchor=tk.NW, fill=tk.X)
+        scrollbar = tk.Scrollbar(alpha_values_box)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.alpha_values_list = tk.Listbox(alpha_values_box, height=5, yscrollcommand=scrollbar.set)
+        scrollbar.config(command=self.alpha_values_list.yview)
+        self.alpha_values_list.pack(anchor=tk.N, fill=tk.X)
+        for index, alpha_value in enumerate(self.parameters.get_parameter(RORParameter.ALPHA_VALUES)):
+            self.alpha_values_list.insert(index, f'{index+1}. Alpha value: {alpha_value}')
+
+        ttk.Separator(information_box, orient='horizontal').pack(fill='x')
+        ttk.Label(information_box, text=f'Relations').pack(
+            anchor=tk.N, fill=tk.X)
+        tab_control = ttk.Notebook(information_box)
+        preference_relations_tab = ttk.Frame(tab_control)
+        intensity_relations_tab = ttk.Frame(tab_control)
+
+        tab_control.add(preference_relations_tab, text='Preference relations')
+        tab_control.add(intensity_relations_tab, text='Intensity relations')
+        tab_control.pack(anchor=tk.N, fill=tk.BOTH)
+
+        preference_frame = PreferenceRelationsFrame(preference_relations_tab, self.dataset, True, self.log)
+        preference_frame.pack(anchor=tk.N, fill=tk.X)
+
+        preference_intensity_frame = PreferenceIntensityRelationsFrame(intensity_relations_tab, self.dataset, True, self.log)
+        preference_intensity_frame.pack(anchor=tk.N, fill=tk.X)
+        
+        ttk.Separator(information_box, orient='horizontal').pack(fill='x')
+        ttk.Label(information_box, text=f'Aggregation method').pack(
+            anchor=tk.N, fill=tk.X)
+        self.aggregation_method = AggregationWidget(
+            information_box,
+            self.parameters.get_parameter(RORParameter.RESULTS_AGGREGATOR)
+        )
+
+        # bottom tab buttons
+        information_box_bottom.columnconfigure(0, weight=1)
+        information_box_bottom.columnconfigure(1, weight=1)
+        information_box_bottom.rowconfigure(0, weight=1)
+        information_box_bottom.rowconfigure(1, weight=1)
+        ttk.Button(
+            master=information_box_bottom,
+            text='Solve',
+            command=lambda: self.solve()
+        ).grid(column=0, row=0, sticky=tk.N)
+        ttk.Button(
+            master=information_box_bottom,
+            text='Save problem',
+            command=lambda: self.save_file()
+        ).grid(column=1, row=0, sticky=tk.N)
+        ttk.Button(
+            master=information_box_bottom,
+            text='Cancel changes',
+            command=lambda: self.cancel_changes()
+        ).grid(column=0, row=1, sticky=tk.N)
+        ttk.Button(
+            master=information_box_bottom,
+            text='Close file',
+            command=lambda: self.close_file()
+        ).grid(column=1, row=1, sticky=tk.N)
+
+    def hide_information_tab(self):
+        information_box, information_box_bottom = self.create_information_tab()
+        ttk.Label(information_box, text='No file is opened').pack(
+            anchor=tk.N, fill=tk.X)
+        # bottom tab buttons
+        information_box_bottom.columnconfigure(0, weight=1)
+        information_box_bottom.rowconfigure(0, weight=1)
+        ttk.Button(
+            master=information_box_bottom,
+            text='Open file',
+            command=lambda: self.open_file_dialog()
+        ).grid(column=0, row=0)
+
+    def log(self, message: str, severity: Severity = Severity.INFO):
+        '''
+        Logs message to a console with specified severity.
+        '''
+        if self.log_console is None:
+            return
+        data = f'[{get_log_time()}][{severity.value}]: {message}\n'
+        self.log_console.add_log(data, severity)
+
+    def run(self):
+        self.root.mainloop()
@@ -0,0 +1,138 @@
+import tkinter as tk
+from tkinter import ttk
+from tkinter.filedialog import asksaveasfilename
+from typing import Any, List
+
+from utils.Severity import Severity
+from utils.rank_helpers import get_rank_groups
+from utils.type_aliases import LoggerFunc
+
+
+class RankCanvas(ttk.Frame):
+    '''
+    Draws rank directly on a canvas from positions of alternatives in the rank,
+    so displaying it doesn't need the image file created by the solver.
+    Each position is a row, tied alternatives are drawn in the same row
+    inside a dashed frame and consecutive positions are connected with arrows.
+    Rank is drawn when load_image is called, the same as in ImageDisplay.
+    '''
+    ROW_HEIGHT = 70
+    BOX_WIDTH = 120
+    BOX_HEIGHT = 30
+    BOX_SPACING = 10
+    MARGIN = 20
+    # space on the left side for the position numbers
+    POSITION_LABEL_WIDTH = 40
+    MAX_LABEL_LENGTH = 14
+    POSTSCRIPT_EXTENSION = 'ps'
+
+    def __init__(self, logger: LoggerFunc, root: tk.Tk, rank: Any, rank_name: str):
+        ttk.Frame.__init__(self, master=root)
+        self.__logger: LoggerFunc = logger
+        self.__rank = rank
+        self.__rank_name: str = rank_name
+        self.__is_drawn: bool = False
+        ttk.Label(self, text=f'Name: {rank_name}', font=("Arial", 14)).pack(anchor=tk.NW, fill=tk.X)
+        ttk.Button(self, text='Save as PostScript', command=self.save_postscript)\
+            .pack(anchor=tk.NW)
+        frame = ttk.Frame(self)
+        frame.pack(side='top', fill=tk.BOTH, expand=1)
+        frame.rowconfigure(0, weight=1)
+        frame.columnconfigure(0, weight=1)
+        self.__canvas = tk.Canvas(frame, bd=0, highlightthickness=0, background='white')
+        self.__canvas.grid(row=0, column=0, sticky=tk.NSEW)
+        vertical_scrollbar = ttk.Scrollbar(frame, orient=tk.VERTICAL, command=self.__canvas.yview)
+        vertical_scrollbar.grid(row=0, column=1, sticky=tk.NS)
+        horizontal_scrollbar = ttk.Scrollbar(frame, orient=tk.HORIZONTAL, command=self.__canvas.xview)
+        horizontal_scrollbar.grid(row=1, column=0, sticky=tk.EW)
+        self.__canvas.configure(
+            yscrollcommand=vertical_scrollbar.set,
+            xscrollcommand=horizontal_scrollbar.set
+        )
+
+    @property
+    def image_name(self) -> str:
+        return self.__rank_name
+
+    @property
+    def is_loaded(self) -> bool:
+        return self.__is_drawn
+
+    def load_image(self):
+        if self.__is_drawn:
+            return
+        self.__draw()
+        self.__is_drawn = True
+
+    def release_image(self):
+        self.__canvas.delete('all')
+        self.__is_drawn = False
+
+    def __get_label(self, alternative: str) -> str:
+        if len(alternative) > RankCanvas.MAX_LABEL_LENGTH:
+            return f'{alternative[:RankCanvas.MAX_LABEL_LENGTH - 1]}…'
+        return alternative
+
+    def __draw(self):
+        # alternatives grouped by their position, tied alternatives are in the same group
+        positions: List[List[str]] = get_rank_groups(self.__rank)
+        if len(positions) == 0:
+            return
+        widest_row = max(len(alternatives) for alternatives in positions)
+        rows_width = widest_row * RankCanvas.BOX_WIDTH + (widest_row - 1) * RankCanvas.BOX_SPACING
+        center_x = RankCanvas.MARGIN + RankCanvas.POSITION_LABEL_WIDTH + rows_width / 2
+        for index, alternatives in enumerate(positions):
+            top = RankCanvas.MARGIN + index * RankCanvas.ROW_HEIGHT
+            center_y = top + RankCanvas.BOX_HEIGHT / 2
+            self.__canvas.create_text(
+                RankCanvas.MARGIN, center_y,
+                text=f'{index + 1}.', anchor=tk.W, font=('Arial', 11, 'bold')
+            )
+            width = len(alternatives) * RankCanvas.BOX_WIDTH + (len(alternatives) - 1) * RankCanvas.BOX_SPACING
+            left = center_x - width / 2
+            if len(alternatives) > 1:
+                # frame around tied alternatives
+                self.__canvas.create_rectangle(
+                    left - 5, top - 5, left + width + 5, top + RankCanvas.BOX_HEIGHT + 5,
+                    dash=(4, 2), outline='gray50'
+                )
+            for alternative in alternatives:
+                self.__canvas.create_rectangle(
+                    left, top, left + RankCanvas.BOX_WIDTH, top + RankCanvas.BOX_HEIGHT,
+                    fill='#f6f4f2', outline='black'
+                )
+                self.__canvas.create_text(
+                    left + RankCanvas.BOX_WIDTH / 2, center_y,
+                    text=self.__get_label(alternative), font=('Arial', 10)
+                )
+                left += RankCanvas.BOX_WIDTH + RankCanvas.BOX_SPACING
+            if index < len(positions) - 1:
+                self.__canvas.create_line(
+                    center_x, top + RankCanvas.BOX_HEIGHT + 5,
+                    center_x, top + RankCanvas.ROW_HEIGHT - 5,
+                    arrow=tk.LAST
+                )
+        _, _, x2, y2 = self.__canvas.bbox('all')
+        self.__canvas.configure(scrollregion=(0, 0, x2 + RankCanvas.MARGIN, y2 + RankCanvas.MARGIN))
+
+    def save_postscript(self):
+        self.load_image()
+        bounding_box = self.__canvas.bbox('all')
+        if bounding_box is None:
+            self.__logger('Rank is empty, nothing to save', Severity.WARNING)
+            return
+        filename = asksaveasfilename(
+            initialfile=f'{self.__rank_name.replace(" ", "_")}.{RankCanvas.POSTSCRIPT_EXTENSION}',
+            defaultextension=f'.{RankCanvas.POSTSCRIPT_EXTENSION}',
+            title='Save rank'
+        )
+        if filename is None or filename == '':
+            self.__logger('Cancelled file saving')
+            return
+        _, _, x2, y2 = bounding_box
+        try:
+            self.__canvas.postscript(file=filename, x=0, y=0, width=x2 + RankCanvas.MARGIN, height=y2 + RankCanvas.MARGIN)
+        except tk.TclError as e:
+            self.__logger(f'Failed to save rank to {filename}: {e}', Severity.ERROR)
+            return
+        self.__logger(f'Saved rank to {filename}', Severity.SUCCESS)
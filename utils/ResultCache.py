@@ -0,0 +1,143 @@
+from __future__ import annotations
+from collections import OrderedDict
+import logging
+import os
+import pickle
+import threading
+from typing import TYPE_CHECKING, List, Optional
+
+from utils.cache_helpers import get_cache_directory
+
+if TYPE_CHECKING:
+    from ror.RORResult import RORResult
+
+DEFAULT_MEMORY_ENTRIES = 16
+DEFAULT_DISK_BUDGET_BYTES = 512 * 1024 * 1024
+CACHE_FILE_EXTENSION = 'pickle'
+
+
+class ResultCache:
+    '''
+    Two tier cache for solver results. Recently used results are kept in memory
+    (LRU with a limited number of entries), all results are also pickled
+    to the disk, where the least recently used files are removed when
+    the directory exceeds its size budget.
+    Keys are produced by utils.cache_helpers.get_result_key.
+    Memory and disk tiers have separate locks, so remembering a result
+    doesn't wait until another result is written to the disk.
+    '''
+
+    def __init__(
+        self,
+        max_memory_entries: int = DEFAULT_MEMORY_ENTRIES,
+        max_disk_size: int = DEFAULT_DISK_BUDGET_BYTES,
+        directory: str = None
+    ) -> None:
+        self.__max_memory_entries: int = max_memory_entries
+        self.__max_disk_size: int = max_disk_size
+        self.__directory: str = directory if directory is not None else get_cache_directory('results')
+        self.__memory: OrderedDict[str, RORResult] = OrderedDict()
+        self.__lock: threading.Lock = threading.Lock()
+        self.__disk_lock: threading.Lock = threading.Lock()
+
+    def __get_filename(self, key: str) -> str:
+        return os.path.join(self.__directory, f'{key}.{CACHE_FILE_EXTENSION}')
+
+    def __remember(self, key: str, result: RORResult):
+        self.__memory[key] = result
+        self.__memory.move_to_end(key)
+        while len(self.__memory) > self.__max_memory_entries:
+            self.__memory.popitem(last=False)
+
+    def get(self, key: str) -> Optional[RORResult]:
+        '''
+        Returns result from memory or loads it from the disk, which can take a while
+        for large results, so it should be called on a worker thread.
+        '''
+        with self.__lock:
+            result = self.__memory.get(key)
+            if result is not None:
+                self.__memory.move_to_end(key)
+        if result is None:
+            with self.__disk_lock:
+                result = self.__load_from_disk(key)
+            if result is not None:
+                self.remember(key, result)
+        return result
+
+    def remember(self, key: str, result: RORResult):
+        '''
+        Adds result to the memory tier only, it is cheap enough for the Tk thread.
+        '''
+        if result is None:
+            return
+        with self.__lock:
+            self.__remember(key, result)
+
+    def save(self, key: str, result: RORResult):
+        '''
+        Pickles result to the disk tier and evicts old entries, should be called on a worker thread.
+        '''
+        if result is None:
+            return
+        with self.__disk_lock:
+            self.__save_to_disk(key, result)
+
+    def put(self, key: str, result: RORResult):
+        self.remember(key, result)
+        self.save(key, result)
+
+    def clear(self):
+        with self.__lock:
+            self.__memory.clear()
+        with self.__disk_lock:
+            for filename in self.__get_disk_entries():
+                os.remove(filename)
+
+    def __load_from_disk(self, key: str) -> Optional[RORResult]:
+        filename = self.__get_filename(key)
+        if not os.path.exists(filename):
+            return None
+        try:
+            with open(filename, 'rb') as file:
+                result = pickle.load(file)
+            # update access time used for eviction
+            os.utime(filename)
+            return result
+        except Exception as e:
+            logging.warning(f'Failed to load cached result from {filename}: {e}')
+            os.remove(filename)
+            return None
+
+    def __save_to_disk(self, key: str, result: RORResult):
+        filename = self.__get_filename(key)
+        temporary_filename = f'{filename}.tmp'
+        try:
+            with open(temporary_filename, 'wb') as file:
+                pickle.dump(result, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary_filename, filename)
+        except Exception as e:
+            # result stays in the memory tier
+            logging.warning(f'Failed to save result to cache file {filename}: {e}')
+            if os.path.exists(temporary_filename):
+                os.remove(temporary_filename)
+            return
+        self.__evict_from_disk()
+
+    def __get_disk_entries(self) -> List[str]:
+        return [
+            os.path.join(self.__directory, filename)
+            for filename in os.listdir(self.__directory)
+            if filename.endswith(f'.{CACHE_FILE_EXTENSION}')
+        ]
+
+    def __evict_from_disk(self):
+        entries = [(filename, os.stat(filename)) for filename in self.__get_disk_entries()]
+        # least recently used first
+        entries.sort(key=lambda entry: entry[1].st_mtime)
+        total_size = sum(stat.st_size for _, stat in entries)
+        for filename, stat in entries:
+            if total_size <= self.__max_disk_size:
+                break
+            os.remove(filename)
+            total_size -= stat.st_size
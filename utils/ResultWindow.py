@@ -1,8 +1,11 @@
+from collections import OrderedDict
+import copy
 from math import floor
+import os
 import tkinter as tk
 from tkinter import ttk
 from tkinter.filedialog import askdirectory, asksaveasfilename
-from typing import Callable, List, Tuple
+from typing import Any, Callable, List, Tuple, Union
 from ror.Dataset import RORDataset
 from ror.RORParameters import RORParameters
 from ror.RORResult import RORResult
@@ -11,6 +14,9 @@ from ror.CopelandTieResolver import CopelandTieResolver
 from ror.NoTieResolver import NoTieResolver
 from ror.loader_utils import RORParameter
 from ror.ror_solver import ProcessingCallbackData
+from utils.AggregateResultFrame import AggregateResultFrame
+from utils.BackgroundTask import BackgroundTask
+from utils.CancellationToken import CancellationToken
 from utils.ExplainAlternatives import ExplainAlternatives
 from utils.PreferenceRelationsFrame import PreferenceRelationsFrame
 from utils.PreferenceIntensityRelationsFrame import PreferenceIntensityRelationsFrame
@@ -21,13 +27,23 @@ from ror.CopelandResultAggregator import CopelandResultAggregator
 
 from utils.ProgressBar import ProgressBar
 from utils.Table import Table
+from utils.VirtualTable import VirtualTable
 from utils.image_helper import ImageDisplay
+from utils.RankCanvas import RankCanvas
+from utils.PhaseTimer import PhaseTimer, TimingSpan, spans_to_json
+from utils.solver_helpers import aggregate_result
 from utils.Severity import Severity
+from utils.SolveScheduler import SolveJob, SolveJobState
 from utils.tk.BordaVotingResult import BordaVotingResult
 from utils.tk.CopelandVotingResult import CopelandVotingResult
 from utils.tk.io_helper import save_model, save_model_latex
 from utils.type_aliases import LoggerFunc
 
+# decoded images of other rank tabs are released when more tabs were visited
+MAX_LOADED_RANK_IMAGES = 3
+
+RankDisplay = Union[ImageDisplay, RankCanvas]
+
 
 class ResultWindow(ttk.Frame):
     def __init__(
@@ -37,14 +53,22 @@ class ResultWindow(ttk.Frame):
             dataset: RORDataset,
             parameters: RORParameters,
             root: tk.Tk,
-            close_callback: Callable[[tk.Frame], None] = None):
+            close_callback: Callable[[tk.Frame], None] = None,
+            cancellation_token: CancellationToken = None,
+            display_rank_images: bool = False):
         ttk.Frame.__init__(self, master=root)
         self.__logger: LoggerFunc = logger
         self.__window_object: tk.Tk = window_object
         self.__progress_bar: ProgressBar = None
-        self.__results_data: Table = None
+        self.__results_data: VirtualTable = None
         self.__solution_properties_tab: tk.Frame = None
         self.__close_callback = close_callback
+        self.__cancellation_token: CancellationToken = cancellation_token
+        self.__job: SolveJob = None
+        # ranks are drawn on canvas, unless images created by the solver are requested
+        self.__display_rank_images: bool = display_rank_images
+        self.__timing_spans: List[TimingSpan] = []
+        self.__performance_table: Table = None
         self.top_frame: ttk.Frame = None
         self.ranks_tab: ttk.Notebook = None
         self.final_image_frame: tk.Frame = None
@@ -53,6 +77,8 @@ class ResultWindow(ttk.Frame):
         self.__ror_parameters: RORParameters = parameters
         self.__ror_dataset: RORDataset = dataset
         self.__image_count: int = 1
+        # rank images with decoded bitmaps, the most recently selected is the last one
+        self.__loaded_images: OrderedDict[str, RankDisplay] = OrderedDict()
         self.explain_alternatives_object: ExplainAlternatives = None
         self.init_gui()
 
@@ -61,22 +87,57 @@ class ResultWindow(ttk.Frame):
         self.rowconfigure(2, weight=1)
         self.columnconfigure(0, weight=8)
         self.columnconfigure(1, weight=2)
-        self.__progress_bar = ProgressBar(self)
+        on_stop = self.stop_calculations if self.__cancellation_token is not None else None
+        self.__progress_bar = ProgressBar(self, on_stop)
         self.__progress_bar.grid(row=0, column=0, columnspan=2, rowspan=2, sticky=tk.N, pady=50)
         ttk.Button(self, text='Close solution', command=self.close_window)\
             .grid(column=0, columnspan=2, row=2)
         self.ranks_tab = ttk.Notebook(self)
+        # rank images are decoded when their tab is selected
+        self.ranks_tab.bind('<<NotebookTabChanged>>', self.__on_rank_tab_changed)
         self.grid(row=0, column=0, sticky=tk.NSEW)
         self.update()
 
-    def __set_progress(self, value: int, status: str):
-        self.__progress_bar.report_progress(value, status)
-        
-        if self.__progress_bar is not None and value == 100:
+    def __set_progress(self, value: int, status: str, eta: float = None):
+        if self.__progress_bar is None:
+            return
+        self.__progress_bar.report_progress(value, status, eta)
+
+        if value == 100:
             self.__progress_bar.destroy()
             self.__progress_bar = None
 
-    def report_progress(self, data: ProcessingCallbackData):
+    def set_job(self, job: SolveJob):
+        self.__job = job
+
+    def set_job_state(self, state: SolveJobState):
+        if state == SolveJobState.QUEUED:
+            self.__set_progress(0, 'Waiting in the queue for a free solver')
+        elif state == SolveJobState.RUNNING:
+            self.__set_progress(0, 'Starting calculations')
+
+    def stop_calculations(self):
+        if self.__cancellation_token is None or self.__cancellation_token.is_cancelled:
+            return
+        self.__cancellation_token.cancel()
+        if self.__job is not None and self.__job.state == SolveJobState.QUEUED:
+            # job hasn't started yet, remove it from the queue
+            self.__job.cancel()
+            self.set_cancelled()
+            return
+        if self.__progress_bar is not None:
+            self.__progress_bar.disable_stop()
+            self.__progress_bar.report_progress(0, 'Stopping calculations...')
+        self.__logger('Stopping calculations', Severity.WARNING)
+
+    def set_cancelled(self):
+        if self.__progress_bar is not None:
+            self.__progress_bar.destroy()
+            self.__progress_bar = None
+        ttk.Label(self, text='Calculations were cancelled', font=('Arial', 17), foreground='DarkOrange2').\
+            grid(row=0, column=0, columnspan=2, rowspan=2, sticky=tk.N, pady=50)
+
+    def report_progress(self, data: ProcessingCallbackData, eta: float = None):
         if data.progress < 0:
             root = ttk.Frame(self)
             # processing error
@@ -106,10 +167,24 @@ class ResultWindow(ttk.Frame):
                 preferences.pack(anchor=tk.NW, fill=tk.X, expand=1)
             root.grid(row=0, column=0, columnspan=2, rowspan=2, sticky=tk.N)
         else:
-            self.__set_progress(floor(data.progress*100), data.status)
-        self.update()
+            self.__set_progress(floor(data.progress*100), data.status, eta)
 
-    def __add_image(self, image: ImageDisplay, name: str = None):
+    def __create_rank_display(self, rank: Any, rank_name: str) -> RankDisplay:
+        # rank images of cached results could have been removed, then the rank is drawn from its data
+        if self.__display_rank_images and os.path.exists(rank.image_filename):
+            display = ImageDisplay(
+                self.__logger,
+                self.__window_object,
+                self.ranks_tab,
+                rank.image_filename,
+                rank_name
+            )
+        else:
+            display = RankCanvas(self.__logger, self.ranks_tab, rank, rank_name)
+        display.pack(fill=tk.BOTH, expand=1)
+        return display
+
+    def __add_image(self, image: RankDisplay, name: str = None):
         self.ranks_tab.add(
             image,
             text=name if name is not None else str(self.__image_count),
@@ -119,6 +194,24 @@ class ResultWindow(ttk.Frame):
         )
         self.__image_count += 1
 
+    def __on_rank_tab_changed(self, event: tk.Event = None):
+        selected = self.ranks_tab.select()
+        if selected == '':
+            return
+        image: RankDisplay = self.ranks_tab.nametowidget(selected)
+        image.load_image()
+        self.__loaded_images[selected] = image
+        self.__loaded_images.move_to_end(selected)
+        while len(self.__loaded_images) > MAX_LOADED_RANK_IMAGES:
+            _, least_recently_selected = self.__loaded_images.popitem(last=False)
+            least_recently_selected.release_image()
+
+    def __get_result_dataset(self, result: RORResult) -> RORDataset:
+        # results merged from models solved for single alpha values have no model
+        if result.model is not None:
+            return result.model.dataset
+        return self.__ror_dataset
+
     def __display_model_parameters(self, root: ttk.Frame, parameters: RORParameters) -> tk.Frame:
         frame = ttk.Frame(root)
         ttk.Label(frame, text='Parameters', font=('Arial', 17)).pack(anchor=tk.NW)
@@ -206,46 +299,29 @@ class ResultWindow(ttk.Frame):
             self.__logger(f'Saved voting data to: {", ".join(result)}')
 
     def set_result(self, result: RORResult, alternatives: List[str], parameters: RORParameters):
-        # display all ranks
+        # display tabs of all ranks, images are loaded when a tab is selected
         if result is not None:
             self.__ror_result = result
             self.__ror_parameters = parameters
+            timer = PhaseTimer(self.add_timing_span)
+            timer.start_phase('displaying ranks')
             # display ranks
             # notebook tabs exchanges
             # however scrollbar in each tab behaves as one scrollbar - 
             # if you use scrollbar on 2nd tab and then go to the 3rd
             # then focus is not changed to tab3
             self.ranks_tab.grid(row=0, column=1, sticky=tk.NSEW)
-            # def tab_changed(event):
-            #     print('tab has changed', event)
-            # self.ranks_tab.bind("<<NotebookTabChanged>>", tab_changed)
             # display intermediate ranks, associated with alpha values
             for rank in result.intermediate_ranks:
-                alpha_value = rank.alpha_value
-                image_path = rank.image_filename
-                # create window with image
-                image = ImageDisplay(
-                    self.__logger,
-                    self.__window_object,
-                    self.ranks_tab,
-                    image_path,
-                    f'{alpha_value.name} rank'
-                )
-                image.pack(fill=tk.BOTH, expand=1)
-                self.__add_image(image)
+                self.__add_image(self.__create_rank_display(rank, f'{rank.alpha_value.name} rank'))
 
-            final_rank = result.final_rank
-            final_image = ImageDisplay(
-                self.__logger,
-                self.__window_object,
-                self.ranks_tab,
-                final_rank.image_filename,
-                'final rank'
-            )
-            final_image.pack(fill=tk.BOTH, expand=1)
+            final_image = self.__create_rank_display(result.final_rank, 'final rank')
             self.__add_image(final_image, name='final')
 
             self.ranks_tab.select(0)
+            # selecting the already selected tab does not generate the event
+            self.__on_rank_tab_changed()
+            timer.start_phase('displaying result details')
             details_frame = ttk.Frame(self)
             details_frame.grid(row=0, column=0, sticky=tk.NSEW)
 
@@ -257,7 +333,7 @@ class ResultWindow(ttk.Frame):
             data_tab.pack(anchor=tk.NW, fill=tk.BOTH, expand=1)
             self.__overview.add(data_tab, text='Calculated distances')
 
-            self.__results_data = Table(data_tab)
+            self.__results_data = VirtualTable(data_tab)
             ttk.Label(data_tab, text='Distances from alternatives to reference alternative calculated by solving the problem with ROR-distance method')\
                 .pack(anchor=tk.NW)
             self.__results_data.set_alternatives_pandas_data(
@@ -287,7 +363,7 @@ class ResultWindow(ttk.Frame):
             parameters_frame.grid(row=0, sticky=tk.NSEW)
 
             # add preference relations
-            preferences_frame: ttk.Frame = self.__display_model_preferences(self.__solution_properties_tab, result.model.dataset)
+            preferences_frame: ttk.Frame = self.__display_model_preferences(self.__solution_properties_tab, self.__get_result_dataset(result))
             preferences_frame.grid(row=1, sticky=tk.NSEW)
 
             buttons = ttk.Frame(self.__solution_properties_tab)
@@ -315,6 +391,13 @@ class ResultWindow(ttk.Frame):
             )
             self.__overview.add(self.explain_alternatives_object, text='Explain position in rank')
 
+            aggregate_frame = AggregateResultFrame(
+                self.__overview,
+                parameters.get_parameter(RORParameter.RESULTS_AGGREGATOR),
+                self.aggregate_again
+            )
+            self.__overview.add(aggregate_frame, text='Aggregate again')
+
             tie_resolver = result.results_aggregator.tie_resolver
             if tie_resolver is not None and not isinstance(tie_resolver, NoTieResolver):
                 tie_resolver_frame = ttk.Frame(self.__overview)
@@ -328,7 +411,7 @@ class ResultWindow(ttk.Frame):
                         .pack(anchor=tk.NW, fill=tk.BOTH, expand=1)
                 elif isinstance(tie_resolver, CopelandTieResolver):
                     copeland_voter = tie_resolver.voter
-                    CopelandVotingResult(tie_resolver_frame, copeland_voter, result.model.dataset, result.parameters)\
+                    CopelandVotingResult(tie_resolver_frame, copeland_voter, self.__get_result_dataset(result), result.parameters)\
                         .pack(anchor=tk.NW, fill=tk.BOTH, expand=1)
                 else:
                     invalid_resolver = True
@@ -354,7 +437,7 @@ class ResultWindow(ttk.Frame):
                         .pack(anchor=tk.NW, fill=tk.BOTH, expand=1)
                     save_votes_func = result.results_aggregator.voter.save_voting_data
                 elif isinstance(result.results_aggregator, CopelandResultAggregator):
-                    CopelandVotingResult(result_aggregator_data_frame, result.results_aggregator.voter, result.model.dataset, result.parameters)\
+                    CopelandVotingResult(result_aggregator_data_frame, result.results_aggregator.voter, self.__get_result_dataset(result), result.parameters)\
                         .pack(anchor=tk.NW, fill=tk.BOTH, expand=1)
                     save_votes_func = result.results_aggregator.voter.save_voting_data
                 else:
@@ -368,16 +451,99 @@ class ResultWindow(ttk.Frame):
                         text='Save voting data',
                         command=partial(self.save_voting_data, save_votes_func)
                     ).pack(anchor=tk.NW)
+            timer.finish_phase()
+            self.__overview.add(self.__create_performance_tab(self.__overview), text='Performance')
         else:
             self.__logger('Result is none', Severity.ERROR)
 
+    def add_timing_span(self, span: TimingSpan):
+        self.__timing_spans.append(span)
+        if self.__performance_table is not None:
+            self.__update_performance_table()
+
+    def __update_performance_table(self):
+        first_span_start = min(span.start for span in self.__timing_spans) if len(self.__timing_spans) > 0 else 0.0
+        self.__performance_table.set_rows(
+            ['phase', 'start [s]', 'duration [s]'],
+            [
+                [span.name, f'{span.start - first_span_start:.4f}', f'{span.duration:.4f}']
+                for span in sorted(self.__timing_spans, key=lambda span: span.start)
+            ]
+        )
+
+    def __create_performance_tab(self, root: ttk.Notebook) -> ttk.Frame:
+        performance_tab = ttk.Frame(root)
+        performance_tab.pack(anchor=tk.NW, fill=tk.BOTH, expand=1)
+        ttk.Label(performance_tab, text='Time of calculations and displaying the result, measured for each phase')\
+            .pack(anchor=tk.NW)
+        self.__performance_table = Table(performance_tab)
+        self.__update_performance_table()
+        self.__performance_table.pack(anchor=tk.N, fill=tk.BOTH, expand=1)
+        ttk.Button(performance_tab, text='Save timings to json file', padding=10, command=self.save_timings)\
+            .pack(anchor=tk.N)
+        return performance_tab
+
+    def save_timings(self):
+        _filename = asksaveasfilename(
+            defaultextension='.json',
+            title='Save timings'
+        )
+        if _filename is None or _filename == '':
+            self.__logger('Cancelled file saving')
+            return
+        try:
+            with open(_filename, 'w') as file:
+                file.write(spans_to_json(self.__timing_spans))
+        except Exception as e:
+            self.__logger(f'Failed to save file, error: {e}', Severity.ERROR)
+            return
+        self.__logger(f'Saved timings as {_filename}')
+
+    def aggregate_again(self, aggregator_name: str, tie_resolver_name: str):
+        if self.__ror_result is None:
+            self.__logger('Result is none, failed to aggregate intermediate ranks', Severity.ERROR)
+            return
+        parameters = self.__ror_parameters.deep_copy()
+        parameters.add_parameter(RORParameter.RESULTS_AGGREGATOR, aggregator_name)
+        parameters.add_parameter(RORParameter.TIE_RESOLVER, tie_resolver_name)
+        number_of_ranks = len(self.__ror_result.intermediate_ranks)
+        alpha_weights = parameters.get_parameter(RORParameter.ALPHA_WEIGHTS)
+        if alpha_weights is None or len(alpha_weights) != number_of_ranks:
+            # ranks were not calculated by weighted aggregator, use equal weights
+            parameters.add_parameter(RORParameter.ALPHA_WEIGHTS, [1.0] * number_of_ranks)
+        # shallow copy keeps intermediate ranks shared, while the displayed result's
+        # final rank and aggregator stay untouched
+        result = copy.copy(self.__ror_result)
+        self.__logger(f'Aggregating intermediate ranks with {aggregator_name} and {tie_resolver_name}')
+
+        def on_aggregated(aggregated_result: RORResult):
+            if not self.winfo_exists():
+                return
+            final_image = self.__create_rank_display(
+                aggregated_result.final_rank,
+                f'final rank ({aggregator_name}, {tie_resolver_name})'
+            )
+            self.__add_image(final_image, name=f'final {aggregator_name.replace("ResultAggregator", "")}')
+            self.ranks_tab.select(final_image)
+            self.__logger(f'Aggregated intermediate ranks with {aggregator_name}', Severity.SUCCESS)
+
+        def on_error(e: Exception):
+            self.__logger(f'Failed to aggregate intermediate ranks: {e}', Severity.ERROR)
+
+        BackgroundTask(
+            self.__window_object,
+            lambda _: aggregate_result(result, parameters, aggregator_name),
+            on_aggregated,
+            on_error
+        ).start()
+
     def __save_model(self):
         if self.__ror_result is None or self.__ror_parameters is None:
             self.__logger('Data is none, failed to save model', Severity.ERROR)
             return
         save_model(
             self,
-            self.__ror_result.model.dataset,
+            self.__get_result_dataset(self.__ror_result),
             self.__ror_parameters,
             f'{self.__ror_result.results_aggregator.name}_result',
             self.__logger
@@ -387,6 +553,9 @@ class ResultWindow(ttk.Frame):
         if self.__ror_result is None or self.__ror_parameters is None:
             self.__logger('Data is none, failed to save model', Severity.ERROR)
             return
+        if self.__ror_result.model is None:
+            self.__logger('Model is not available for results solved for each alpha value separately', Severity.WARNING)
+            return
         save_model_latex(
             self,
             self.__ror_result.model,
@@ -396,6 +565,11 @@ class ResultWindow(ttk.Frame):
         )
 
     def close_window(self):
+        # stop calculations that are still running for this window
+        if self.__cancellation_token is not None:
+            self.__cancellation_token.cancel()
+        if self.__job is not None:
+            self.__job.cancel()
         if self.__results_data is not None:
             self.__results_data.destroy()
             self.__results_data = None
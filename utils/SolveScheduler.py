@@ -0,0 +1,123 @@
+from collections import deque
+from enum import Enum
+from typing import Callable, Deque, List
+
+
+class SolveJobState(Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+FINAL_JOB_STATES = [SolveJobState.DONE, SolveJobState.FAILED, SolveJobState.CANCELLED]
+
+
+class SolveJob:
+    '''
+    Single solve request managed by SolveScheduler.
+    start is called by the scheduler when there is a free slot, the job's owner
+    must call finish with the final state when calculations end.
+    '''
+
+    def __init__(
+        self,
+        scheduler: 'SolveScheduler',
+        start: Callable[['SolveJob'], None],
+        on_state_changed: Callable[[SolveJobState], None] = None
+    ) -> None:
+        self.__scheduler: 'SolveScheduler' = scheduler
+        self.__start = start
+        self.__on_state_changed = on_state_changed
+        self.__state: SolveJobState = SolveJobState.QUEUED
+
+    @property
+    def state(self) -> SolveJobState:
+        return self.__state
+
+    def _set_state(self, state: SolveJobState):
+        self.__state = state
+        if self.__on_state_changed is not None:
+            self.__on_state_changed(state)
+
+    def _run(self):
+        self._set_state(SolveJobState.RUNNING)
+        self.__start(self)
+
+    def finish(self, state: SolveJobState):
+        assert state in FINAL_JOB_STATES, f'Job can not be finished with state {state}'
+        if self.__state in FINAL_JOB_STATES:
+            return
+        self._set_state(state)
+        self.__scheduler._on_job_finished(self)
+
+    def cancel(self):
+        '''
+        Removes job from the queue if it hasn't started yet.
+        Running jobs must be stopped by their owner.
+        '''
+        if self.__state == SolveJobState.QUEUED:
+            self.__scheduler._remove_from_queue(self)
+            self._set_state(SolveJobState.CANCELLED)
+
+
+class SolveScheduler:
+    '''
+    Queue of solve jobs that runs at most max_running_jobs jobs at once.
+    All methods must be called from the Tk thread.
+    '''
+
+    def __init__(self, max_running_jobs: int) -> None:
+        assert max_running_jobs > 0, 'Number of running jobs must be greater than 0'
+        self.__max_running_jobs: int = max_running_jobs
+        self.__queue: Deque[SolveJob] = deque()
+        self.__running: List[SolveJob] = []
+
+    @property
+    def max_running_jobs(self) -> int:
+        return self.__max_running_jobs
+
+    @max_running_jobs.setter
+    def max_running_jobs(self, value: int):
+        assert value > 0, 'Number of running jobs must be greater than 0'
+        self.__max_running_jobs = value
+        self.__start_jobs()
+
+    @property
+    def queued_jobs(self) -> int:
+        return len(self.__queue)
+
+    @property
+    def running_jobs(self) -> int:
+        return len(self.__running)
+
+    def submit(
+        self,
+        start: Callable[[SolveJob], None],
+        on_state_changed: Callable[[SolveJobState], None] = None
+    ) -> SolveJob:
+        job = SolveJob(self, start, on_state_changed)
+        self.__queue.append(job)
+        job._set_state(SolveJobState.QUEUED)
+        self.__start_jobs()
+        return job
+
+    def __start_jobs(self):
+        while len(self.__queue) > 0 and len(self.__running) < self.__max_running_jobs:
+            job = self.__queue.popleft()
+            self.__running.append(job)
+            try:
+                job._run()
+            except Exception:
+                job.finish(SolveJobState.FAILED)
+                raise
+
+    def _remove_from_queue(self, job: SolveJob):
+        if job in self.__queue:
+            self.__queue.remove(job)
+
+    def _on_job_finished(self, job: SolveJob):
+        if job in self.__running:
+            self.__running.remove(job)
+        self.__start_jobs()
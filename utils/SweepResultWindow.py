@@ -0,0 +1,141 @@
+import csv
+import tkinter as tk
+from tkinter import ttk
+from tkinter.filedialog import asksaveasfilename
+from typing import Any, Callable, Dict, List
+from ror.ror_solver import ProcessingCallbackData
+
+from utils.CancellationToken import CancellationToken
+from utils.ProgressBar import ProgressBar
+from utils.Severity import Severity
+from utils.SolveScheduler import SolveJob, SolveJobState
+from utils.Table import Table
+from utils.type_aliases import LoggerFunc
+
+SWEEP_HEADERS = ['eps', 'alpha values', 'aggregator', 'tie resolver', 'time [s]', 'error']
+
+
+class SweepResultWindow(ttk.Frame):
+    '''
+    Displays results of the parameter sweep in one comparison table.
+    Each row holds one configuration and positions of alternatives in its final rank.
+    '''
+
+    def __init__(
+        self,
+        logger: LoggerFunc,
+        alternatives: List[str],
+        root: tk.Tk,
+        close_callback: Callable[[tk.Frame], None] = None,
+        cancellation_token: CancellationToken = None
+    ):
+        ttk.Frame.__init__(self, master=root)
+        self.__logger: LoggerFunc = logger
+        self.__alternatives: List[str] = alternatives
+        self.__close_callback = close_callback
+        self.__cancellation_token: CancellationToken = cancellation_token
+        self.__progress_bar: ProgressBar = None
+        self.__job: SolveJob = None
+        self.__table: Table = None
+        self.__headers: List[str] = []
+        self.__rows: List[List[str]] = []
+        self.init_gui()
+
+    def init_gui(self):
+        self.rowconfigure(0, weight=9)
+        self.rowconfigure(1, weight=1)
+        self.columnconfigure(0, weight=1)
+        on_stop = self.stop_calculations if self.__cancellation_token is not None else None
+        self.__progress_bar = ProgressBar(self, on_stop)
+        self.__progress_bar.grid(row=0, column=0, sticky=tk.N, pady=50)
+        buttons = ttk.Frame(self)
+        buttons.grid(row=1, column=0)
+        ttk.Button(buttons, text='Save comparison to csv file', command=self.save_data)\
+            .pack(side=tk.LEFT)
+        ttk.Button(buttons, text='Close sweep', command=self.close_window)\
+            .pack(side=tk.LEFT)
+        self.grid(row=0, column=0, sticky=tk.NSEW)
+
+    def report_progress(self, data: ProcessingCallbackData, eta: float = None):
+        if self.__progress_bar is not None:
+            self.__progress_bar.report_progress(round(data.progress*100), data.status, eta)
+
+    def set_job(self, job: SolveJob):
+        self.__job = job
+
+    def stop_calculations(self):
+        if self.__cancellation_token is None or self.__cancellation_token.is_cancelled:
+            return
+        self.__cancellation_token.cancel()
+        if self.__job is not None and self.__job.state == SolveJobState.QUEUED:
+            # sweep hasn't started yet, remove it from the queue
+            self.__job.cancel()
+            self.set_cancelled()
+            return
+        if self.__progress_bar is not None:
+            self.__progress_bar.disable_stop()
+            self.__progress_bar.report_progress(0, 'Stopping calculations...')
+
+    def set_cancelled(self):
+        if self.__progress_bar is not None:
+            self.__progress_bar.destroy()
+            self.__progress_bar = None
+        ttk.Label(self, text='Calculations were cancelled', font=('Arial', 17), foreground='DarkOrange2').\
+            grid(row=0, column=0, sticky=tk.N, pady=50)
+
+    def set_status(self, status: str):
+        if self.__progress_bar is not None:
+            self.__progress_bar.report_progress(0, status)
+
+    def set_results(self, results: List[Dict[str, Any]]):
+        if self.__progress_bar is not None:
+            self.__progress_bar.destroy()
+            self.__progress_bar = None
+        self.__headers = [*SWEEP_HEADERS, *self.__alternatives]
+        self.__rows = []
+        for sweep_result in results:
+            configuration = sweep_result['configuration']
+            positions = sweep_result['positions'] if sweep_result['positions'] is not None else dict()
+            row = [
+                str(configuration.eps),
+                str(configuration.number_of_alpha_values),
+                configuration.results_aggregator,
+                configuration.tie_resolver,
+                f'{sweep_result["time"]:.3f}',
+                sweep_result['error'] if sweep_result['error'] is not None else ''
+            ]
+            row.extend([str(positions.get(alternative, '')) for alternative in self.__alternatives])
+            self.__rows.append(row)
+        self.__table = Table(self)
+        self.__table.set_rows(self.__headers, self.__rows)
+        self.__table.grid(row=0, column=0, sticky=tk.NSEW)
+
+    def save_data(self):
+        if len(self.__rows) < 1:
+            self.__logger('There are no sweep results to save', Severity.WARNING)
+            return
+        _filename = asksaveasfilename(
+            defaultextension='.csv',
+            title='Save sweep results'
+        )
+        if _filename is None or _filename == '':
+            self.__logger('Cancelled file saving')
+            return
+        try:
+            with open(_filename, 'w', newline='') as file:
+                writer = csv.writer(file)
+                writer.writerow(self.__headers)
+                writer.writerows(self.__rows)
+        except Exception as e:
+            self.__logger(f'Failed to save file, error: {e}', Severity.ERROR)
+            return
+        self.__logger(f'Saved file as {_filename}', Severity.SUCCESS)
+
+    def close_window(self):
+        if self.__cancellation_token is not None:
+            self.__cancellation_token.cancel()
+        if self.__job is not None:
+            self.__job.cancel()
+        if self.__close_callback is not None:
+            self.__close_callback(self.master)
+        self.destroy()
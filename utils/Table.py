@@ -1,15 +1,68 @@
+from __future__ import annotations
 from tkinter import ttk
-from typing import List, Tuple, Union
+from typing import TYPE_CHECKING, Any, List, Sequence, Tuple
+import numpy as np
 from ror.Dataset import Dataset
 from ror.dataset_constants import CRITERION_TYPES
-from ror.number_utils import format_number
 import tksheet
-import pandas as pd
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# number of rows converted to python values at once
+FORMATTING_CHUNK_SIZE = 10000
+VALUE_SEPARATOR = '\t'
+
+
+def format_rows(
+    labels: Sequence[Any],
+    values: np.ndarray,
+    precision: int,
+    signs: np.ndarray = None
+) -> List[List[Any]]:
+    '''
+    Returns rows of the sheet: label in the first column and values formatted
+    with the given precision in the rest of columns. Values are multiplied by signs
+    (one per column) with one NumPy operation and each row is formatted with a single
+    string formatting call instead of formatting each value separately.
+    Rows are processed in chunks, so no full copy of values is created.
+    '''
+    values = np.asarray(values, dtype=np.float64)
+    number_of_columns = values.shape[1] if values.ndim == 2 else 0
+    if number_of_columns == 0:
+        return [[label] for label in labels]
+    row_format = VALUE_SEPARATOR.join([f'%.{precision}f'] * number_of_columns)
+    rows: List[List[Any]] = []
+    labels = list(labels)
+    for start in range(0, len(values), FORMATTING_CHUNK_SIZE):
+        chunk = values[start:start + FORMATTING_CHUNK_SIZE]
+        if signs is not None:
+            chunk = chunk * signs
+        rows.extend(
+            [label, *(row_format % tuple(row)).split(VALUE_SEPARATOR)]
+            for label, row in zip(labels[start:start + FORMATTING_CHUNK_SIZE], chunk.tolist())
+        )
+    return rows
+
+
+def get_dataset_headers(data: Dataset) -> List[str]:
+    headers = ["id"]
+    headers.extend([f'{criterion_name} [{criterion_type}]' for (
+        criterion_name, criterion_type) in data.criteria])
+    return headers
+
+
+def get_criteria_signs(data: Dataset) -> np.ndarray:
+    # values of cost type columns are stored flipped, so they are flipped again before displaying
+    return np.array([
+        -1.0 if criterion_type == CRITERION_TYPES["cost"] else 1.0
+        for (_, criterion_type) in data.criteria
+    ])
 
 
 class Table(tksheet.Sheet):
-    def __init__(self, parent: ttk.Frame):
-        super().__init__(parent)
+    def __init__(self, parent: ttk.Frame, **kwargs):
+        super().__init__(parent, **kwargs)
         self.enable_bindings(
             (
                 "single_select",
@@ -23,56 +76,24 @@ class Table(tksheet.Sheet):
         self.destroy()
 
     def set_data(self, data: Dataset, display_precision: int = 2):
-        headers = ["id"]
-        headers.extend([f'{criterion_name} [{criterion_type}]' for (
-            criterion_name, criterion_type) in data.criteria])
-        self.headers(newheaders=headers)
-        # round data - numpy.tolist will convert data to float and the precision will be lost
-        # therefore we can't use it
-        # so we convert data earlier to strings
-        data_str = []
-        for alternative, row in zip(data.alternatives, data.matrix):
-            # add alternative at the first index
-            new_row = [alternative]
-            # add results on the rest of columns, flip values if column is of cost type (already filpped)
-            for (_, criterion_type), value in zip(data.criteria, row):
-                if criterion_type == CRITERION_TYPES["cost"]:
-                    new_row.append(format_number(-value, display_precision))
-                else:
-                    new_row.append(format_number(value, display_precision))
-            # add new row
-            data_str.append(new_row)
-        self.set_sheet_data(data_str)
+        self.headers(newheaders=get_dataset_headers(data))
+        self.set_sheet_data(format_rows(data.alternatives, data.matrix, display_precision, get_criteria_signs(data)))
 
     def set_pandas_data(self, data: pd.DataFrame, display_precision: int = 2, headers=None, indices=None):
         headers: List[str] = list(data.columns) if headers is None else headers
         self.headers(headers)
         rows: List[str] = list(data.index) if indices is None else indices
-        data = data.to_numpy()
-        
-        _data: List[List[str]] = []
-        for row_name, row_data in zip(rows, data):
-            _new_row = [row_name]
-            _new_row.extend([format_number(value, display_precision)
-                           for value in row_data])
-            _data.append(_new_row)
-        self.set_sheet_data(_data)
+        self.set_sheet_data(format_rows(rows, data.to_numpy(), display_precision))
 
     def set_alternatives_pandas_data(self, data: pd.DataFrame, display_precision: int = 2):
         headers = ['alternative']
         headers.extend([item[:12] for item in data.columns])
         self.headers(headers)
-        numpy_data = data.to_numpy()
-        # round data - numpy.tolist will convert data to float and the precision will be lost
-        # therefore we can't use it
-        # so we convert data earlier to strings
-        data_str: List[List[Union[float, str]]] = []
-        for alternative, data in zip(list(data.index), numpy_data):
-            new_row = [alternative]
-            new_row.extend([format_number(value, display_precision)
-                           for value in data])
-            data_str.append(new_row)
-        self.set_sheet_data(data_str)
+        self.set_sheet_data(format_rows(list(data.index), data.to_numpy(), display_precision))
+
+    def set_rows(self, headers: List[str], rows: List[List[str]]):
+        self.headers(headers)
+        self.set_sheet_data(rows)
 
     def set_simple_data(self, data: List[Tuple[str, str]]):
         self.headers(['parameter name', 'value'])
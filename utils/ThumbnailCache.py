@@ -0,0 +1,169 @@
+from collections import OrderedDict
+from math import floor, sqrt
+import os
+import threading
+from typing import List, Optional, Tuple
+import PIL.Image
+
+DEFAULT_MEMORY_BUDGET_BYTES = 128 * 1024 * 1024
+# the largest pyramid level is at most this many times wider than the smallest one
+MAX_PYRAMID_ZOOM = 4
+# the largest pyramid level takes at most this part of the memory budget,
+# all levels together take about a third of it, so they stay in the cache
+MAX_PYRAMID_LEVEL_BUDGET_FRACTION = 0.25
+
+# absolute path, modification time (ns), file size, target width
+ThumbnailKey = Tuple[str, int, int, int]
+
+
+def get_image_size(image: PIL.Image.Image) -> int:
+    return image.width * image.height * len(image.getbands())
+
+
+def get_pyramid_widths(width: int, min_width: int, max_width: int = None) -> List[int]:
+    '''
+    Returns widths of image pyramid levels, from the original width (limited to max_width)
+    halved until it reaches min_width, the last level has exactly min_width.
+    '''
+    if max_width is not None:
+        width = min(width, max_width)
+    widths = []
+    while width > min_width:
+        widths.append(width)
+        width //= 2
+    widths.append(min_width)
+    return widths
+
+
+def rescale_to_width(image: PIL.Image.Image, width: int, original_size: Tuple[int, int], resample: int = None) -> PIL.Image.Image:
+    original_width, original_height = original_size
+    height = max(1, floor(original_height * width / original_width))
+    if resample is None:
+        return image.resize((width, height))
+    return image.resize((width, height), resample)
+
+
+class ThumbnailCache:
+    '''
+    Thread safe LRU cache of decoded images rescaled to a given width.
+    Keys contain modification time and size of the file, so a changed file
+    is decoded again. The least recently used thumbnails are removed
+    when their total size exceeds the memory budget.
+    '''
+
+    def __init__(self, max_size: int = DEFAULT_MEMORY_BUDGET_BYTES) -> None:
+        self.__max_size: int = max_size
+        self.__size: int = 0
+        self.__thumbnails: OrderedDict[ThumbnailKey, PIL.Image.Image] = OrderedDict()
+        self.__lock: threading.Lock = threading.Lock()
+
+    @property
+    def size(self) -> int:
+        return self.__size
+
+    def get_key(self, image_path: str, width: int) -> ThumbnailKey:
+        stat = os.stat(image_path)
+        return (os.path.abspath(image_path), stat.st_mtime_ns, stat.st_size, width)
+
+    def get(self, image_path: str, width: int) -> Optional[PIL.Image.Image]:
+        key = self.get_key(image_path, width)
+        with self.__lock:
+            thumbnail = self.__thumbnails.get(key)
+            if thumbnail is not None:
+                self.__thumbnails.move_to_end(key)
+            return thumbnail
+
+    def put(self, key: ThumbnailKey, thumbnail: PIL.Image.Image):
+        thumbnail_size = get_image_size(thumbnail)
+        if thumbnail_size > self.__max_size:
+            return
+        with self.__lock:
+            if key in self.__thumbnails:
+                self.__size -= get_image_size(self.__thumbnails.pop(key))
+            self.__thumbnails[key] = thumbnail
+            self.__size += thumbnail_size
+            while self.__size > self.__max_size:
+                _, removed = self.__thumbnails.popitem(last=False)
+                self.__size -= get_image_size(removed)
+
+    def load(self, image_path: str, width: int) -> PIL.Image.Image:
+        '''
+        Returns image rescaled to the width (height keeps the aspect ratio),
+        decodes the file only if it is not in the cache. Can be called from any thread.
+        '''
+        key = self.get_key(image_path, width)
+        with self.__lock:
+            thumbnail = self.__thumbnails.get(key)
+            if thumbnail is not None:
+                self.__thumbnails.move_to_end(key)
+                return thumbnail
+        with PIL.Image.open(image_path) as image:
+            thumbnail = rescale_to_width(image, width, image.size)
+        self.put(key, thumbnail)
+        return thumbnail
+
+    def __get_pyramid_widths(self, image: PIL.Image.Image, min_width: int) -> List[int]:
+        # only the header of the image is needed, the full resolution image is never kept,
+        # largest level is limited by the zoom and by the memory budget (its height grows with the width)
+        bytes_per_column = image.height / image.width * len(image.getbands())
+        max_level_size = self.__max_size * MAX_PYRAMID_LEVEL_BUDGET_FRACTION
+        max_width = min(MAX_PYRAMID_ZOOM * min_width, floor(sqrt(max_level_size / bytes_per_column)))
+        return get_pyramid_widths(image.width, min_width, max(min_width, max_width))
+
+    def get_pyramid(self, image_path: str, min_width: int) -> Optional[List[PIL.Image.Image]]:
+        '''
+        Returns levels of the image pyramid if all of them are in the cache, otherwise None.
+        '''
+        with PIL.Image.open(image_path) as image:
+            widths = self.__get_pyramid_widths(image, min_width)
+        levels = [self.get(image_path, width) for width in widths]
+        return levels if all(level is not None for level in levels) else None
+
+    def load_pyramid(self, image_path: str, min_width: int) -> List[PIL.Image.Image]:
+        '''
+        Returns levels of the image pyramid (see get_pyramid_widths), the largest first.
+        The largest level is limited by MAX_PYRAMID_ZOOM and by the memory budget, so tall images
+        don't keep their full resolution bitmap in memory.
+        Each level is downsampled from the previous one and cached as a thumbnail of its width,
+        file is decoded only if any level is not in the cache. Can be called from any thread.
+        '''
+        with PIL.Image.open(image_path) as image:
+            widths = self.__get_pyramid_widths(image, min_width)
+        levels = [self.get(image_path, width) for width in widths]
+        if all(level is not None for level in levels):
+            return levels
+        with PIL.Image.open(image_path) as image:
+            image.load()
+            original_size = image.size
+            previous = image
+            for index, width in enumerate(widths):
+                if levels[index] is None:
+                    if width == original_size[0]:
+                        level = image.copy()
+                    elif 0 < index < len(widths) - 1:
+                        # box filter is fast and good enough for halving
+                        level = rescale_to_width(previous, width, original_size, PIL.Image.Resampling.BOX)
+                    else:
+                        level = rescale_to_width(previous, width, original_size)
+                    self.put(self.get_key(image_path, width), level)
+                    levels[index] = level
+                previous = levels[index]
+        return levels
+
+    def clear(self):
+        with self.__lock:
+            self.__thumbnails.clear()
+            self.__size = 0
+
+
+_thumbnail_cache: ThumbnailCache = None
+
+
+def get_thumbnail_cache() -> ThumbnailCache:
+    '''
+    Returns cache shared by all image displays in the process.
+    '''
+    global _thumbnail_cache
+    if _thumbnail_cache is None:
+        _thumbnail_cache = ThumbnailCache()
+    return _thumbnail_cache
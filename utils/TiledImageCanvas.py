@@ -0,0 +1,178 @@
+import tkinter as tk
+from tkinter import ttk
+from typing import Dict, List, Tuple
+import PIL.Image
+import PIL.ImageTk
+
+TILE_SIZE = 256
+# tiles around the viewport that are kept, so scrolling by a little doesn't create new tiles
+TILE_MARGIN = 1
+SCROLL_UNITS = 3
+
+
+class TiledImageCanvas(ttk.Frame):
+    '''
+    Displays tall images without creating a bitmap of the whole image.
+    Image is given as levels of a pyramid (largest first), the displayed level is cut
+    into tiles and PhotoImages are created only for tiles that intersect the viewport.
+    Zooming in and out switches between levels, so scrolling cost doesn't depend on
+    the image height.
+    '''
+
+    def __init__(self, root: tk.Tk, width: int, height: int = 600):
+        ttk.Frame.__init__(self, master=root)
+        self.__levels: List[PIL.Image.Image] = []
+        self.__level: int = 0
+        self.__tiles: Dict[Tuple[int, int], Tuple[int, PIL.ImageTk.PhotoImage]] = dict()
+        self.__update_scheduled: bool = False
+
+        toolbar = ttk.Frame(self)
+        toolbar.pack(anchor=tk.NW, fill=tk.X)
+        ttk.Button(toolbar, text='-', width=3, command=self.zoom_out).pack(side=tk.LEFT)
+        ttk.Button(toolbar, text='+', width=3, command=self.zoom_in).pack(side=tk.LEFT)
+        self.__zoom_label = ttk.Label(toolbar, padding=(5, 0))
+        self.__zoom_label.pack(side=tk.LEFT)
+
+        frame = ttk.Frame(self)
+        frame.pack(side='top', fill=tk.BOTH, expand=1)
+        frame.rowconfigure(0, weight=1)
+        frame.columnconfigure(0, weight=1)
+        self.__canvas = tk.Canvas(frame, width=width, height=height, bd=0, highlightthickness=0)
+        # bg color for radiance theme, the same as in ScrollableFrame
+        self.__canvas['background'] = '#f6f4f2'
+        self.__canvas.grid(row=0, column=0, sticky=tk.NSEW)
+        self.__vertical_scrollbar = ttk.Scrollbar(frame, orient=tk.VERTICAL, command=self.__canvas.yview)
+        self.__vertical_scrollbar.grid(row=0, column=1, sticky=tk.NS)
+        self.__horizontal_scrollbar = ttk.Scrollbar(frame, orient=tk.HORIZONTAL, command=self.__canvas.xview)
+        self.__horizontal_scrollbar.grid(row=1, column=0, sticky=tk.EW)
+        # any change of the view (scrolling, resizing) updates displayed tiles
+        self.__canvas.configure(
+            yscrollcommand=self.__on_vertical_scroll,
+            xscrollcommand=self.__on_horizontal_scroll
+        )
+        self.__canvas.bind('<MouseWheel>', self.__on_mouse_wheel)
+        self.__canvas.bind('<Button-4>', self.__on_mouse_wheel)
+        self.__canvas.bind('<Button-5>', self.__on_mouse_wheel)
+        self.__canvas.bind('<Control-MouseWheel>', self.__on_zoom_wheel)
+        self.__canvas.bind('<Control-Button-4>', lambda _: self.zoom_in())
+        self.__canvas.bind('<Control-Button-5>', lambda _: self.zoom_out())
+
+    @property
+    def number_of_tiles(self) -> int:
+        return len(self.__tiles)
+
+    @property
+    def has_image(self) -> bool:
+        return len(self.__levels) > 0
+
+    def set_levels(self, levels: List[PIL.Image.Image], level: int = None):
+        '''
+        Displays the image, by default at the smallest level.
+        '''
+        self.__levels = levels
+        self.__set_level(len(levels) - 1 if level is None else level, keep_view=False)
+
+    def clear(self):
+        self.__remove_tiles()
+        self.__levels = []
+        self.__canvas.configure(scrollregion=(0, 0, 0, 0))
+        self.__zoom_label.configure(text='')
+
+    def zoom_in(self):
+        if self.__level > 0:
+            self.__set_level(self.__level - 1)
+
+    def zoom_out(self):
+        if self.__level < len(self.__levels) - 1:
+            self.__set_level(self.__level + 1)
+
+    def __set_level(self, level: int, keep_view: bool = True):
+        if not self.has_image:
+            return
+        # center of the viewport stays in the same place of the image
+        x_first, x_last = self.__canvas.xview()
+        y_first, y_last = self.__canvas.yview()
+        self.__remove_tiles()
+        self.__level = level
+        image = self.__levels[level]
+        self.__canvas.configure(scrollregion=(0, 0, image.width, image.height))
+        # zoom relative to the smallest level, which fits the width of the canvas
+        self.__zoom_label.configure(text=f'{image.width / self.__levels[-1].width:.0%}')
+        if keep_view:
+            x_visible, y_visible = self.__canvas.xview(), self.__canvas.yview()
+            self.__canvas.xview_moveto((x_first + x_last) / 2 - (x_visible[1] - x_visible[0]) / 2)
+            self.__canvas.yview_moveto((y_first + y_last) / 2 - (y_visible[1] - y_visible[0]) / 2)
+        else:
+            self.__canvas.xview_moveto(0)
+            self.__canvas.yview_moveto(0)
+        self.__schedule_update()
+
+    def __remove_tiles(self):
+        self.__canvas.delete('tile')
+        self.__tiles.clear()
+
+    def __on_vertical_scroll(self, first: str, last: str):
+        self.__vertical_scrollbar.set(first, last)
+        self.__schedule_update()
+
+    def __on_horizontal_scroll(self, first: str, last: str):
+        self.__horizontal_scrollbar.set(first, last)
+        self.__schedule_update()
+
+    def __on_mouse_wheel(self, event: tk.Event):
+        if event.num == 4 or event.delta > 0:
+            self.__canvas.yview_scroll(-SCROLL_UNITS, 'units')
+        else:
+            self.__canvas.yview_scroll(SCROLL_UNITS, 'units')
+
+    def __on_zoom_wheel(self, event: tk.Event):
+        if event.delta > 0:
+            self.zoom_in()
+        else:
+            self.zoom_out()
+
+    def __schedule_update(self):
+        # scrolling changes both views, tiles are updated once when Tk is idle
+        if not self.__update_scheduled:
+            self.__update_scheduled = True
+            self.after_idle(self.__update_tiles)
+
+    def __get_visible_tiles(self, image: PIL.Image.Image) -> List[Tuple[int, int]]:
+        left = self.__canvas.canvasx(0)
+        top = self.__canvas.canvasy(0)
+        right = left + self.__canvas.winfo_width()
+        bottom = top + self.__canvas.winfo_height()
+        columns = (image.width + TILE_SIZE - 1) // TILE_SIZE
+        rows = (image.height + TILE_SIZE - 1) // TILE_SIZE
+        first_column = max(0, int(left // TILE_SIZE) - TILE_MARGIN)
+        last_column = min(columns - 1, int(right // TILE_SIZE) + TILE_MARGIN)
+        first_row = max(0, int(top // TILE_SIZE) - TILE_MARGIN)
+        last_row = min(rows - 1, int(bottom // TILE_SIZE) + TILE_MARGIN)
+        return [
+            (column, row)
+            for row in range(first_row, last_row + 1)
+            for column in range(first_column, last_column + 1)
+        ]
+
+    def __update_tiles(self):
+        self.__update_scheduled = False
+        if not self.has_image or not self.winfo_exists():
+            return
+        image = self.__levels[self.__level]
+        visible_tiles = set(self.__get_visible_tiles(image))
+        for tile in [tile for tile in self.__tiles if tile not in visible_tiles]:
+            item, _ = self.__tiles.pop(tile)
+            self.__canvas.delete(item)
+        for column, row in visible_tiles:
+            if (column, row) in self.__tiles:
+                continue
+            left, top = column * TILE_SIZE, row * TILE_SIZE
+            tile_image = PIL.ImageTk.PhotoImage(image.crop((
+                left,
+                top,
+                min(left + TILE_SIZE, image.width),
+                min(top + TILE_SIZE, image.height)
+            )))
+            item = self.__canvas.create_image(left, top, image=tile_image, anchor='nw', tags='tile')
+            # PhotoImage has to be referenced, otherwise the tile is removed from the canvas
+            self.__tiles[(column, row)] = (item, tile_image)
@@ -0,0 +1,276 @@
+from __future__ import annotations
+from collections import OrderedDict
+import tkinter as tk
+from tkinter import ttk
+from typing import TYPE_CHECKING, Any, List, Optional, Sequence
+import numpy as np
+from ror.Dataset import Dataset
+
+from utils.Table import Table, format_rows, get_criteria_signs, get_dataset_headers
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+DEFAULT_PAGE_SIZE = 40
+DEFAULT_PREFETCH_ROWS = 40
+DEFAULT_MAX_CACHED_ROWS = 2000
+# used before the sheet displays any row
+DEFAULT_ROW_HEIGHT = 25
+# above this fraction of changed cells the whole page is replaced instead of single cells
+MAX_CHANGED_CELLS_FRACTION = 0.5
+
+
+class VirtualTable(ttk.Frame):
+    '''
+    Table for large data. The sheet holds only rows visible in the viewport,
+    rows are formatted from the raw values when they are scrolled into view
+    (together with prefetch_rows rows after them) and kept in a bounded LRU cache.
+    Time of setting data doesn't depend on the number of rows. Scrollbar, mouse wheel,
+    Page Up/Down and arrow keys at the edges of the page move the displayed rows.
+    Has the same setters as Table. When new data has the same shape as the displayed data,
+    only changed headers and cells are updated in the sheet.
+    '''
+
+    def __init__(
+        self,
+        parent: ttk.Frame,
+        prefetch_rows: int = DEFAULT_PREFETCH_ROWS,
+        max_cached_rows: int = DEFAULT_MAX_CACHED_ROWS
+    ):
+        ttk.Frame.__init__(self, parent)
+        self.__prefetch_rows: int = prefetch_rows
+        self.__max_cached_rows: int = max_cached_rows
+        self.__labels: List[Any] = []
+        self.__values: np.ndarray = None
+        self.__signs: np.ndarray = None
+        self.__rows: List[List[Any]] = None
+        self.__headers: List[str] = []
+        # copies of rows and index set in the sheet, used to update only changed cells
+        self.__displayed_rows: List[List[Any]] = []
+        self.__displayed_index: List[str] = []
+        self.__precision: int = 2
+        self.__formatted_rows: OrderedDict[int, List[Any]] = OrderedDict()
+        self.__offset: int = 0
+        self.__page_size: int = DEFAULT_PAGE_SIZE
+        self.rowconfigure(0, weight=1)
+        self.columnconfigure(0, weight=1)
+        # sheet is never scrolled vertically, rows are replaced instead
+        self.__sheet: Table = Table(self, show_y_scrollbar=False)
+        self.__sheet.grid(row=0, column=0, sticky=tk.NSEW)
+        self.__scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self.__on_scroll)
+        self.__scrollbar.grid(row=0, column=1, sticky=tk.NS)
+        self.bind('<Configure>', self.__on_resize)
+        for sequence in ['<MouseWheel>', '<Button-4>', '<Button-5>']:
+            self.__sheet.bind(sequence, self.__on_mouse_wheel)
+        # keys are handled before the bindings of the sheet, which can only move
+        # the selection inside the displayed page
+        self.__navigation_tag: str = f'{self}-navigation'
+        for widget in [self.__sheet.MT, self.__sheet.RI, self.__sheet.CH, self.__sheet.TL]:
+            widget.bindtags((self.__navigation_tag, *widget.bindtags()))
+        for sequence, handler in self.__get_navigation_bindings():
+            self.bind_class(self.__navigation_tag, sequence, handler)
+
+    @property
+    def number_of_rows(self) -> int:
+        return len(self.__labels) if self.__rows is None else len(self.__rows)
+
+    def remove_data(self):
+        self.destroy()
+
+    def destroy(self):
+        for sequence, _ in self.__get_navigation_bindings():
+            self.unbind_class(self.__navigation_tag, sequence)
+        super().destroy()
+
+    def clear_source(self):
+        '''
+        Releases displayed data (e.g. memory mapped matrix), displayed cells are kept
+        so they can be compared with the next data.
+        '''
+        self.__labels = []
+        self.__values = None
+        self.__signs = None
+        self.__rows = None
+        self.__formatted_rows.clear()
+
+    def __set_source(
+        self,
+        headers: List[str],
+        labels: Sequence[Any],
+        values: np.ndarray,
+        precision: int,
+        signs: np.ndarray = None,
+        rows: List[List[Any]] = None
+    ):
+        # column widths are kept if the number of columns doesn't change
+        reset_columns = len(headers) != len(self.__headers)
+        if headers != self.__headers:
+            self.__sheet.headers(newheaders=headers, redraw=False)
+            self.__headers = list(headers)
+        self.__labels = list(labels)
+        self.__values = values
+        self.__signs = signs
+        self.__rows = rows
+        self.__precision = precision
+        self.__formatted_rows.clear()
+        self.__offset = 0
+        self.__render(reset_columns=reset_columns)
+
+    def set_data(self, data: Dataset, display_precision: int = 2):
+        # matrix is not copied, rows are read from it when they are displayed
+        self.__set_source(
+            get_dataset_headers(data),
+            data.alternatives,
+            data.matrix,
+            display_precision,
+            get_criteria_signs(data)
+        )
+
+    def set_pandas_data(self, data: pd.DataFrame, display_precision: int = 2, headers=None, indices=None):
+        headers: List[str] = list(data.columns) if headers is None else headers
+        rows: List[str] = list(data.index) if indices is None else indices
+        self.__set_source(headers, rows, data.to_numpy(), display_precision)
+
+    def set_alternatives_pandas_data(self, data: pd.DataFrame, display_precision: int = 2):
+        headers = ['alternative']
+        headers.extend([item[:12] for item in data.columns])
+        self.__set_source(headers, list(data.index), data.to_numpy(), display_precision)
+
+    def set_rows(self, headers: List[str], rows: List[List[str]]):
+        self.__set_source(headers, [], None, self.__precision, rows=rows)
+
+    def set_simple_data(self, data: List[Any]):
+        self.set_rows(['parameter name', 'value'], data)
+
+    def __get_rows(self, start: int, end: int) -> List[List[Any]]:
+        if self.__rows is not None:
+            return self.__rows[start:end]
+        missing = [index for index in range(start, end) if index not in self.__formatted_rows]
+        if len(missing) > 0:
+            # format all missing rows and rows after them with one call
+            format_start = missing[0]
+            format_end = min(self.number_of_rows, missing[-1] + 1 + self.__prefetch_rows)
+            formatted = format_rows(
+                self.__labels[format_start:format_end],
+                self.__values[format_start:format_end],
+                self.__precision,
+                self.__signs
+            )
+            for index, row in enumerate(formatted, start=format_start):
+                self.__formatted_rows[index] = row
+        rows = []
+        for index in range(start, end):
+            self.__formatted_rows.move_to_end(index)
+            rows.append(self.__formatted_rows[index])
+        while len(self.__formatted_rows) > max(self.__max_cached_rows, end - start):
+            self.__formatted_rows.popitem(last=False)
+        return rows
+
+    def __render(self, reset_columns: bool = False):
+        number_of_rows = self.number_of_rows
+        self.__offset = max(0, min(self.__offset, number_of_rows - self.__page_size))
+        end = min(number_of_rows, self.__offset + self.__page_size)
+        # sheet gets copies, so changing its cells doesn't change cached rows
+        rows = [list(row) for row in self.__get_rows(self.__offset, end)]
+        if reset_columns or not self.__update_changed_cells(rows):
+            self.__sheet.set_sheet_data(
+                rows,
+                reset_col_positions=reset_columns,
+                reset_row_positions=len(rows) != len(self.__displayed_rows),
+                redraw=False
+            )
+        self.__displayed_rows = rows
+        # index shows positions of rows in the whole table
+        index = [str(row + 1) for row in range(self.__offset, end)]
+        if index != self.__displayed_index:
+            self.__sheet.row_index(newindex=index, redraw=False)
+            self.__displayed_index = index
+        self.__sheet.redraw()
+        if number_of_rows > 0:
+            self.__scrollbar.set(self.__offset / number_of_rows, end / number_of_rows)
+        else:
+            self.__scrollbar.set(0.0, 1.0)
+
+    def __update_changed_cells(self, rows: List[List[Any]]) -> bool:
+        '''
+        Sets only cells that differ from the displayed ones.
+        Returns False if shape of rows differs or most of cells changed.
+        '''
+        if len(rows) != len(self.__displayed_rows) or\
+                any(len(row) != len(displayed) for row, displayed in zip(rows, self.__displayed_rows)):
+            return False
+        changed_cells = [
+            (row_index, column_index, value)
+            for row_index, (row, displayed) in enumerate(zip(rows, self.__displayed_rows))
+            for column_index, (value, displayed_value) in enumerate(zip(row, displayed))
+            if value != displayed_value
+        ]
+        number_of_cells = sum(len(row) for row in rows)
+        if len(changed_cells) > MAX_CHANGED_CELLS_FRACTION * number_of_cells:
+            return False
+        for row_index, column_index, value in changed_cells:
+            self.__sheet.set_cell_data(row_index, column_index, value, redraw=False)
+        return True
+
+    def __scroll_to(self, offset: int):
+        offset = max(0, min(offset, self.number_of_rows - self.__page_size))
+        if offset != self.__offset:
+            self.__offset = offset
+            self.__render()
+
+    def __on_scroll(self, *args):
+        if args[0] == 'moveto':
+            self.__scroll_to(round(float(args[1]) * self.number_of_rows))
+        elif args[0] == 'scroll':
+            step = self.__page_size if args[2] == 'pages' else 1
+            self.__scroll_to(self.__offset + int(args[1]) * step)
+
+    def __on_mouse_wheel(self, event: tk.Event):
+        if event.num == 4:
+            delta = -3
+        elif event.num == 5:
+            delta = 3
+        else:
+            delta = -3 if event.delta > 0 else 3
+        self.__scroll_to(self.__offset + delta)
+        return 'break'
+
+    def __get_navigation_bindings(self):
+        return [
+            ('<Up>', self.__on_key_up),
+            ('<Down>', self.__on_key_down),
+            ('<Prior>', lambda _: self.__scroll_by(-self.__page_size)),
+            ('<Next>', lambda _: self.__scroll_by(self.__page_size)),
+            ('<Control-Home>', lambda _: self.__scroll_by(-self.number_of_rows)),
+            ('<Control-End>', lambda _: self.__scroll_by(self.number_of_rows))
+        ]
+
+    def __scroll_by(self, delta: int) -> str:
+        self.__scroll_to(self.__offset + delta)
+        return 'break'
+
+    def __get_selected_row(self) -> Optional[int]:
+        selected = self.__sheet.get_currently_selected()
+        return selected.row if selected else None
+
+    def __on_key_up(self, event: tk.Event):
+        # selection moves inside the page, data is scrolled when it is at the first row
+        row = self.__get_selected_row()
+        if row is None or row == 0:
+            return self.__scroll_by(-1)
+        return None
+
+    def __on_key_down(self, event: tk.Event):
+        row = self.__get_selected_row()
+        if row is None or row >= len(self.__displayed_rows) - 1:
+            return self.__scroll_by(1)
+        return None
+
+    def __on_resize(self, event: tk.Event):
+        row_heights = self.__sheet.get_row_heights()
+        row_height = row_heights[0] if len(row_heights) > 0 else DEFAULT_ROW_HEIGHT
+        # header and horizontal scrollbar take about two rows
+        page_size = max(1, int(event.height // max(1, row_height)) - 2)
+        if page_size != self.__page_size:
+            self.__page_size = page_size
+            self.__render()
@@ -0,0 +1,148 @@
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import glob
+import json
+import logging
+import multiprocessing
+import os
+import time
+from typing import Any, Dict, List
+from ror.loader_utils import RORParameter
+
+from utils.file_handler import open_file
+from utils.Severity import Severity
+from utils.solver_helpers import get_number_of_workers, solve_problem
+
+PROBLEM_FILE_EXTENSION = 'txt'
+SUMMARY_FILENAME = 'summary.json'
+
+
+def find_problem_files(paths: List[str]) -> List[str]:
+    '''
+    Returns sorted list of problem files from paths. Each path can be
+    a directory (all .txt files inside it are used), a file or a glob pattern.
+    '''
+    files = set()
+    for _path in paths:
+        if os.path.isdir(_path):
+            files.update(glob.glob(os.path.join(_path, f'*.{PROBLEM_FILE_EXTENSION}')))
+        else:
+            files.update(glob.glob(_path))
+    return sorted(os.path.abspath(file) for file in files if os.path.isfile(file))
+
+
+def get_result_names(files: List[str]) -> Dict[str, str]:
+    '''
+    Returns unique names (without extension) of result files for problem files.
+    Name is the path of the file relative to the common directory of all files,
+    so files with the same name in different directories don't overwrite results
+    of each other. Names that are still the same get a numeric suffix.
+    '''
+    if len(files) == 0:
+        return dict()
+    common_directory = os.path.commonpath([os.path.dirname(os.path.abspath(file)) for file in files])
+    names: Dict[str, str] = dict()
+    # file systems can be case insensitive
+    used_names = set()
+    for file in sorted(files):
+        relative_path, _ = os.path.splitext(os.path.relpath(os.path.abspath(file), common_directory))
+        base_name = relative_path.replace(os.path.sep, '_')
+        name = base_name
+        suffix = 1
+        while name.lower() in used_names:
+            name = f'{base_name}_{suffix}'
+            suffix += 1
+        used_names.add(name.lower())
+        names[file] = name
+    return names
+
+
+def _log(message: str, severity: Severity = Severity.INFO):
+    if severity == Severity.ERROR:
+        logging.error(message)
+    elif severity == Severity.WARNING:
+        logging.warning(message)
+    else:
+        logging.info(message)
+
+
+def solve_file(filename: str, output_directory: str, result_name: str = None) -> Dict[str, Any]:
+    '''
+    Loads, solves and saves result of a single problem file. Runs in a worker process.
+    Result is saved as result_name.csv (by default the name of the problem file).
+    Returns summary of the run with time (in seconds) of each step.
+    '''
+    summary: Dict[str, Any] = {
+        'file': filename,
+        'status': 'failed',
+        'timings': dict()
+    }
+    timings = summary['timings']
+    try:
+        start = time.perf_counter()
+        # spawned workers would share the problem file cache directory and evict each other's files
+        loading_result = open_file(filename, use_cache=False)
+        timings['load'] = time.perf_counter() - start
+
+        parameters = loading_result.parameters
+        aggregation_method = parameters.get_parameter(RORParameter.RESULTS_AGGREGATOR)
+        summary['aggregator'] = aggregation_method
+        start = time.perf_counter()
+        result = solve_problem(
+            loading_result.dataset,
+            parameters,
+            _log,
+            lambda _: None,
+            aggregation_method
+        )
+        timings['solve'] = time.perf_counter() - start
+        if result is None:
+            summary['error'] = 'Solver did not return a result'
+            return summary
+
+        start = time.perf_counter()
+        if result_name is None:
+            result_name, _ = os.path.splitext(os.path.basename(filename))
+        summary['result_file'] = result.save_result_to_csv(os.path.join(output_directory, f'{result_name}.csv'))
+        timings['save'] = time.perf_counter() - start
+        summary['status'] = 'solved'
+    except Exception as e:
+        summary['error'] = str(e)
+    return summary
+
+
+def solve_files(files: List[str], output_directory: str, number_of_workers: int = None) -> Dict[str, Any]:
+    '''
+    Solves problem files in separate processes, saves results to output_directory
+    and writes JSON summary with per-file timings there. Returns the summary.
+    '''
+    os.makedirs(output_directory, exist_ok=True)
+    if number_of_workers is None:
+        number_of_workers = get_number_of_workers(len(files))
+    start = time.perf_counter()
+    results: List[Dict[str, Any]] = []
+    # names are chosen before solving, workers run at once and can't check each other's files
+    result_names = get_result_names(files)
+    context = multiprocessing.get_context('spawn')
+    with ProcessPoolExecutor(max_workers=max(1, number_of_workers), mp_context=context) as executor:
+        futures = [
+            executor.submit(solve_file, filename, output_directory, result_names[filename])
+            for filename in files
+        ]
+        for future in as_completed(futures):
+            file_summary = future.result()
+            results.append(file_summary)
+            if file_summary['status'] == 'solved':
+                logging.info(f'Solved {file_summary["file"]} in {file_summary["timings"]["solve"]:.3f}s')
+            else:
+                logging.error(f'Failed to solve {file_summary["file"]}: {file_summary.get("error")}')
+    results.sort(key=lambda file_summary: file_summary['file'])
+    summary = {
+        'number_of_files': len(files),
+        'solved': sum(1 for file_summary in results if file_summary['status'] == 'solved'),
+        'workers': number_of_workers,
+        'total_time': time.perf_counter() - start,
+        'files': results
+    }
+    with open(os.path.join(output_directory, SUMMARY_FILENAME), 'w') as file:
+        json.dump(summary, file, indent=2)
+    return summary
@@ -0,0 +1,98 @@
+from __future__ import annotations
+import hashlib
+import os
+from typing import TYPE_CHECKING, Any, List, Tuple
+import numpy as np
+
+# ror is imported on first use, cache directories are needed before the solver is loaded
+if TYPE_CHECKING:
+    from ror.Dataset import RORDataset
+    from ror.RORParameters import RORParameters
+
+CACHE_DIRECTORY_NAME = 'ror-gui'
+
+
+def get_cache_directory(name: str) -> str:
+    '''
+    Returns (and creates if needed) directory for cached data of the given kind.
+    '''
+    root_dir = os.environ.get('XDG_CACHE_HOME', os.path.join(os.path.expanduser('~'), '.cache'))
+    directory = os.path.join(root_dir, CACHE_DIRECTORY_NAME, name)
+    os.makedirs(directory, exist_ok=True)
+    return directory
+
+
+def _get_relation_name(preference_relation: Any) -> str:
+    import ror.Relation as relation
+
+    for name, _relation in relation.PREFERENCE_NAME_TO_RELATION.items():
+        if _relation == preference_relation:
+            return name
+    return str(preference_relation)
+
+
+def _update_with_matrix(hash_object, matrix: np.ndarray):
+    matrix = np.ascontiguousarray(matrix)
+    hash_object.update(f'{matrix.dtype.str}{matrix.shape}'.encode())
+    hash_object.update(memoryview(matrix).cast('B'))
+
+
+def get_preference_relations(dataset: RORDataset) -> List[Tuple[str, ...]]:
+    return [
+        (
+            preference.alternative_1,
+            preference.alternative_2,
+            _get_relation_name(preference.relation)
+        )
+        for preference in dataset.preferenceRelations
+    ]
+
+
+def get_intensity_relations(dataset: RORDataset) -> List[Tuple[str, ...]]:
+    return [
+        (
+            intensity.alternative_1,
+            intensity.alternative_2,
+            intensity.alternative_3,
+            intensity.alternative_4,
+            _get_relation_name(intensity.relation)
+        )
+        for intensity in dataset.intensityRelations
+    ]
+
+
+def hash_performance_table(dataset: RORDataset) -> str:
+    '''
+    Returns stable hash of alternatives, criteria and performance matrix of the dataset.
+    '''
+    hash_object = hashlib.sha256()
+    hash_object.update(repr(list(dataset.alternatives)).encode())
+    hash_object.update(repr(list(dataset.criteria)).encode())
+    _update_with_matrix(hash_object, dataset.matrix)
+    return hash_object.hexdigest()
+
+
+def hash_dataset(dataset: RORDataset) -> str:
+    '''
+    Returns stable hash of the dataset contents: alternatives, criteria,
+    performance matrix, preference and intensity relations.
+    '''
+    hash_object = hashlib.sha256()
+    hash_object.update(hash_performance_table(dataset).encode())
+    hash_object.update(repr(get_preference_relations(dataset)).encode())
+    hash_object.update(b'#intensity')
+    hash_object.update(repr(get_intensity_relations(dataset)).encode())
+    return hash_object.hexdigest()
+
+
+def hash_parameters(parameters: RORParameters) -> str:
+    from ror.loader_utils import RORParameter
+
+    hash_object = hashlib.sha256()
+    for parameter in RORParameter:
+        hash_object.update(repr((parameter.value, parameters.get_parameter(parameter))).encode())
+    return hash_object.hexdigest()
+
+
+def get_result_key(dataset: RORDataset, parameters: RORParameters) -> str:
+    return hashlib.sha256(f'{hash_dataset(dataset)}:{hash_parameters(parameters)}'.encode()).hexdigest()
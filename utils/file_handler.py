@@ -1,13 +1,65 @@
-from tkinter.filedialog import askopenfilename
-from typing import Tuple
-from ror.data_loader import LoaderResult, read_dataset_from_txt
+from __future__ import annotations
+import logging
+from typing import TYPE_CHECKING, Tuple
 from os import path
 
+from utils.CancellationToken import CancellationToken, SolveCancelledException
+from utils.ProblemFileCache import ProblemFileCache
+from utils.streaming_loader import LoadingProgressCallback, read_problem_file
+
+if TYPE_CHECKING:
+    from ror.data_loader import LoaderResult
+
 
 def get_file() -> str:
+    from tkinter.filedialog import askopenfilename
+
     initial_path = path.abspath(path.dirname(__file__))
     return askopenfilename(filetypes=[('ROR files', '*.txt')], initialdir=initial_path)
 
 
-def open_file(filename: str) -> LoaderResult:
-    return read_dataset_from_txt(filename)
+_problem_file_cache: ProblemFileCache = None
+
+
+def get_problem_file_cache() -> ProblemFileCache:
+    global _problem_file_cache
+    if _problem_file_cache is None:
+        _problem_file_cache = ProblemFileCache()
+    return _problem_file_cache
+
+
+def open_file(
+    filename: str,
+    use_cache: bool = True,
+    progress_callback: LoadingProgressCallback = None,
+    cancellation_token: CancellationToken = None,
+    memory_map: bool = False
+) -> LoaderResult:
+    '''
+    Reads problem file. Parsed files are cached in binary sidecar files,
+    the text file is parsed again only when it has changed.
+    If memory_map is True then the performance matrix is memory mapped
+    from the sidecar file instead of being read to memory (requires use_cache).
+    '''
+    memory_map = memory_map and use_cache
+    if use_cache:
+        loader_result = get_problem_file_cache().get(filename, memory_map)
+        if loader_result is not None:
+            return loader_result
+    try:
+        loader_result = read_problem_file(
+            filename,
+            progress_callback,
+            cancellation_token,
+            get_problem_file_cache().get_matrix_filename(filename) if memory_map else None
+        )
+    except SolveCancelledException:
+        raise
+    except Exception as e:
+        logging.warning(f'Failed to read {filename} with the streaming reader, reading it with ror loader: {e}')
+        # loader is imported on first use, it is not needed to start the GUI
+        from ror.data_loader import read_dataset_from_txt
+        loader_result = read_dataset_from_txt(filename)
+    if use_cache:
+        get_problem_file_cache().put(filename, loader_result)
+    return loader_result
@@ -1,35 +1,66 @@
-from math import floor
+from concurrent.futures import Future, ThreadPoolExecutor
+import os
 import tkinter as tk
 from tkinter import ttk
 import logging
-from typing import Callable
+from typing import Callable, List
 import PIL.Image
-import PIL.ImageTk
-from utils.ScrollableFrame import ScrollableFrame
+from utils.ThumbnailCache import get_thumbnail_cache
+from utils.TiledImageCanvas import TiledImageCanvas
 
 from utils.Severity import Severity
 
+_decoding_executor: ThreadPoolExecutor = None
+
+
+def get_decoding_executor() -> ThreadPoolExecutor:
+    '''
+    Returns thread pool shared by all image displays, used to decode and rescale images.
+    '''
+    global _decoding_executor
+    if _decoding_executor is None:
+        _decoding_executor = ThreadPoolExecutor(
+            max_workers=min(4, os.cpu_count() or 1),
+            thread_name_prefix='image-decoding'
+        )
+    return _decoding_executor
+
+
 class ImageDisplay(ttk.Frame):
+    '''
+    Displays image with its name and path. Image is decoded only when
+    load_image is called, until then a placeholder is displayed.
+    Decoding and rescaling run in a thread pool, only PhotoImages
+    of tiles are created on the Tk thread. Image fits IMAGE_WIDTH,
+    it can be zoomed in up to MAX_PYRAMID_ZOOM times (limited by the cache budget).
+    '''
     # for rescaling purposes
     IMAGE_WIDTH=250
     IMAGE_HEIGHT=600
     CLICK_TO_COPY_LABEL = '(click to copy)'
+    POLL_INTERVAL_MS = 20
 
     def __init__(self, logger: Callable[[str, Severity], None], window_object: tk.Tk, root: tk.Tk, image_path: str, image_name: str):
         ttk.Frame.__init__(self, master=root)
         self.__logger = logger
         self.__window_object: tk.Tk = window_object
         self.__image_path: str = image_path
-        self.__image: PIL.ImageTk.PhotoImage = None
+        self.__pending_image: Future = None
         self.__image_name = image_name
-        self.__scroll_bar: ScrollableFrame = ScrollableFrame(self, ImageDisplay.IMAGE_WIDTH+30)
-        # print(image_name, 'created scrollbar', id(self.__scroll_bar))
-        self.__display_image()
+        self.__path_label: ttk.Label = None
+        self.__placeholder: ttk.Label = None
+        self.__viewer: TiledImageCanvas = TiledImageCanvas(self, ImageDisplay.IMAGE_WIDTH + 20, ImageDisplay.IMAGE_HEIGHT)
+        self.__display_labels()
+        self.__display_placeholder()
 
     @property
     def image_name(self) -> str:
         return self.__image_name
 
+    @property
+    def is_loaded(self) -> bool:
+        return self.__viewer.has_image
+
     def __copy_text_to_clipboard(self, event):
         # get field value from event, but remove line copy text label and return at end
         to_strip_end = -(len(ImageDisplay.CLICK_TO_COPY_LABEL)+1)
@@ -40,36 +71,86 @@ class ImageDisplay(ttk.Frame):
         self.__logger(f'Copied "{field_value}" to clipboard')
 
 
-    def __display_image(self):
-        im = PIL.Image.open(self.__image_path)
-        self.__image = PIL.ImageTk.PhotoImage(im)
-        
-        width = self.__image.width()
-        height = self.__image.height()
-
-        # resize so all images have the same width
-        rescaling_coeff = ImageDisplay.IMAGE_WIDTH / width # if width > height else ImageDisplay.IMAGE_HEIGHT / height
-        target_width = width * rescaling_coeff
-        target_height = height * rescaling_coeff
-        logging.debug(f'rescaling coeff {rescaling_coeff}, oryginal: {width}x{height}, res {width/height}, resized: {target_width}x{target_height}, res {target_width/target_height}')
-        
-        # recreate image
-        new_image = im.resize((floor(target_width), floor(target_height)))
-        self.__image = PIL.ImageTk.PhotoImage(new_image)
-        
+    def __display_labels(self):
         # add image name and path above the image
         ttk.Label(self, text=f'Name: {self.__image_name}', font=("Arial", 14)).pack(anchor=tk.NW, fill=tk.X)
-        image_path_label = ttk.Label(self, text=f'Path: {self.__image_path} (click to copy)', font=("Arial", 10))
-        image_path_label.pack(anchor=tk.NW, fill=tk.X)
-        image_path_label.bind("<Button-1>", self.__copy_text_to_clipboard)
-        # pack scrollbar after labels to have labels above canvas
-        self.__scroll_bar.pack(side='top', fill=tk.BOTH, expand=1)
+        self.__path_label = ttk.Label(self, text=f'Path: {self.__image_path} (click to copy)', font=("Arial", 10))
+        self.__path_label.pack(anchor=tk.NW, fill=tk.X)
+        self.__path_label.bind("<Button-1>", self.__copy_text_to_clipboard)
+
+    def __display_placeholder(self):
+        # placeholder is displayed below labels instead of the image
+        self.__placeholder = ttk.Label(self, text='Loading image...', padding=20)
+        self.__placeholder.pack(anchor='center', side='top')
+
+    def load_image(self):
+        '''
+        Displays the image rescaled to IMAGE_WIDTH, does nothing if it is already displayed
+        or being decoded. Images decoded before are taken from the thumbnail cache.
+        '''
+        if self.is_loaded or self.__pending_image is not None:
+            return
+        try:
+            # resize so all images have the same width, larger levels are used when zooming in
+            levels = get_thumbnail_cache().get_pyramid(self.__image_path, ImageDisplay.IMAGE_WIDTH)
+        except OSError as e:
+            self.__show_error(e)
+            return
+        if levels is not None:
+            self.__display_image(levels)
+            return
+        future = get_decoding_executor().submit(
+            get_thumbnail_cache().load_pyramid,
+            self.__image_path,
+            ImageDisplay.IMAGE_WIDTH
+        )
+        self.__pending_image = future
+        self.after(ImageDisplay.POLL_INTERVAL_MS, lambda: self.__wait_for_image(future))
+
+    def __wait_for_image(self, future: Future):
+        if future is not self.__pending_image or not self.winfo_exists():
+            # image was released, changed or closed while it was decoded
+            return
+        if not future.done():
+            self.after(ImageDisplay.POLL_INTERVAL_MS, lambda: self.__wait_for_image(future))
+            return
+        self.__pending_image = None
+        try:
+            levels = future.result()
+        except Exception as e:
+            self.__show_error(e)
+            return
+        self.__display_image(levels)
+
+    def __show_error(self, e: Exception):
+        self.__logger(f'Failed to load image {self.__image_path}: {e}', Severity.ERROR)
+        if self.__placeholder is not None:
+            self.__placeholder.configure(text='Failed to load image')
+
+    def release_image(self):
+        '''
+        Removes displayed image from memory, placeholder is displayed until the image is loaded again.
+        '''
+        self.__pending_image = None
+        if not self.is_loaded:
+            return
+        self.__viewer.clear()
+        self.__viewer.pack_forget()
+        self.__display_placeholder()
 
-        cv = tk.Canvas(master=self.__scroll_bar.frame, width=target_width + 20, height=target_height + 100)
-        cv.pack(anchor='center', side='top', fill=tk.BOTH, expand=1)
-        cv.create_image(0, 0, image=self.__image, anchor='nw')
+    def __display_image(self, levels: List[PIL.Image.Image]):
+        if self.__placeholder is not None:
+            self.__placeholder.destroy()
+            self.__placeholder = None
+        logging.debug(f'displaying {self.__image_path} with levels {[level.size for level in levels]}')
+        self.__viewer.pack(side='top', fill=tk.BOTH, expand=1)
+        self.__viewer.set_levels(levels)
 
 
     def change_image(self, image_path: str):
+        was_loaded = self.is_loaded
+        self.release_image()
         self.__image_path = image_path
-        self.__display_image()
+        self.__path_label.configure(text=f'Path: {self.__image_path} (click to copy)')
+        if was_loaded:
+            self.load_image()
@@ -0,0 +1,128 @@
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, wait
+import itertools
+import time
+from typing import Any, Callable, Dict, List
+import numpy as np
+from ror.Dataset import RORDataset
+from ror.RORParameters import RORParameters
+from ror.loader_utils import RORParameter
+from ror.ror_solver import ProcessingCallbackData
+
+from utils.CancellationToken import CancellationToken
+from utils.rank_helpers import get_rank_positions
+from utils.solver_helpers import CANCELLATION_CHECK_INTERVAL, create_worker_pool, get_number_of_workers, raise_if_worker_cancelled, solve_problem, stop_workers
+
+SweepConfiguration = namedtuple(
+    'SweepConfiguration',
+    ['eps', 'number_of_alpha_values', 'results_aggregator', 'tie_resolver']
+)
+
+
+def expand_sweep_grid(
+    eps_values: List[float],
+    numbers_of_alpha_values: List[int],
+    results_aggregators: List[str],
+    tie_resolvers: List[str]
+) -> List[SweepConfiguration]:
+    return [
+        SweepConfiguration(*configuration)
+        for configuration in itertools.product(eps_values, numbers_of_alpha_values, results_aggregators, tie_resolvers)
+    ]
+
+
+def get_sweep_parameters(parameters: RORParameters, configuration: SweepConfiguration) -> RORParameters:
+    '''
+    Returns copy of parameters with values from the configuration.
+    Alpha values are spread evenly in <0, 1> and have equal weights.
+    '''
+    new_parameters = parameters.deep_copy()
+    number_of_alpha_values = configuration.number_of_alpha_values
+    new_parameters.add_parameter(RORParameter.EPS, configuration.eps)
+    new_parameters.add_parameter(RORParameter.NUMBER_OF_ALPHA_VALUES, number_of_alpha_values)
+    new_parameters.add_parameter(
+        RORParameter.ALPHA_VALUES,
+        list(np.linspace(start=0.0, stop=1.0, num=number_of_alpha_values))
+    )
+    new_parameters.add_parameter(RORParameter.ALPHA_WEIGHTS, [1.0] * number_of_alpha_values)
+    new_parameters.add_parameter(RORParameter.RESULTS_AGGREGATOR, configuration.results_aggregator)
+    new_parameters.add_parameter(RORParameter.TIE_RESOLVER, configuration.tie_resolver)
+    return new_parameters
+
+
+def solve_configuration(
+    dataset: RORDataset,
+    parameters: RORParameters,
+    configuration: SweepConfiguration
+) -> Dict[str, Any]:
+    '''
+    Solves problem for a single configuration. Runs in a worker process,
+    returns only positions of alternatives in the final rank, so the whole result
+    doesn't need to be sent back to the main process.
+    '''
+    sweep_result: Dict[str, Any] = {
+        'configuration': configuration,
+        'positions': None,
+        'time': None,
+        'error': None
+    }
+    errors: List[str] = []
+
+    def on_progress(data: ProcessingCallbackData):
+        raise_if_worker_cancelled()
+        if data.progress < 0:
+            errors.append(str(data.status))
+
+    start = time.perf_counter()
+    result = solve_problem(
+        dataset,
+        get_sweep_parameters(parameters, configuration),
+        lambda message, severity=None: None,
+        on_progress,
+        configuration.results_aggregator
+    )
+    sweep_result['time'] = time.perf_counter() - start
+    if result is None:
+        sweep_result['error'] = errors[0] if len(errors) > 0 else 'Solver did not return a result'
+    else:
+        sweep_result['positions'] = get_rank_positions(result.final_rank)
+    return sweep_result
+
+
+def run_sweep(
+    dataset: RORDataset,
+    parameters: RORParameters,
+    configurations: List[SweepConfiguration],
+    calculations_callback: Callable[[ProcessingCallbackData], None],
+    cancellation_token: CancellationToken = None
+) -> List[Dict[str, Any]]:
+    '''
+    Solves problem for all configurations in separate processes.
+    Returns results in the same order as configurations.
+    '''
+    if cancellation_token is not None:
+        cancellation_token.raise_if_cancelled()
+    results: Dict[SweepConfiguration, Dict[str, Any]] = dict()
+    number_of_workers = get_number_of_workers(len(configurations))
+    executor, workers_token = create_worker_pool(number_of_workers)
+    with executor:
+        pending = {
+            executor.submit(solve_configuration, dataset, parameters, configuration)
+            for configuration in configurations
+        }
+        try:
+            while len(pending) > 0:
+                if cancellation_token is not None:
+                    cancellation_token.raise_if_cancelled()
+                done, pending = wait(pending, timeout=CANCELLATION_CHECK_INTERVAL, return_when=FIRST_COMPLETED)
+                for future in done:
+                    sweep_result = future.result()
+                    results[sweep_result['configuration']] = sweep_result
+                    calculations_callback(ProcessingCallbackData(
+                        len(results) / len(configurations),
+                        f'Solved {len(results)}/{len(configurations)} configurations'
+                    ))
+        except BaseException:
+            stop_workers(executor, workers_token)
+            raise
+    return [results[configuration] for configuration in configurations]
@@ -0,0 +1,45 @@
+from typing import Any, Dict, List
+
+# containers of alternatives that are tied at the same position
+TIED_ALTERNATIVES_TYPES = (list, tuple, set, frozenset)
+
+
+def get_alternative_name(item: Any) -> str:
+    '''
+    Returns name of the alternative from an item of the rank.
+    Ranks created by the solver hold rank items with the alternative
+    and its value, other ranks can hold names of alternatives.
+    '''
+    if isinstance(item, str):
+        return item
+    for attribute in ('alternative', 'name'):
+        value = getattr(item, attribute, None)
+        if value is not None:
+            return str(value)
+    return str(item)
+
+
+def get_rank_groups(rank: Any) -> List[List[str]]:
+    '''
+    Returns names of alternatives at consecutive positions of the rank.
+    Alternatives that are tied are kept together in the same group.
+    '''
+    groups: List[List[str]] = []
+    for items in rank.rank:
+        if not isinstance(items, TIED_ALTERNATIVES_TYPES):
+            items = [items]
+        group = [get_alternative_name(item) for item in items]
+        if len(group) > 0:
+            groups.append(group)
+    return groups
+
+
+def get_rank_positions(rank: Any) -> Dict[str, int]:
+    '''
+    Returns position of each alternative in the rank, starting from 1.
+    '''
+    positions: Dict[str, int] = dict()
+    for position, alternatives in enumerate(get_rank_groups(rank), start=1):
+        for alternative in alternatives:
+            positions[alternative] = position
+    return positions
@@ -1,32 +1,424 @@
-from typing import Callable, Dict
+from __future__ import annotations
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import copy
+import logging
+import multiprocessing
+import os
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Tuple
+import numpy as np
 from ror.Dataset import RORDataset
+from ror.RORParameters import RORParameters
 from ror.RORResult import RORResult
 from ror.loader_utils import RORParameter
-from ror.ror_solver import solve_model, ProcessingCallbackData
+from ror.ror_solver import AVAILABLE_AGGREGATORS, solve_model, ProcessingCallbackData
 
+from utils.CancellationToken import CancellationToken, SolveCancelledException
+from utils.PhaseTimer import PhaseTimer, TimingSpan
 from utils.Severity import Severity
 
+# Tk helpers are needed only by solves started from the GUI, batch mode runs without tkinter
+if TYPE_CHECKING:
+    import tkinter as tk
+    from utils.BackgroundTask import BackgroundTask
+    from utils.ProgressChannel import ProgressHandler
+
 
 def solve_problem(
     dataset: RORDataset,
-    parameters: RORParameter,
+    parameters: RORParameters,
     logger_callback: Callable[[str, Severity], None],
     calculations_callback: Callable[[ProcessingCallbackData], None],
-    aggregation_method: str
+    aggregation_method: str,
+    cancellation_token: CancellationToken = None,
+    timing_callback: Callable[[TimingSpan], None] = None
 ) -> RORResult:
     logger_callback('Starting calculations')
+    timer = PhaseTimer(timing_callback)
+
+    def progress_callback(data: ProcessingCallbackData):
+        # solver reports progress between phases, so it is a place where
+        # calculations can be stopped
+        if cancellation_token is not None:
+            cancellation_token.raise_if_cancelled()
+        # each status reported by the solver starts a new phase
+        if data.progress >= 0:
+            timer.start_phase(str(data.status))
+        calculations_callback(data)
 
     result = None
     try:
-        result = solve_model(
-            dataset,
-            parameters,
-            result_aggregator_name=aggregation_method,
-            progress_callback=calculations_callback
-        )
+        with timer.measure('total calculations'):
+            try:
+                result = solve_model(
+                    dataset,
+                    parameters,
+                    result_aggregator_name=aggregation_method,
+                    progress_callback=progress_callback
+                )
+            finally:
+                timer.finish_phase()
+    except SolveCancelledException:
+        logger_callback('Calculations were cancelled', Severity.WARNING)
+        raise
+    except Exception as e:
+        calculations_callback(ProcessingCallbackData(-1, e))
+        logger_callback(f'Failed during calculations: {e}', Severity.ERROR)
+    logger_callback('Finished calculations', Severity.SUCCESS)
+
+    return result
+
+
+# aggregators that generate alpha values from the number of alpha values
+# instead of using alpha values from parameters
+VOTING_AGGREGATORS = ['BordaResultAggregator', 'CopelandResultAggregator']
+# aggregator used in the workers, each worker solves model for a single alpha value
+# so there is nothing to aggregate there
+SINGLE_ALPHA_VALUE_AGGREGATOR = 'DefaultResultAggregator'
+
+
+def get_alpha_values(parameters: RORParameters, aggregation_method: str) -> List[float]:
+    if aggregation_method in VOTING_AGGREGATORS:
+        number_of_alpha_values = parameters.get_parameter(RORParameter.NUMBER_OF_ALPHA_VALUES)
+        return list(np.linspace(start=0.0, stop=1.0, num=number_of_alpha_values))
+    return list(parameters.get_parameter(RORParameter.ALPHA_VALUES))
+
+
+# how often (in seconds) parallel solver checks whether calculations were cancelled
+CANCELLATION_CHECK_INTERVAL = 0.2
+
+
+def get_number_of_workers(number_of_tasks: int) -> int:
+    return max(1, min(number_of_tasks, os.cpu_count() or 1))
+
+
+# token shared by all tasks of a worker process, set by init_worker
+_worker_cancellation_token: CancellationToken = None
+
+
+def init_worker(cancellation_token: CancellationToken):
+    global _worker_cancellation_token
+    _worker_cancellation_token = cancellation_token
+
+
+def raise_if_worker_cancelled():
+    '''
+    Stops the task running in a worker process if the pool was stopped with stop_workers.
+    '''
+    if _worker_cancellation_token is not None:
+        _worker_cancellation_token.raise_if_cancelled()
+
+
+def create_worker_pool(number_of_workers: int) -> Tuple[ProcessPoolExecutor, CancellationToken]:
+    '''
+    Returns pool of worker processes and the token that stops tasks running in them.
+    '''
+    # spawn processes, forking a process with running Tk threads is not safe
+    context = multiprocessing.get_context('spawn')
+    workers_token = CancellationToken(context.Event())
+    executor = ProcessPoolExecutor(
+        max_workers=number_of_workers,
+        mp_context=context,
+        initializer=init_worker,
+        initargs=(workers_token,)
+    )
+    return executor, workers_token
+
+
+def stop_workers(executor: ProcessPoolExecutor, workers_token: CancellationToken):
+    '''
+    Cancels tasks that haven't started yet and makes running tasks stop
+    at the next progress report of the solver, then waits for the workers.
+    '''
+    workers_token.cancel()
+    executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _solve_for_alpha_value(
+    dataset: RORDataset,
+    parameters: RORParameters,
+    alpha_value: float,
+    cancellation_token: CancellationToken = None
+) -> Tuple[RORResult, float]:
+    '''
+    Solves model for a single alpha value. Runs in a worker process
+    or on the calling thread, then cancellation_token can stop it.
+    Returns result and time of calculations in seconds.
+    '''
+
+    def progress_callback(_: ProcessingCallbackData):
+        raise_if_worker_cancelled()
+        if cancellation_token is not None:
+            cancellation_token.raise_if_cancelled()
+
+    start = time.perf_counter()
+    alpha_parameters = parameters.deep_copy()
+    alpha_parameters.add_parameter(RORParameter.ALPHA_VALUES, [alpha_value])
+    alpha_parameters.add_parameter(RORParameter.ALPHA_WEIGHTS, [1.0])
+    alpha_parameters.add_parameter(RORParameter.NUMBER_OF_ALPHA_VALUES, 1)
+    alpha_parameters.add_parameter(RORParameter.RESULTS_AGGREGATOR, SINGLE_ALPHA_VALUE_AGGREGATOR)
+    result = solve_model(
+        dataset,
+        alpha_parameters,
+        result_aggregator_name=SINGLE_ALPHA_VALUE_AGGREGATOR,
+        progress_callback=progress_callback
+    )
+    return result, time.perf_counter() - start
+
+
+class ResultMergeException(Exception):
+    pass
+
+
+def _set_result_attribute(result: RORResult, name: str, value: Any):
+    '''
+    Sets attribute of the result with its setter, writable property or the attribute
+    behind a read only property. Raises AttributeError instead of creating
+    a new attribute that wouldn't be read by RORResult.
+    '''
+    setter = getattr(result, f'set_{name}', None)
+    if callable(setter):
+        setter(value)
+        return
+    class_attribute = getattr(type(result), name, None)
+    if isinstance(class_attribute, property):
+        if class_attribute.fset is not None:
+            setattr(result, name, value)
+            return
+    elif name in vars(result):
+        setattr(result, name, value)
+        return
+    # read only properties are backed by private (name mangled) or protected attributes
+    backing_attributes = [f'_{cls.__name__.lstrip("_")}__{name}' for cls in type(result).__mro__]
+    backing_attributes.append(f'_{name}')
+    for attribute in backing_attributes:
+        if attribute in vars(result):
+            setattr(result, attribute, value)
+            return
+    raise AttributeError(f"Can't set attribute '{name}' of {type(result).__name__}")
+
+
+def _merge_values(values: List[Any]) -> Any:
+    '''
+    Merges values of the same attribute from results calculated for single alpha values.
+    Tables with the same rows are joined by columns, other tables by rows.
+    Dictionaries are joined by keys. Other values are taken from the first result.
+    '''
+    import pandas as pd
+
+    merged = values[0]
+    if isinstance(merged, pd.DataFrame):
+        for value in values[1:]:
+            if value.index.equals(merged.index):
+                new_columns = [column for column in value.columns if column not in merged.columns]
+                merged = pd.concat([merged, value[new_columns]], axis=1)
+            else:
+                merged = pd.concat([merged, value], axis=0)
+    elif isinstance(merged, dict):
+        merged = dict(merged)
+        for value in values[1:]:
+            for key, item in value.items():
+                merged.setdefault(key, item)
+    return merged
+
+
+def _check_merged_table(merged_result: RORResult, partial_results: List[RORResult]):
+    '''
+    Checks that the result table of the merged result has values of all alpha values.
+    '''
+    table = merged_result.get_result_table()
+    for partial_result in partial_results:
+        partial_table = partial_result.get_result_table()
+        for column in partial_table.columns:
+            if column not in table.columns:
+                raise ResultMergeException(f"Merged result doesn't have column '{column}'")
+            if table.index.equals(partial_table.index) and not table[column].equals(partial_table[column]):
+                raise ResultMergeException(f"Results for different alpha values have different values in column '{column}'")
+
+
+def merge_alpha_value_results(partial_results: List[RORResult], parameters: RORParameters) -> RORResult:
+    '''
+    Merges results calculated for single alpha values into a copy of the first result.
+    Results must be ordered by alpha value. Intermediate ranks are added in that order,
+    values calculated for each alpha value (tables and dictionaries held by the result)
+    are joined. Parameters of the merged result are set to parameters of the whole problem.
+    Model of the first result was built for a single alpha value only, so it is removed.
+    Raises ResultMergeException if the result table doesn't have values of all alpha values.
+    '''
+    # copy, so the first result stays unchanged if it is reused later
+    merged_result = copy.deepcopy(partial_results[0])
+    for partial_result in partial_results[1:]:
+        for rank in partial_result.intermediate_ranks:
+            merged_result.add_intermediate_rank(rank)
+    for attribute, value in list(vars(merged_result).items()):
+        merged_value = _merge_values([value] + [vars(partial_result)[attribute] for partial_result in partial_results[1:]])
+        if merged_value is not value:
+            setattr(merged_result, attribute, merged_value)
+    _set_result_attribute(merged_result, 'parameters', parameters.deep_copy())
+    _set_result_attribute(merged_result, 'model', None)
+    _check_merged_table(merged_result, partial_results)
+    return merged_result
+
+
+def aggregate_result(result: RORResult, parameters: RORParameters, aggregation_method: str) -> RORResult:
+    '''
+    Aggregates intermediate ranks from the result into the final rank.
+    Aggregators in AVAILABLE_AGGREGATORS are shared, so a copy is used to keep
+    the aggregator's state (voter, tie resolver) bound to this result only.
+    '''
+    aggregator = copy.deepcopy(AVAILABLE_AGGREGATORS[aggregation_method])
+    return aggregator.aggregate_results(result, parameters)
+
+
+def solve_problem_parallel(
+    dataset: RORDataset,
+    parameters: RORParameters,
+    logger_callback: Callable[[str, Severity], None],
+    calculations_callback: Callable[[ProcessingCallbackData], None],
+    aggregation_method: str,
+    cancellation_token: CancellationToken = None,
+    timing_callback: Callable[[TimingSpan], None] = None
+) -> RORResult:
+    '''
+    Solves models for all alpha values in separate processes and aggregates the intermediate ranks afterwards.
+    Intermediate ranks are independent of each other, so the speedup is close to the number of available cores.
+    '''
+    timer = PhaseTimer(timing_callback)
+    calculations_start = time.perf_counter()
+    calculations_timestamp = time.time()
+    alpha_values = get_alpha_values(parameters, aggregation_method)
+
+    result = None
+    try:
+        partial_results: Dict[float, RORResult] = dict()
+
+        def on_alpha_value_solved(alpha_value: float, alpha_value_result: RORResult, solve_time: float):
+            partial_results[alpha_value] = alpha_value_result
+            timer.add_span(f'solving model for alpha value {round(alpha_value, 4)}', time.time() - solve_time, solve_time)
+            calculations_callback(ProcessingCallbackData(
+                0.9 * len(partial_results) / len(alpha_values),
+                f'Solved model for alpha value {round(alpha_value, 4)}'
+            ))
+
+        if len(alpha_values) == 1:
+            # starting a process costs more than it saves for a single model
+            logger_callback('Starting calculations for 1 alpha value')
+            on_alpha_value_solved(alpha_values[0], *_solve_for_alpha_value(dataset, parameters, alpha_values[0], cancellation_token))
+        else:
+            number_of_workers = get_number_of_workers(len(alpha_values))
+            logger_callback(f'Starting calculations for {len(alpha_values)} alpha values using {number_of_workers} processes')
+            executor, workers_token = create_worker_pool(number_of_workers)
+            with executor:
+                futures = {
+                    executor.submit(_solve_for_alpha_value, dataset, parameters, alpha_value): alpha_value
+                    for alpha_value in alpha_values
+                }
+                pending = set(futures)
+                try:
+                    while len(pending) > 0:
+                        if cancellation_token is not None:
+                            cancellation_token.raise_if_cancelled()
+                        done, pending = wait(pending, timeout=CANCELLATION_CHECK_INTERVAL, return_when=FIRST_COMPLETED)
+                        for future in done:
+                            # time is measured in the worker, without waiting in the executor's queue
+                            on_alpha_value_solved(futures[future], *future.result())
+                except BaseException:
+                    stop_workers(executor, workers_token)
+                    raise
+        if cancellation_token is not None:
+            cancellation_token.raise_if_cancelled()
+        calculations_callback(ProcessingCallbackData(0.9, 'Aggregating results'))
+        try:
+            merged_result = merge_alpha_value_results(
+                [partial_results[alpha_value] for alpha_value in alpha_values],
+                parameters
+            )
+        except ResultMergeException as e:
+            logger_callback(f'Failed to merge results of alpha values: {e}, solving the whole problem again', Severity.WARNING)
+            return solve_problem(
+                dataset,
+                parameters,
+                logger_callback,
+                calculations_callback,
+                aggregation_method,
+                cancellation_token,
+                timing_callback
+            )
+        with timer.measure('aggregating results'):
+            result = aggregate_result(merged_result, parameters, aggregation_method)
+        timer.add_span('total calculations', calculations_timestamp, time.perf_counter() - calculations_start)
+        calculations_callback(ProcessingCallbackData(1.0, 'Finished calculations'))
+    except SolveCancelledException:
+        logger_callback('Calculations were cancelled', Severity.WARNING)
+        raise
     except Exception as e:
         calculations_callback(ProcessingCallbackData(-1, e))
         logger_callback(f'Failed during calculations: {e}', Severity.ERROR)
     logger_callback('Finished calculations', Severity.SUCCESS)
 
     return result
+
+
+def solve_problem_in_background(
+    window_object: tk.Tk,
+    dataset: RORDataset,
+    parameters: RORParameters,
+    logger_callback: Callable[[str, Severity], None],
+    calculations_callback: ProgressHandler,
+    aggregation_method: str,
+    on_result: Callable[[RORResult], None],
+    on_error: Callable[[Exception], None] = None,
+    parallel: bool = False,
+    cancellation_token: CancellationToken = None,
+    timing_callback: Callable[[TimingSpan], None] = None
+) -> BackgroundTask:
+    '''
+    Runs solve_problem (or solve_problem_parallel if parallel is True) on a worker thread.
+    Logs, progress and the result are passed to the callbacks on the Tk thread,
+    so callbacks can update widgets. Progress is rate limited by ProgressChannel
+    and passed together with the estimated time left. If calculations are stopped
+    with cancellation_token then on_error is called with SolveCancelledException.
+    '''
+    from utils.BackgroundTask import BackgroundTask
+    from utils.ProgressChannel import ProgressChannel
+
+    progress_channel = ProgressChannel(window_object, calculations_callback)
+
+    def task(background_task: BackgroundTask) -> RORResult:
+        logger = lambda message, severity=Severity.INFO: background_task.post(logger_callback, message, severity)
+        progress_callback = progress_channel.report
+        span_callback = lambda span: background_task.post(timing_callback, span) if timing_callback is not None else None
+        if parallel:
+            return solve_problem_parallel(
+                dataset,
+                parameters,
+                logger,
+                progress_callback,
+                aggregation_method,
+                cancellation_token,
+                span_callback
+            )
+        return solve_problem(
+            dataset,
+            parameters,
+            logger,
+            progress_callback,
+            aggregation_method,
+            cancellation_token,
+            span_callback
+        )
+
+    def handle_result(result: RORResult):
+        # show the final progress before the result
+        progress_channel.flush()
+        on_result(result)
+
+    def handle_error(e: Exception):
+        progress_channel.flush()
+        if on_error is not None:
+            on_error(e)
+        else:
+            logging.exception('Failed to solve problem', exc_info=e)
+
+    progress_channel.start()
+    return BackgroundTask(window_object, task, handle_result, handle_error).start()
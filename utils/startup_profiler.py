@@ -0,0 +1,82 @@
+import json
+import subprocess
+import sys
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Tuple
+
+IMPORT_TIME_PREFIX = 'import time:'
+FIRST_FRAME_PREFIX = 'first frame:'
+
+
+# packages of this program, imports made by their modules are reported as imports of the program
+PROGRAM_PACKAGES = ['utils', 'benchmarks']
+
+
+def parse_import_times(output: str) -> List[Tuple[str, float]]:
+    '''
+    Parses output of `python -X importtime` and returns cumulative import time (in seconds)
+    of each top level package imported by the program (the script or its own modules),
+    sorted from the slowest one.
+    '''
+    times: Dict[str, float] = defaultdict(float)
+    # modules are printed after the modules they import, so in the reversed output
+    # each module comes after the module that imported it
+    importing_modules: List[str] = []
+    for line in reversed(output.splitlines()):
+        if not line.startswith(IMPORT_TIME_PREFIX):
+            continue
+        columns = line[len(IMPORT_TIME_PREFIX):].split('|')
+        if len(columns) != 3:
+            continue
+        cumulative, name = columns[1].strip(), columns[2]
+        if not cumulative.isdigit():
+            continue
+        # nested imports are indented by two spaces for each level
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        package = name.strip().split('.')[0]
+        importing_modules = importing_modules[:depth]
+        is_imported_by_program = all(module in PROGRAM_PACKAGES for module in importing_modules)
+        importing_modules.append(package)
+        if is_imported_by_program and package not in PROGRAM_PACKAGES:
+            times[package] += int(cumulative) / 1e6
+    return sorted(times.items(), key=lambda item: item[1], reverse=True)
+
+
+def measure_startup(script: str) -> Dict[str, Any]:
+    '''
+    Starts the GUI in a new interpreter that exits after displaying the first frame.
+    Returns time to the first frame measured from starting the process and from running the script,
+    together with the import time of each package.
+    '''
+    start = time.perf_counter()
+    process = subprocess.run(
+        [sys.executable, '-X', 'importtime', script, '--exit-after-first-frame'],
+        capture_output=True,
+        text=True
+    )
+    process_time = time.perf_counter() - start
+    if process.returncode != 0:
+        raise RuntimeError(f'GUI failed to start: {process.stderr.strip().splitlines()[-1:]}')
+    first_frame = None
+    for line in process.stdout.splitlines():
+        if line.startswith(FIRST_FRAME_PREFIX):
+            first_frame = json.loads(line[len(FIRST_FRAME_PREFIX):])
+    imports = parse_import_times(process.stderr)
+    return {
+        'process_to_exit': process_time,
+        'script_to_first_frame': first_frame['script_to_first_frame'] if first_frame is not None else None,
+        'window_to_first_frame': first_frame['window_to_first_frame'] if first_frame is not None else None,
+        'total_import_time': sum(import_time for _, import_time in imports),
+        'imports': imports
+    }
+
+
+def print_startup_report(report: Dict[str, Any], number_of_imports: int = 15):
+    print(f'Process start to exit after first frame: {report["process_to_exit"]:.4f}s')
+    if report['script_to_first_frame'] is not None:
+        print(f'Script start to first frame:             {report["script_to_first_frame"]:.4f}s')
+        print(f'Creating window to first frame:          {report["window_to_first_frame"]:.4f}s')
+    print(f'Imports before first frame:              {report["total_import_time"]:.4f}s')
+    for name, import_time in report['imports'][:number_of_imports]:
+        print(f'    {name:<30} {import_time:.4f}s')
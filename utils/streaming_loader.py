@@ -0,0 +1,252 @@
+'''
+Streaming reader of problem files in the ROR text format. Rows of the #Data
+section are parsed one by one into a preallocated matrix, so memory used
+during loading stays close to the size of the final matrix.
+'''
+from __future__ import annotations
+import ast
+from collections import namedtuple
+import logging
+import os
+from typing import TYPE_CHECKING, Any, Callable, List, Tuple
+import numpy as np
+
+from utils.CancellationToken import CancellationToken
+
+if TYPE_CHECKING:
+    from ror.data_loader import LoaderResult
+
+DATA_SECTION = '#Data'
+PREFERENCES_SECTION = '#Preferences'
+PARAMETERS_SECTION = '#Parameters'
+# progress is reported after this number of rows
+REPORT_INTERVAL_ROWS = 1000
+# part of the progress used to count rows of the #Data section
+COUNTING_PROGRESS = 0.1
+
+# has the same fields as ProcessingCallbackData, so it can be passed to ProgressChannel
+LoadingProgress = namedtuple('LoadingProgress', ['progress', 'status'])
+LoadingProgressCallback = Callable[[LoadingProgress], None]
+
+
+def _lines(filename: str):
+    '''
+    Yields stripped lines of the file together with number of bytes read so far.
+    '''
+    bytes_read = 0
+    with open(filename, 'rb') as file:
+        for line in file:
+            bytes_read += len(line)
+            yield line.decode('utf-8').strip(), bytes_read
+
+
+def count_data_rows(
+    filename: str,
+    progress_callback: LoadingProgressCallback = None,
+    cancellation_token: CancellationToken = None
+) -> int:
+    file_size = max(1, os.path.getsize(filename))
+    number_of_rows = 0
+    # the first line of the #Data section is the header
+    in_data_section = False
+    header_read = False
+    for line, bytes_read in _lines(filename):
+        if line.startswith('#'):
+            if in_data_section:
+                break
+            in_data_section = line == DATA_SECTION
+            continue
+        if not in_data_section or line == '':
+            continue
+        if not header_read:
+            header_read = True
+            continue
+        number_of_rows += 1
+        if number_of_rows % REPORT_INTERVAL_ROWS == 0:
+            if cancellation_token is not None:
+                cancellation_token.raise_if_cancelled()
+            if progress_callback is not None:
+                progress_callback(LoadingProgress(
+                    COUNTING_PROGRESS * bytes_read / file_size,
+                    f'Counted {number_of_rows} alternatives'
+                ))
+    return number_of_rows
+
+
+def _parse_criterion(header: str) -> Tuple[str, str]:
+    from ror.dataset_constants import CRITERION_TYPES
+    header = header.strip()
+    if not header.endswith(']') or '[' not in header:
+        raise ValueError(f'Criterion {header} must have type in brackets, i.e. name[g] or name[c]')
+    name, criterion_type = header[:-1].split('[', 1)
+    if criterion_type == 'g':
+        return (name.strip(), CRITERION_TYPES['gain'])
+    elif criterion_type == 'c':
+        return (name.strip(), CRITERION_TYPES['cost'])
+    raise ValueError(f'Invalid type {criterion_type} of criterion {name}, valid types are g (gain) and c (cost)')
+
+
+def _parse_parameter_value(value: str) -> Any:
+    try:
+        return ast.literal_eval(value)
+    except (ValueError, SyntaxError):
+        # names of aggregators and tie resolvers
+        return value
+
+
+class _MatrixWriter:
+    '''
+    Preallocated matrix that rows are parsed into. If matrix_filename is provided
+    then the matrix is written to a temporary memory mapped file. Writer holds
+    the only reference to the writable mapping, so the mapping is closed before
+    the file is renamed or removed (open mappings prevent that on Windows).
+    '''
+
+    def __init__(self, matrix_filename: str = None) -> None:
+        self.__matrix_filename: str = matrix_filename
+        self.__matrix: np.ndarray = None
+
+    @property
+    def is_allocated(self) -> bool:
+        return self.__matrix is not None
+
+    def allocate(self, shape: Tuple[int, int]):
+        if self.__matrix_filename is None:
+            self.__matrix = np.empty(shape, dtype=np.float64)
+        else:
+            # written to a temporary file, so a partially read matrix never has the final name
+            self.__matrix = np.lib.format.open_memmap(f'{self.__matrix_filename}.tmp', mode='w+', dtype=np.float64, shape=shape)
+
+    def set_row(self, index: int, values: List[str]):
+        self.__matrix[index] = values
+
+    def negate_column(self, index: int):
+        np.negative(self.__matrix[:, index], out=self.__matrix[:, index])
+
+    def finish(self) -> np.ndarray:
+        '''
+        Returns the matrix, or the matrix file mapped copy-on-write
+        if it was written to a file. Changes of the dataset are not written to the file.
+        '''
+        if self.__matrix_filename is None:
+            return self.__matrix
+        self.__matrix.flush()
+        self.close()
+        os.replace(f'{self.__matrix_filename}.tmp', self.__matrix_filename)
+        return np.load(self.__matrix_filename, mmap_mode='c')
+
+    def close(self):
+        # releases the writable mapping, the matrix can't be written after that
+        self.__matrix = None
+
+
+def read_problem_file(
+    filename: str,
+    progress_callback: LoadingProgressCallback = None,
+    cancellation_token: CancellationToken = None,
+    matrix_filename: str = None
+) -> LoaderResult:
+    '''
+    Reads problem file in two passes: the first one counts alternatives,
+    the second one parses rows into the preallocated matrix, relations and parameters.
+    Progress is reported as the fraction of bytes read.
+    If matrix_filename is provided then the matrix is written to that .npy file
+    and the dataset uses the memory mapped file instead of a matrix in memory.
+    '''
+    matrix_writer = _MatrixWriter(matrix_filename)
+    try:
+        return _read_problem_file(filename, progress_callback, cancellation_token, matrix_writer)
+    finally:
+        # temporary matrix is left only when reading was cancelled or failed,
+        # its mapping is closed first, so the file can be removed
+        matrix_writer.close()
+        if matrix_filename is not None and os.path.exists(f'{matrix_filename}.tmp'):
+            try:
+                os.remove(f'{matrix_filename}.tmp')
+            except OSError as e:
+                logging.warning(f'Failed to remove temporary matrix file {matrix_filename}.tmp: {e}')
+
+
+def _read_problem_file(
+    filename: str,
+    progress_callback: LoadingProgressCallback,
+    cancellation_token: CancellationToken,
+    matrix_writer: _MatrixWriter
+) -> LoaderResult:
+    import ror.Relation as relation
+    from ror.Dataset import RORDataset
+    from ror.PreferenceRelations import PreferenceIntensityRelation, PreferenceRelation
+    from ror.RORParameters import RORParameters
+    from ror.data_loader import LoaderResult
+    from ror.dataset_constants import CRITERION_TYPES
+    from ror.loader_utils import RORParameter
+
+    number_of_rows = count_data_rows(filename, progress_callback, cancellation_token)
+    file_size = max(1, os.path.getsize(filename))
+
+    def report(bytes_read: int, status: str):
+        if cancellation_token is not None:
+            cancellation_token.raise_if_cancelled()
+        if progress_callback is not None:
+            progress = COUNTING_PROGRESS + (1 - COUNTING_PROGRESS) * bytes_read / file_size
+            progress_callback(LoadingProgress(progress, status))
+
+    criteria: List[Tuple[str, str]] = None
+    alternatives: List[str] = []
+    preferences: List[Any] = []
+    parameters = RORParameters()
+    section: str = None
+    for line_number, (line, bytes_read) in enumerate(_lines(filename), start=1):
+        if line == '':
+            continue
+        if line.startswith('#'):
+            section = line
+            continue
+        try:
+            if section == DATA_SECTION:
+                values = line.split(',')
+                if criteria is None:
+                    # the first column holds names of alternatives
+                    criteria = [_parse_criterion(header) for header in values[1:]]
+                    matrix_writer.allocate((number_of_rows, len(criteria)))
+                    continue
+                if len(values) != len(criteria) + 1:
+                    raise ValueError(f'Expected {len(criteria)} values, got {len(values) - 1}')
+                matrix_writer.set_row(len(alternatives), values[1:])
+                alternatives.append(values[0].strip())
+                if len(alternatives) % REPORT_INTERVAL_ROWS == 0:
+                    report(bytes_read, f'Read {len(alternatives)}/{number_of_rows} alternatives')
+            elif section == PREFERENCES_SECTION:
+                values = [value.strip() for value in line.split(',')]
+                preferences.append(values)
+            elif section == PARAMETERS_SECTION:
+                name, value = line.split('=', 1)
+                try:
+                    parameter = RORParameter(name.strip())
+                except ValueError:
+                    logging.warning(f'Unknown parameter {name.strip()} in {filename}, line {line_number}')
+                    continue
+                parameters.add_parameter(parameter, _parse_parameter_value(value.strip()))
+        except ValueError as e:
+            raise ValueError(f'Failed to parse line {line_number} of {filename}: {e}') from e
+
+    if not matrix_writer.is_allocated:
+        raise ValueError(f'File {filename} has no {DATA_SECTION} section')
+    if len(alternatives) != number_of_rows:
+        raise ValueError(f'File {filename} has changed while it was read')
+    # values of cost criteria are stored negated, so all criteria are maximized
+    cost_criteria = [criterion_type == CRITERION_TYPES['cost'] for _, criterion_type in criteria]
+    for index, is_cost in enumerate(cost_criteria):
+        if is_cost:
+            matrix_writer.negate_column(index)
+    dataset = RORDataset(alternatives, matrix_writer.finish(), criteria)
+    for values in preferences:
+        relation_type = relation.PREFERENCE_NAME_TO_RELATION[values[-1]]
+        if len(values) == 3:
+            dataset.add_preference_relation(PreferenceRelation(values[0], values[1], relation_type))
+        elif len(values) == 5:
+            dataset.add_intensity_relation(PreferenceIntensityRelation(*values[:4], relation_type))
+        else:
+            raise ValueError(f'Invalid relation {", ".join(values)} in {filename}')
+    report(file_size, f'Read {len(alternatives)} alternatives')
+    return LoaderResult(dataset, parameters)
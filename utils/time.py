@@ -4,3 +4,14 @@ import datetime
 def get_log_time() -> str:
     now = datetime.datetime.now()
     return now.strftime("%d-%m-%Y %H:%M:%S")
+
+
+def format_duration(seconds: float) -> str:
+    seconds = max(0, round(seconds))
+    if seconds < 60:
+        return f'{seconds}s'
+    minutes, seconds = divmod(seconds, 60)
+    if minutes < 60:
+        return f'{minutes}m {seconds}s'
+    hours, minutes = divmod(minutes, 60)
+    return f'{hours}h {minutes}m'
@@ -0,0 +1,119 @@
+import tkinter as tk
+from tkinter import BooleanVar, StringVar, ttk
+from typing import Callable, Dict, List, Tuple
+from ror.ror_solver import AVAILABLE_AGGREGATORS, TIE_RESOLVERS
+from utils.tk.AlphaValueCountSliderFrame import DEFAULT_NUMBER_OF_ALPHA_VALUES, MAX_NUMBER_OF_ALPHA_VALUES
+from utils.tk.CustomDialog import CustomDialog
+
+# eps values, numbers of alpha values, results aggregators, tie resolvers
+ParameterSweepDialogResult = Tuple[List[float], List[int], List[str], List[str]]
+
+
+class ParameterSweepDialog(CustomDialog):
+    def __init__(
+        self,
+        root: tk.Frame,
+        header: str,
+        eps: float,
+        results_aggregator: str,
+        on_submit_callback: Callable[[ParameterSweepDialogResult], None],
+    ) -> None:
+        self.list_body: ttk.Frame = None
+        self.__eps_values: StringVar = StringVar(value=str(eps))
+        self.__numbers_of_alpha_values: StringVar = StringVar(value=str(DEFAULT_NUMBER_OF_ALPHA_VALUES))
+        self.__aggregators: Dict[str, BooleanVar] = {
+            name: BooleanVar(value=name == results_aggregator)
+            for name in AVAILABLE_AGGREGATORS
+        }
+        self.__tie_resolvers: Dict[str, BooleanVar] = {
+            name: BooleanVar(value=name == 'NoResolver')
+            for name in TIE_RESOLVERS
+        }
+        self.__validation_text: StringVar = StringVar()
+        self.__on_submit = on_submit_callback
+        super().__init__(root, header, submit_button_text='Run sweep', cancel_button_text='Cancel')
+
+    def __create_checkboxes(self, root: ttk.Frame, header: str, variables: Dict[str, BooleanVar]) -> ttk.Frame:
+        frame = ttk.Frame(root, padding=5)
+        ttk.Label(frame, text=header).pack(anchor=tk.NW)
+        for name, variable in variables.items():
+            ttk.Checkbutton(frame, text=name, variable=variable).pack(anchor=tk.NW)
+        return frame
+
+    def create_body(self, frame: tk.Frame):
+        self.list_body = ttk.Frame(frame)
+        self.list_body.pack(anchor=tk.NW, fill=tk.BOTH, expand=1)
+        self.list_body.columnconfigure(0, weight=1)
+        self.list_body.columnconfigure(1, weight=1)
+        ttk.Label(self.list_body, text='Set parameters grid for the sweep', font=('Arial', 17), foreground='black')\
+            .grid(row=0, column=0, columnspan=2, sticky=tk.EW)
+        ttk.Label(self.list_body, text='Epsilon values (separated by comma)')\
+            .grid(row=1, column=0, columnspan=2, sticky=tk.W)
+        ttk.Entry(self.list_body, textvariable=self.__eps_values)\
+            .grid(row=2, column=0, columnspan=2, sticky=tk.EW)
+        ttk.Label(self.list_body, text=f'Numbers of alpha values (separated by comma, at most {MAX_NUMBER_OF_ALPHA_VALUES})')\
+            .grid(row=3, column=0, columnspan=2, sticky=tk.W)
+        ttk.Entry(self.list_body, textvariable=self.__numbers_of_alpha_values)\
+            .grid(row=4, column=0, columnspan=2, sticky=tk.EW)
+        self.__create_checkboxes(self.list_body, 'Aggregation methods', self.__aggregators)\
+            .grid(row=5, column=0, sticky=tk.NSEW)
+        self.__create_checkboxes(self.list_body, 'Tie resolvers', self.__tie_resolvers)\
+            .grid(row=5, column=1, sticky=tk.NSEW)
+        ttk.Label(self.list_body, textvariable=self.__validation_text, foreground='red')\
+            .grid(row=6, column=0, columnspan=2)
+        return self.list_body
+
+    def __parse_values(self, text: str, value_type: type) -> List:
+        values = []
+        for item in text.split(','):
+            item = item.strip()
+            if item == '':
+                continue
+            value = value_type(item)
+            # keep the order given by the user, skip duplicates
+            if value not in values:
+                values.append(value)
+        return values
+
+    def _on_submit(self, data):
+        if self.__on_submit is not None:
+            self._close()
+            self.__on_submit(data)
+
+    def _on_cancel(self):
+        pass
+
+    def _validate(self) -> bool:
+        try:
+            eps_values = self.__parse_values(self.__eps_values.get(), float)
+        except ValueError:
+            self.__validation_text.set('Epsilon values must be float values')
+            return False
+        if len(eps_values) < 1 or any(eps < 0.0 for eps in eps_values):
+            self.__validation_text.set('Provide at least one epsilon value, epsilon value cannot be lower than 0')
+            return False
+        try:
+            numbers_of_alpha_values = self.__parse_values(self.__numbers_of_alpha_values.get(), int)
+        except ValueError:
+            self.__validation_text.set('Numbers of alpha values must be integer values')
+            return False
+        if len(numbers_of_alpha_values) < 1 or\
+                any(not 1 <= number <= MAX_NUMBER_OF_ALPHA_VALUES for number in numbers_of_alpha_values):
+            self.__validation_text.set(f'Numbers of alpha values must be in range <1, {MAX_NUMBER_OF_ALPHA_VALUES}>')
+            return False
+        if not any(variable.get() for variable in self.__aggregators.values()):
+            self.__validation_text.set('Pick at least one aggregation method')
+            return False
+        if not any(variable.get() for variable in self.__tie_resolvers.values()):
+            self.__validation_text.set('Pick at least one tie resolver')
+            return False
+        self.__validation_text.set('')
+        return True
+
+    def get_data(self) -> ParameterSweepDialogResult:
+        return (
+            self.__parse_values(self.__eps_values.get(), float),
+            self.__parse_values(self.__numbers_of_alpha_values.get(), int),
+            [name for name, variable in self.__aggregators.items() if variable.get()],
+            [name for name, variable in self.__tie_resolvers.items() if variable.get()]
+        )
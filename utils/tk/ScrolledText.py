@@ -1,23 +1,35 @@
 import tkinter as tk
 from tkinter import ttk
 from tkinter.constants import RIGHT, LEFT, Y, X, BOTH
+from typing import List, Set, Tuple
 
+from utils.Severity import Severity
 from utils.time import get_log_time
 
 WARNING = 'warning'
 ERROR = 'error'
 INFO = 'info'
 
-START_LINE = 1
+DEFAULT_MAX_LINES = 5000
+FLUSH_INTERVAL_MS = 50
+
+SEVERITY_COLORS = {
+    Severity.ERROR: 'red3',
+    Severity.WARNING: 'DarkOrange2',
+    Severity.SUCCESS: 'forest green'
+}
 
 
 class ScrolledText(tk.Text):
     '''
     ScrolledText implementation copied from the original ScrolledText.
     Added textvariable to handle binded text.
+    Keeps at most max_lines lines, the oldest lines are removed in bulk.
+    Added lines are inserted together once per FLUSH_INTERVAL_MS,
+    lines with the same color share one tag.
     '''
 
-    def __init__(self, window_object: tk.Tk, master=None, **kw):
+    def __init__(self, window_object: tk.Tk, master=None, max_lines: int = DEFAULT_MAX_LINES, **kw):
         self.frame: ttk.Frame = ttk.Frame(master)
         self.vbar: ttk.Scrollbar = ttk.Scrollbar(self.frame)
         self.button_frame: ttk.Frame = ttk.Frame(self.frame)
@@ -33,7 +45,13 @@ class ScrolledText(tk.Text):
         tk.Text.__init__(self, self.frame, **kw)
         self.pack(side=LEFT, fill=BOTH, expand=True)
         self.vbar['command'] = self.yview
-        self.__line = START_LINE
+        self.__max_lines: int = max_lines
+        # lines are removed when there are 10% more lines than allowed
+        self.__trimmed_lines: int = max(1, max_lines // 10)
+        # lines waiting to be inserted with their tags
+        self.__pending: List[Tuple[str, Tuple[str, ...]]] = []
+        self.__flush_scheduled: bool = False
+        self.__configured_tags: Set[str] = set()
 
         # Copy geometry methods of self.frame without overriding Text
         # methods -- hack!
@@ -54,17 +72,14 @@ class ScrolledText(tk.Text):
         self.add_text(f'[{get_log_time()}][LOGGER] Copied log content to clipboard!', 'SlateGray4')
 
     def clear(self):
+        self.__pending.clear()
         self.configure(state='normal')
+        # tags are shared by all lines, so they are kept for further logs
         self.delete(1.0, tk.END)
-        # remove all tags to clear formatting in further logs
-        all_tags = self.tag_names()
-        for tag in all_tags:
-            self.tag_delete(tag)
-        # reset line
-        self.__line = START_LINE
         self.configure(state='disabled')
 
     def get_text(self):
+        self.flush()
         text = self.get(1.0, tk.END)
         if text is not None and text != '':
             return text.strip()
@@ -74,20 +89,52 @@ class ScrolledText(tk.Text):
         self.clear()
         self.add_text(value, color)
 
+    def __get_tag(self, name: str, color: str) -> Tuple[str, ...]:
+        if color is None:
+            return ()
+        if name not in self.__configured_tags:
+            self.tag_configure(name, foreground=color)
+            self.__configured_tags.add(name)
+        return (name,)
+
+    def add_log(self, value: str, severity: Severity = Severity.INFO):
+        '''
+        Adds line colored according to its severity.
+        '''
+        self.__add_line(value, self.__get_tag(f'severity_{severity.value}', SEVERITY_COLORS.get(severity)))
+
     def add_text(self, value, color=None):
-        line_to_index = lambda line: f'{line}.0'
-        if value is not None:
-            self.configure(state='normal')
-            _data = f'{value.strip()}\n'
-            self.insert(line_to_index(self.__line), _data)
-            if color is not None:
-                tag_name = f'line_{self.__line}'
-                self.tag_add(tag_name, line_to_index(self.__line), line_to_index(self.__line+1))
-                self.tag_configure(tag_name, foreground=color)
-            self.__line += 1
-            self.configure(state='disabled')
-            # scroll to the end
-            self.see('end')
+        self.__add_line(value, self.__get_tag(f'color_{color}', color))
+
+    def __add_line(self, value: str, tags: Tuple[str, ...]):
+        if value is None:
+            return
+        self.__pending.append((f'{value.strip()}\n', tags))
+        if not self.__flush_scheduled:
+            self.__flush_scheduled = True
+            self.after(FLUSH_INTERVAL_MS, self.flush)
+
+    def flush(self):
+        '''
+        Inserts all pending lines at once and removes the oldest lines over the limit.
+        '''
+        self.__flush_scheduled = False
+        if len(self.__pending) == 0:
+            return
+        lines = self.__pending[-self.__max_lines:]
+        self.__pending = []
+        arguments = []
+        for line, tags in lines:
+            arguments.extend((line, tags))
+        self.configure(state='normal')
+        # text ends with an empty line, new lines are inserted before it
+        self.insert('end-1c', *arguments)
+        number_of_lines = int(self.index('end-1c').split('.')[0]) - 1
+        if number_of_lines > self.__max_lines + self.__trimmed_lines:
+            self.delete('1.0', f'{number_of_lines - self.__max_lines + 1}.0')
+        self.configure(state='disabled')
+        # scroll to the end
+        self.see('end')
 
     def __str__(self):
         return str(self.frame)